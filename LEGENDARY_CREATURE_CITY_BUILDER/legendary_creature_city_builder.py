@@ -11,19 +11,33 @@ The game "Legendary Creature City Builder" is inspired by "Dragon City"
 
 
 # Importing necessary libraries
+import argparse
+import concurrent.futures
 import socket
 import sys
 import uuid
 import pickle
 import copy
 import random
+import math
+import heapq
+import io
+import zlib
+import sqlite3
 from datetime import datetime, timedelta
 import os
-from functools import reduce
+from abc import ABC, abstractmethod
+from functools import reduce, lru_cache
 
 from mpmath import mp, mpf
 from tabulate import tabulate
 
+# NumPy is only needed to play vectorised battles
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 mp.pretty = True
 
 # Creating static variables to be used throughout the game.
@@ -42,6 +56,29 @@ ELEMENT_CHART: list = [
      "OTHER",
      "OTHER", "OTHER", "OTHER"]
 ]
+ELEMENTS: list = ["TERRA", "FLAME", "SEA", "NATURE", "ELECTRIC", "ICE", "METAL", "DARK", "LIGHT", "WAR", "PURE",
+                  "LEGEND", "PRIMAL", "WIND", "BEAUTY", "MAGIC", "CHAOS", "HAPPY", "DREAM", "SOUL"]
+ELEMENT_IDS: dict = {element: element_id for element_id, element in enumerate(ELEMENTS)}
+# The elements each attacking element deals double and half damage to, read from ELEMENT_CHART. Attacking elements
+# not in ELEMENT_CHART (e.g., "BEAUTY") deal normal damage to all elements.
+ELEMENT_MATCHUPS: dict = {ELEMENT_CHART[0][column]: tuple([element for element in ELEMENT_CHART[row][column].split("\n")
+                                                           if element in ELEMENTS] for row in [1, 2])
+                          for column in range(1, len(ELEMENT_CHART[0]))}
+# ELEMENT_MATCHUP_MATRIX[attacking element ID][defending element ID] is the damage multiplier by element.
+ELEMENT_MATCHUP_MATRIX: list = [[2.0 if defending_element in ELEMENT_MATCHUPS.get(attacking_element, ([], []))[0]
+                                 else 0.5 if defending_element in ELEMENT_MATCHUPS.get(attacking_element, ([], []))[1]
+                                 else 1.0 for defending_element in ELEMENTS] for attacking_element in ELEMENTS]
+# The numbers used for stats during battles are either arbitrary precision numbers (i.e., "mpf") or native floating
+# point numbers (i.e., "float") which are much faster to do arithmetic with. In "float" mode, numbers too large to be
+# a float are still kept as arbitrary precision numbers.
+NUMERIC_MODES: list = ["mpf", "float"]
+NUMERIC_MODE: str = "mpf"
+# Saved game data starts with these bytes followed by the version of its format
+SAVE_FILE_MAGIC: bytes = b"LCCB"
+SAVE_FILE_VERSION: int = 1
+# Messages about damage dealt during battles are not printed when battles are simulated without the command line
+# window.
+BATTLE_MESSAGES_ENABLED: bool = True
 
 
 # Creating static functions to be used in this game.
@@ -59,132 +96,134 @@ def tabulate_element_chart() -> str:
     return str(tabulate(ELEMENT_CHART, headers='firstrow', tablefmt='fancy_grid'))
 
 
-def generate_random_name() -> str:
+def generate_random_name(rng=None) -> str:
+    rng = get_random_number_generator(rng)
     res: str = ""  # initial value
-    name_length: int = random.randint(5, 20)
+    name_length: int = rng.randint(5, 20)
     for i in range(name_length):
-        res += LETTERS[random.randint(0, len(LETTERS) - 1)]
+        res += LETTERS[rng.randint(0, len(LETTERS) - 1)]
 
     return res.capitalize()
 
 
-def generate_random_legendary_creature(element):
-    # type: (str) -> LegendaryCreature
-    name: str = generate_random_name()
+def generate_random_legendary_creature(element, rng=None):
+    # type: (str, random.Random or None) -> LegendaryCreature
+    rng = get_random_number_generator(rng)
+    name: str = generate_random_name(rng)
     main_element: str = element
     rating: int = LegendaryCreature.MIN_RATING
-    max_hp: mpf = mpf(random.randint(45000, 55000))
-    max_magic_points: mpf = mpf(random.randint(45000, 55000))
-    attack_power: mpf = mpf(random.randint(8500, 9500))
-    defense: mpf = mpf(random.randint(8500, 9500))
-    attack_speed: mpf = mpf(random.randint(100, 125))
+    max_hp: mpf = mpf(rng.randint(45000, 55000))
+    max_magic_points: mpf = mpf(rng.randint(45000, 55000))
+    attack_power: mpf = mpf(rng.randint(8500, 9500))
+    defense: mpf = mpf(rng.randint(8500, 9500))
+    attack_speed: mpf = mpf(rng.randint(100, 125))
     skills: list = [
         ActiveSkill("SINGLE-TARGET ATTACK SKILL #1", "Normal Single-Target Attack Skill", "ATTACK", False,
-                    mpf("1e2") * random.randint(8, 14),
+                    mpf("1e2") * rng.randint(8, 14),
                     2, DamageMultiplier(
-                random.randint(1, 3) * mpf("0.01"),
-                random.randint(1, 3) * mpf("0.01"),
-                mpf(3 + random.random() * 2),
-                mpf(random.random()),
-                mpf(3 + random.random() * 2),
-                mpf(random.random()),
-                random.randint(1, 3) * mpf("0.01"),
-                random.randint(1, 3) * mpf("0.01"),
+                rng.randint(1, 3) * mpf("0.01"),
+                rng.randint(1, 3) * mpf("0.01"),
+                mpf(3 + rng.random() * 2),
+                mpf(rng.random()),
+                mpf(3 + rng.random() * 2),
+                mpf(rng.random()),
+                rng.randint(1, 3) * mpf("0.01"),
+                rng.randint(1, 3) * mpf("0.01"),
                 mpf("0.5"),
                 mpf("0.25"),
                 mpf("0.05"),
                 mpf("0.05"),
                 mpf("0.05")
-            ), [], [], mpf("0"), mpf("0"), mpf("0"), random.random() < 0.1, random.random() < 0.1,
-                    random.random() < 0.1),
+            ), [], [], mpf("0"), mpf("0"), mpf("0"), rng.random() < 0.1, rng.random() < 0.1,
+                    rng.random() < 0.1),
         ActiveSkill("SINGLE-TARGET ATTACK SKILL #2", "Strong Single-Target Attack Skill", "ATTACK", False,
-                    mpf("1e9") * random.randint(8, 14),
+                    mpf("1e9") * rng.randint(8, 14),
                     4, DamageMultiplier(
-                random.randint(1, 3) * mpf("0.03"),
-                random.randint(1, 3) * mpf("0.03"),
-                mpf(9 + random.random() * 6),
-                mpf(2 * random.random()),
-                mpf(9 + random.random() * 6),
-                mpf(2 * random.random()),
-                random.randint(1, 3) * mpf("0.03"),
-                random.randint(1, 3) * mpf("0.03"),
+                rng.randint(1, 3) * mpf("0.03"),
+                rng.randint(1, 3) * mpf("0.03"),
+                mpf(9 + rng.random() * 6),
+                mpf(2 * rng.random()),
+                mpf(9 + rng.random() * 6),
+                mpf(2 * rng.random()),
+                rng.randint(1, 3) * mpf("0.03"),
+                rng.randint(1, 3) * mpf("0.03"),
                 mpf("1.5"),
                 mpf("0.75"),
                 mpf("0.1"),
                 mpf("0.1"),
                 mpf("0.1")
             ), [BeneficialEffect(
-                BeneficialEffect.POSSIBLE_NAMES[random.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
+                BeneficialEffect.POSSIBLE_NAMES[rng.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
             )], [HarmfulEffect(
-                HarmfulEffect.POSSIBLE_NAMES[random.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
-            )], mpf("0.1"), mpf("0.1"), mpf("0"), random.random() < 0.3, random.random() < 0.3,
-                    random.random() < 0.3),
+                HarmfulEffect.POSSIBLE_NAMES[rng.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
+            )], mpf("0.1"), mpf("0.1"), mpf("0"), rng.random() < 0.3, rng.random() < 0.3,
+                    rng.random() < 0.3),
         ActiveSkill("SINGLE-TARGET ATTACK SKILL #3", "Ultimate Single-Target Attack Skill", "ATTACK", False,
-                    mpf("1e29") * random.randint(8, 14),
+                    mpf("1e29") * rng.randint(8, 14),
                     8, DamageMultiplier(
-                random.randint(1, 3) * mpf("0.06"),
-                random.randint(1, 3) * mpf("0.06"),
-                mpf(27 + random.random() * 10),
-                mpf(6 * random.random()),
-                mpf(27 + random.random() * 10),
-                mpf(6 * random.random()),
-                random.randint(1, 3) * mpf("0.06"),
-                random.randint(1, 3) * mpf("0.06"),
+                rng.randint(1, 3) * mpf("0.06"),
+                rng.randint(1, 3) * mpf("0.06"),
+                mpf(27 + rng.random() * 10),
+                mpf(6 * rng.random()),
+                mpf(27 + rng.random() * 10),
+                mpf(6 * rng.random()),
+                rng.randint(1, 3) * mpf("0.06"),
+                rng.randint(1, 3) * mpf("0.06"),
                 mpf("4.5"),
                 mpf("2.25"),
                 mpf("0.3"),
                 mpf("0.3"),
                 mpf("0.3")
             ), [BeneficialEffect(
-                BeneficialEffect.POSSIBLE_NAMES[random.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
+                BeneficialEffect.POSSIBLE_NAMES[rng.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
             )], [HarmfulEffect(
-                HarmfulEffect.POSSIBLE_NAMES[random.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
-            )], mpf("0.25"), mpf("0.25"), mpf("0"), random.random() < 0.5, random.random() < 0.5,
-                    random.random() < 0.5),
+                HarmfulEffect.POSSIBLE_NAMES[rng.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
+            )], mpf("0.25"), mpf("0.25"), mpf("0"), rng.random() < 0.5, rng.random() < 0.5,
+                    rng.random() < 0.5),
         ActiveSkill("MULTI-TARGET ATTACK SKILL #1", "Normal Multi-Target Attack Skill", "ATTACK", True,
-                    mpf("1e2") * random.randint(8, 14),
+                    mpf("1e2") * rng.randint(8, 14),
                     2, DamageMultiplier(
-                multiplier_to_self_attack_power=mpf("0.5") + mpf("0.1") * random.randint(2, 5)
-            ), [], [], mpf("0"), mpf("0"), mpf("0"), random.random() < 0.1, random.random() < 0.1,
-                    random.random() < 0.1),
+                multiplier_to_self_attack_power=mpf("0.5") + mpf("0.1") * rng.randint(2, 5)
+            ), [], [], mpf("0"), mpf("0"), mpf("0"), rng.random() < 0.1, rng.random() < 0.1,
+                    rng.random() < 0.1),
         ActiveSkill("MULTI-TARGET ATTACK SKILL #2", "Strong Multi-Target Attack Skill", "ATTACK", True,
-                    mpf("1e9") * random.randint(8, 14),
+                    mpf("1e9") * rng.randint(8, 14),
                     2, DamageMultiplier(
-                multiplier_to_self_attack_power=mpf("2") + mpf("0.1") * random.randint(2, 5)
+                multiplier_to_self_attack_power=mpf("2") + mpf("0.1") * rng.randint(2, 5)
             ), [BeneficialEffect(
-                BeneficialEffect.POSSIBLE_NAMES[random.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
+                BeneficialEffect.POSSIBLE_NAMES[rng.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
             )], [HarmfulEffect(
-                HarmfulEffect.POSSIBLE_NAMES[random.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
-            )], mpf("0.05"), mpf("0.05"), mpf("0"), random.random() < 0.3, random.random() < 0.3,
-                    random.random() < 0.3),
+                HarmfulEffect.POSSIBLE_NAMES[rng.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
+            )], mpf("0.05"), mpf("0.05"), mpf("0"), rng.random() < 0.3, rng.random() < 0.3,
+                    rng.random() < 0.3),
         ActiveSkill("MULTI-TARGET ATTACK SKILL #3", "Ultimate Multi-Target Attack Skill", "ATTACK", True,
-                    mpf("1e29") * random.randint(8, 14),
+                    mpf("1e29") * rng.randint(8, 14),
                     2, DamageMultiplier(
-                multiplier_to_self_attack_power=mpf("6.1") + mpf("0.1") * random.randint(2, 5),
-                multiplier_to_enemy_max_hp=mpf("0.03") * random.randint(1, 3)
+                multiplier_to_self_attack_power=mpf("6.1") + mpf("0.1") * rng.randint(2, 5),
+                multiplier_to_enemy_max_hp=mpf("0.03") * rng.randint(1, 3)
             ), [BeneficialEffect(
-                BeneficialEffect.POSSIBLE_NAMES[random.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
+                BeneficialEffect.POSSIBLE_NAMES[rng.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
             )], [HarmfulEffect(
-                HarmfulEffect.POSSIBLE_NAMES[random.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
-            )], mpf("0.15"), mpf("0.15"), mpf("0"), random.random() < 0.5, random.random() < 0.5,
-                    random.random() < 0.5),
+                HarmfulEffect.POSSIBLE_NAMES[rng.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
+            )], mpf("0.15"), mpf("0.15"), mpf("0"), rng.random() < 0.5, rng.random() < 0.5,
+                    rng.random() < 0.5),
         ActiveSkill("HEAL SKILL #1", "First Heal Skill", "HEAL", True,
-                    mpf("1e2") * random.randint(8, 14),
+                    mpf("1e2") * rng.randint(8, 14),
                     2, DamageMultiplier(), [], [],
                     mpf("0"), mpf("0"),
-                    mpf("1e2") * random.randint(18, 24),
+                    mpf("1e2") * rng.randint(18, 24),
                     False, False, False),
         ActiveSkill("HEAL SKILL #2", "Better Heal Skill", "HEAL", True,
-                    mpf("1e9") * random.randint(8, 14),
+                    mpf("1e9") * rng.randint(8, 14),
                     4, DamageMultiplier(), [], [],
                     mpf("0"), mpf("0"),
-                    mpf("1e11") * random.randint(18, 24),
+                    mpf("1e11") * rng.randint(18, 24),
                     False, False, False),
         ActiveSkill("HEAL SKILL #3", "Ultimate Heal Skill", "HEAL", True,
-                    mpf("1e29") * random.randint(8, 14),
+                    mpf("1e29") * rng.randint(8, 14),
                     8, DamageMultiplier(), [], [],
                     mpf("0"), mpf("0"),
-                    mpf("1e35") * random.randint(18, 24),
+                    mpf("1e35") * rng.randint(18, 24),
                     False, False, False),
         PassiveSkill("EXTRA TURN PASSIVE SKILL", "Increase player's extra turn change by 15%.",
                      PassiveSkillEffect(extra_turn_chance_up=mpf("0.15"))),
@@ -194,33 +233,33 @@ def generate_random_legendary_creature(element):
 
     new_skill_gained: ActiveSkill = ActiveSkill("SINGLE-TARGET ATTACK SKILL #4", "Extreme Single-Target Attack Skill",
                                                 "ATTACK", False,
-                                                mpf("1e89") * random.randint(8, 14),
+                                                mpf("1e89") * rng.randint(8, 14),
                                                 8, DamageMultiplier(
-            random.randint(1, 3) * mpf("0.15"),
-            random.randint(1, 3) * mpf("0.15"),
-            mpf(90 + random.random() * 15),
-            mpf(15 * random.random()),
-            mpf(90 + random.random() * 15),
-            mpf(15 * random.random()),
-            random.randint(1, 3) * mpf("0.15"),
-            random.randint(1, 3) * mpf("0.15"),
+            rng.randint(1, 3) * mpf("0.15"),
+            rng.randint(1, 3) * mpf("0.15"),
+            mpf(90 + rng.random() * 15),
+            mpf(15 * rng.random()),
+            mpf(90 + rng.random() * 15),
+            mpf(15 * rng.random()),
+            rng.randint(1, 3) * mpf("0.15"),
+            rng.randint(1, 3) * mpf("0.15"),
             mpf("13.5"),
             mpf("6.75"),
             mpf("0.9"),
             mpf("0.9"),
             mpf("0.9")
         ), [BeneficialEffect(
-            BeneficialEffect.POSSIBLE_NAMES[random.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
+            BeneficialEffect.POSSIBLE_NAMES[rng.randint(0, len(BeneficialEffect.POSSIBLE_NAMES) - 1)], 2
         )], [HarmfulEffect(
-            HarmfulEffect.POSSIBLE_NAMES[random.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
-        )], mpf("0.5"), mpf("0.5"), mpf("0"), random.random() < 0.9, random.random() < 0.9,
-                                                random.random() < 0.9)
-
-    awaken_bonus: AwakenBonus = AwakenBonus(mpf(random.randint(115, 135)), mpf(random.randint(115, 135)),
-                                            mpf(random.randint(115, 135)), mpf(random.randint(115, 135)),
-                                            mpf(random.randint(0, 15)),
-                                            mpf(0.01 * random.randint(0, 15)), mpf(0.01 * random.randint(0, 15)),
-                                            mpf(0.01 * random.randint(0, 15)), mpf(0.01 * random.randint(0, 15)),
+            HarmfulEffect.POSSIBLE_NAMES[rng.randint(0, len(HarmfulEffect.POSSIBLE_NAMES) - 1)], 2
+        )], mpf("0.5"), mpf("0.5"), mpf("0"), rng.random() < 0.9, rng.random() < 0.9,
+                                                rng.random() < 0.9)
+
+    awaken_bonus: AwakenBonus = AwakenBonus(mpf(rng.randint(115, 135)), mpf(rng.randint(115, 135)),
+                                            mpf(rng.randint(115, 135)), mpf(rng.randint(115, 135)),
+                                            mpf(rng.randint(0, 15)),
+                                            mpf(0.01 * rng.randint(0, 15)), mpf(0.01 * rng.randint(0, 15)),
+                                            mpf(0.01 * rng.randint(0, 15)), mpf(0.01 * rng.randint(0, 15)),
                                             new_skill_gained
                                             )
     new_legendary_creature: LegendaryCreature = LegendaryCreature(name, main_element, rating, max_hp, max_magic_points,
@@ -243,40 +282,89 @@ def mpf_product_of_list(a_list: list) -> mpf:
         y) else mpf(y) if is_number(y) and not is_number(x) else 1, a_list, 1))
 
 
-def get_elemental_damage_multiplier(element1: str, element2: str) -> mpf:
-    if element1 == "TERRA":
-        return mpf("2") if element2 in ["ELECTRIC, DARK"] else mpf("0.5") if element2 in ["METAL", "WAR"] else mpf("1")
-    elif element1 == "FLAME":
-        return mpf("2") if element2 in ["NATURE", "ICE"] else mpf("0.5") if element2 in ["SEA", "WAR"] else mpf("1")
-    elif element1 == "SEA":
-        return mpf("2") if element2 in ["FLAME", "WAR"] else mpf("0.5") if element2 in ["NATURE", "ELECTRIC"] else \
-            mpf("1")
-    elif element1 == "NATURE":
-        return mpf("2") if element2 in ["SEA", "LIGHT"] else mpf("0.5") if element2 in ["FLAME", "ICE"] else mpf("1")
-    elif element1 == "ELECTRIC":
-        return mpf("2") if element2 in ["SEA", "METAL"] else mpf("0.5") if element2 in ["TERRA", "LIGHT"] else mpf("1")
-    elif element1 == "ICE":
-        return mpf("2") if element2 in ["NATURE", "WAR"] else mpf("0.5") if element2 in ["FLAME", "METAL"] else mpf("1")
-    elif element1 == "METAL":
-        return mpf("2") if element2 in ["TERRA", "ICE"] else mpf("0.5") if element2 in ["ELECTRIC", "DARK"] else \
-            mpf("1")
-    elif element1 == "DARK":
-        return mpf("2") if element2 in ["METAL", "LIGHT"] else mpf("0.5") if element2 == "TERRA" else mpf("1")
-    elif element1 == "LIGHT":
-        return mpf("2") if element2 in ["ELECTRIC", "DARK"] else mpf("0.5") if element2 == "NATURE" else mpf("1")
-    elif element1 == "WAR":
-        return mpf("2") if element2 in ["TERRA", "FLAME"] else mpf("0.5") if element2 in ["SEA", "ICE"] else mpf("1")
-    elif element1 == "PURE":
-        return mpf("2") if element2 == "LEGEND" else mpf("0.5") if element2 == "PRIMAL" else mpf("1")
-    elif element1 == "LEGEND":
-        return mpf("2") if element2 == "PRIMAL" else mpf("0.5") if element2 == "PURE" else mpf("1")
-    elif element1 == "PRIMAL":
-        return mpf("2") if element2 == "PURE" else mpf("0.5") if element2 == "LEGEND" else mpf("1")
-    elif element1 == "WIND":
-        return mpf("2") if element2 == "WIND" else mpf("1")
-    else:
+def product_of_triangular_numbers(first: int, last: int) -> mpf:
+    # Product of triangular(n) for first <= n <= last. Long ranges are computed with rising factorials because
+    # triangular(n) = n * (n - 1) / 2.
+    if last < first:
         return mpf("1")
 
+    num_terms: int = last - first + 1
+    if num_terms <= 1000:
+        return mpf(reduce(lambda x, y: x * y, [triangular(n) for n in range(first, last + 1)], 1))
+
+    return mp.rf(first, num_terms) * mp.rf(first - 1, num_terms) / mpf("2") ** num_terms
+
+
+def set_numeric_mode(mode: str) -> bool:
+    global NUMERIC_MODE
+    if mode not in NUMERIC_MODES:
+        return False
+
+    NUMERIC_MODE = mode
+    return True
+
+
+def to_numeric(value: object) -> mpf or float:
+    if NUMERIC_MODE == "float":
+        if isinstance(value, float):
+            return value
+
+        try:
+            float_value: float = float(value)
+        except OverflowError:
+            # Integers too large for a float are kept as mpf objects
+            return mpf(value)
+
+        if float_value in [float('inf'), float('-inf')] and not mp.isinf(value):
+            return mpf(value)
+
+        return float_value
+
+    return value if isinstance(value, mpf) else mpf(value)
+
+
+def get_elemental_damage_multiplier(element1: str, element2: str) -> float:
+    if element1 not in ELEMENT_IDS or element2 not in ELEMENT_IDS:
+        return 1.0
+
+    return ELEMENT_MATCHUP_MATRIX[ELEMENT_IDS[element1]][ELEMENT_IDS[element2]]
+
+
+def get_best_elemental_damage_multipliers(attacking_element_ids: list) -> list:
+    # The damage multiplier by element against every defending element when the best attacking element is used.
+    if len(attacking_element_ids) == 0:
+        return [0.0] * len(ELEMENTS)
+
+    return [max(multipliers) for multipliers in zip(*[ELEMENT_MATCHUP_MATRIX[attacking_element_id] for
+                                                      attacking_element_id in attacking_element_ids])]
+
+
+def get_elemental_damage_multipliers_against_team(attacker, team):
+    # type: (LegendaryCreature, Team) -> list
+    best_multipliers: list = attacker.get_best_elemental_damage_multipliers()
+    return [best_multipliers[defending_element_id] for defending_element_id in team.get_main_element_ids()]
+
+
+def get_random_number_generator(rng=None):
+    # type: (random.Random or None) -> random.Random
+    """
+    Getting the random number generator to use. If no random number generator is given, the global one is used.
+    :return: a random number generator
+    """
+
+    return random if rng is None else rng
+
+
+def derive_random_number_generator(rng):
+    # type: (random.Random) -> random.Random
+    """
+    Getting a new random number generator seeded by another one, so that random number generators derived from the
+    same seed draw the same numbers without sharing their states.
+    :return: a random number generator
+    """
+
+    return random.Random(rng.getrandbits(64))
+
 
 def resistance_accuracy_rule(accuracy: mpf, resistance: mpf) -> mpf:
     if resistance - accuracy <= mpf("0.15"):
@@ -285,14 +373,69 @@ def resistance_accuracy_rule(accuracy: mpf, resistance: mpf) -> mpf:
         return resistance - accuracy
 
 
+def get_game_catalogues():
+    # type: () -> dict
+    """
+    Getting the catalogues created by the game when it starts, which are not written to saved game data.
+    :return: a dictionary mapping the ID of every catalogue to the catalogue
+    """
+
+    return {"ITEM SHOP": item_shop, "ITEMS": items, "BUILDING SHOP": building_shop, "MINIGAMES": minigames}
+
+
+def serialise_game_data(game_data):
+    # type: (Game) -> bytes
+    buffer: io.BytesIO = io.BytesIO()
+    GameDataPickler(buffer, get_game_catalogues()).dump(game_data)
+    return SAVE_FILE_MAGIC + SAVE_FILE_VERSION.to_bytes(2, "big") + zlib.compress(buffer.getvalue())
+
+
+def deserialise_game_data(data):
+    # type: (bytes) -> Game
+    if not data.startswith(SAVE_FILE_MAGIC):
+        # Saved game data written before the current format is a pickle of the whole game, including copies of the
+        # catalogues which are replaced by the catalogues created by the game.
+        game_data: Game = pickle.loads(data)
+        game_data.item_shop = item_shop
+        game_data.building_shop = building_shop
+        game_data._Game__minigames = minigames
+        return game_data
+
+    version: int = int.from_bytes(data[len(SAVE_FILE_MAGIC):len(SAVE_FILE_MAGIC) + 2], "big")
+    if version > SAVE_FILE_VERSION:
+        raise ValueError("Saved game data version " + str(version) + " is newer than the game!")
+
+    return GameDataUnpickler(io.BytesIO(zlib.decompress(data[len(SAVE_FILE_MAGIC) + 2:])),
+                             get_game_catalogues()).load()
+
+
+def get_hidden_file_name(file_name, extension):
+    # type: (str, str) -> str
+    return os.path.join(os.path.dirname(file_name), "." + os.path.basename(file_name) + extension)
+
+
+def write_file_atomically(file_name, data):
+    # type: (str, bytes) -> None
+    # The data is written to a temporary file which then replaces the file, so a crash while writing never leaves a
+    # partially written file behind.
+    temporary_file_name: str = get_hidden_file_name(file_name, ".tmp")
+    with open(temporary_file_name, "wb") as temporary_file:
+        temporary_file.write(data)
+        temporary_file.flush()
+        os.fsync(temporary_file.fileno())
+
+    os.replace(temporary_file_name, file_name)
+
+
 def load_game_data(file_name):
     # type: (str) -> Game
-    return pickle.load(open(file_name, "rb"))
+    with open(file_name, "rb") as save_file:
+        return deserialise_game_data(save_file.read())
 
 
 def save_game_data(game_data, file_name):
     # type: (Game, str) -> None
-    pickle.dump(game_data, open(file_name, "wb"))
+    write_file_atomically(file_name, serialise_game_data(game_data))
 
 
 def clear():
@@ -303,9 +446,340 @@ def clear():
         os.system('clear')  # For Linux System
 
 
+def choose_from_listing(listing, prompt):
+    # type: (Listing, str) -> int
+    """
+    Asking the player to choose an object in a listing whose current page has been shown. Instead of an index, the
+    player can enter a command (e.g. 'NEXT' or 'FILTER SET ENERGY') to show another page of the listing.
+    :return: the index of the chosen object in the list of all objects in the listing (starting from 1)
+    """
+    print(Listing.COMMANDS_HELP)
+    answer = input(prompt + " (1 - " + str(listing.get_number_of_objects()) + "): ")
+    while True:
+        if listing.run_command(answer):
+            print(listing.render_page())
+            print(Listing.COMMANDS_HELP)
+            answer = input(prompt + " (1 - " + str(listing.get_number_of_objects()) + "): ")
+            continue
+
+        try:
+            index: int = int(answer)
+        except ValueError:
+            index = 0
+
+        if 1 <= index <= listing.get_number_of_objects():
+            return index
+
+        answer = input("Sorry, invalid input! " + prompt + " (1 - " + str(listing.get_number_of_objects()) + "): ")
+
+
+@lru_cache(maxsize=None)
+def get_slot_names(object_class):
+    # type: (type) -> tuple
+    """
+    Getting the names of the slots of a class and its base classes as they are stored, i.e., with the names of
+    private attributes mangled.
+    :return: a tuple of names of slots
+    """
+
+    slot_names: list = []  # initial value
+    for curr_class in reversed(object_class.__mro__):
+        slots: tuple or str = curr_class.__dict__.get("__slots__", ())
+        for slot in [slots] if isinstance(slots, str) else slots:
+            if slot.startswith("__") and not slot.endswith("__"):
+                slot = "_" + curr_class.__name__.lstrip("_") + slot
+
+            if slot not in ["__dict__", "__weakref__"]:
+                slot_names.append(slot)
+
+    return tuple(slot_names)
+
+
+def get_object_state(obj):
+    # type: (object) -> dict
+    # Works for objects with slots, objects with a dictionary of attributes and objects with both
+    state: dict = dict(obj.__dict__) if hasattr(obj, "__dict__") else {}
+    for slot_name in get_slot_names(type(obj)):
+        if hasattr(obj, slot_name):
+            state[slot_name] = getattr(obj, slot_name)
+
+    return state
+
+
+def set_object_state(obj, state):
+    # type: (object, dict or tuple) -> None
+    # Objects with slots pickled without __getstate__() have their state split into a dictionary and slots
+    if isinstance(state, tuple):
+        state = dict(state[0] or {}, **(state[1] or {}))
+
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
+def render_object(obj, attributes, summary=False):
+    # type: (object, dict, bool) -> str
+    """
+    Getting the string representation of an object from its attributes. In summary mode, only the values of simple
+    attributes (e.g. numbers and strings) are written in full, and other attributes are written as their lengths or
+    the names of their types.
+    """
+    return str(type(obj).__name__) + "(" + ", ".join(
+        str(name) + "=" + (summarise_value(value) if summary else str(value)) for name, value in attributes.items()) + \
+        ")"
+
+
+def summarise_value(value):
+    # type: (object) -> str
+    if value is None or isinstance(value, (str, int, float, mpf, BigValue, datetime, timedelta)):
+        return str(value)
+    elif isinstance(value, (list, tuple, dict, set)):
+        return str(type(value).__name__) + " of " + str(len(value))
+    elif isinstance(getattr(value, "name", None), str):
+        return str(type(value).__name__) + "(name=" + str(value.name) + ")"
+    return str(type(value).__name__)
+
+
+def summarise(obj):
+    # type: (object) -> str
+    """
+    Getting a summary of an object, which takes about the same time however many objects it contains.
+    :return: the string representation of the object in summary mode
+    """
+    state: object = obj.__getstate__() if hasattr(obj, "__getstate__") else None
+    return render_object(obj, state if isinstance(state, dict) else get_object_state(obj), summary=True)
+
+
 # Creating necessary classes to be used throughout the game.
 
 
+class BigValue:
+    """
+    This class contains attributes of a number which can be too large to be a float, such as the gold, gems and EXP
+    of players and the EXP of legendary creatures. The number is stored as mantissa * 2 ** exponent where the mantissa
+    is a float (0 or between 0.5 and 1 for positive numbers) and the exponent is an integer, so arithmetic on it does
+    not go through mpmath.
+    """
+
+    __slots__ = ("mantissa", "exponent")
+
+    # Numbers whose exponents differ by more than this do not change each other when added together. As with floats,
+    # adding a number too small for the 53 bits of precision of the mantissa leaves a big value unchanged, so the
+    # gold and gems which players gain over time keep the parts too small to be added (see Player.gain_resources()).
+    MAX_EXPONENT_DIFFERENCE: int = 64
+
+    def __init__(self, value=0.0, exponent=0):
+        # type: (BigValue or mpf or float or int or str, int) -> None
+        if isinstance(value, BigValue):
+            mantissa, value_exponent = value.mantissa, value.exponent
+        elif isinstance(value, float):
+            mantissa, value_exponent = math.frexp(value)
+        elif isinstance(value, int):
+            mantissa, value_exponent = BigValue.__frexp_int(value)
+        else:
+            if not isinstance(value, mpf):
+                value = mpf(value)
+
+            sign, man, man_exponent, bit_count = value._mpf_
+            if man == 0:
+                # Zero, infinity or NaN
+                mantissa, value_exponent = float(value), 0
+            else:
+                mantissa, value_exponent = BigValue.__frexp_int(-int(man) if sign else int(man))
+                value_exponent += man_exponent
+
+        self.mantissa: float = mantissa
+        self.exponent: int = value_exponent + exponent if mantissa != 0 else 0
+
+    @staticmethod
+    def __frexp_int(value):
+        # type: (int) -> tuple
+        bit_length: int = value.bit_length()
+        if bit_length <= 1000:
+            return math.frexp(value)
+
+        mantissa, exponent = math.frexp(value >> (bit_length - 64))
+        return mantissa, exponent + bit_length - 64
+
+    @staticmethod
+    def __from_parts(mantissa, exponent):
+        # type: (float, int) -> BigValue
+        # Creates a normalised big value without going through __init__().
+        result: BigValue = BigValue.__new__(BigValue)
+        result.mantissa, normalised_exponent = math.frexp(mantissa)
+        result.exponent = exponent + normalised_exponent if mantissa != 0 else 0
+        return result
+
+    @staticmethod
+    def to_big_value(value):
+        # type: (BigValue or mpf or float or int or str) -> BigValue
+        return value if isinstance(value, BigValue) else BigValue(value)
+
+    def to_mpf(self):
+        # type: () -> mpf
+        return mp.ldexp(mpf(self.mantissa), self.exponent)
+
+    def __add__(self, other):
+        # type: (BigValue or mpf or float or int) -> BigValue
+        other = BigValue.to_big_value(other)
+        if other.mantissa == 0:
+            return self
+        if self.mantissa == 0:
+            return other
+
+        exponent_difference: int = other.exponent - self.exponent
+        if exponent_difference > self.MAX_EXPONENT_DIFFERENCE:
+            return other
+        if exponent_difference < -self.MAX_EXPONENT_DIFFERENCE:
+            return self
+        if exponent_difference >= 0:
+            return BigValue.__from_parts(math.ldexp(self.mantissa, -exponent_difference) + other.mantissa,
+                                         other.exponent)
+
+        return BigValue.__from_parts(self.mantissa + math.ldexp(other.mantissa, exponent_difference), self.exponent)
+
+    def __radd__(self, other):
+        # type: (mpf or float or int) -> BigValue
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        # type: (BigValue or mpf or float or int) -> BigValue
+        return self.__add__(-BigValue.to_big_value(other))
+
+    def __rsub__(self, other):
+        # type: (mpf or float or int) -> BigValue
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        # type: (BigValue or mpf or float or int) -> BigValue
+        if isinstance(other, float) or (isinstance(other, int) and other.bit_length() <= 53):
+            return BigValue.__from_parts(self.mantissa * other, self.exponent)
+
+        other = BigValue.to_big_value(other)
+        return BigValue.__from_parts(self.mantissa * other.mantissa, self.exponent + other.exponent)
+
+    def __rmul__(self, other):
+        # type: (mpf or float or int) -> BigValue
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        # type: (BigValue or mpf or float or int) -> BigValue
+        other = BigValue.to_big_value(other)
+        if other.mantissa == 0:
+            raise ZeroDivisionError("division by zero")
+
+        return BigValue.__from_parts(self.mantissa / other.mantissa, self.exponent - other.exponent)
+
+    def __rtruediv__(self, other):
+        # type: (mpf or float or int) -> BigValue
+        return BigValue.to_big_value(other).__truediv__(self)
+
+    def __pow__(self, power):
+        # type: (int) -> BigValue
+        # Exponentiation by squaring, so that huge powers (e.g., 10 ** level) only take a few multiplications.
+        if power < 0:
+            return BigValue(1.0) / self.__pow__(-power)
+
+        result: BigValue = BigValue(1.0)
+        base: BigValue = self
+        while power > 0:
+            if power & 1:
+                result = result.__mul__(base)
+
+            power >>= 1
+            if power > 0:
+                base = base.__mul__(base)
+
+        return result
+
+    def __neg__(self):
+        # type: () -> BigValue
+        return BigValue.__from_parts(-self.mantissa, self.exponent)
+
+    def __pos__(self):
+        # type: () -> BigValue
+        return self
+
+    def __abs__(self):
+        # type: () -> BigValue
+        return BigValue.__from_parts(abs(self.mantissa), self.exponent)
+
+    def __bool__(self):
+        # type: () -> bool
+        return self.mantissa != 0
+
+    def __compare(self, other):
+        # type: (BigValue or mpf or float or int) -> float
+        return self.__sub__(other).mantissa
+
+    def __eq__(self, other):
+        # type: (object) -> bool
+        if not isinstance(other, (BigValue, mpf, float, int)):
+            return NotImplemented
+
+        return self.__compare(other) == 0
+
+    def __ne__(self, other):
+        # type: (object) -> bool
+        if not isinstance(other, (BigValue, mpf, float, int)):
+            return NotImplemented
+
+        return self.__compare(other) != 0
+
+    def __lt__(self, other):
+        # type: (BigValue or mpf or float or int) -> bool
+        return self.__compare(other) < 0
+
+    def __le__(self, other):
+        # type: (BigValue or mpf or float or int) -> bool
+        return self.__compare(other) <= 0
+
+    def __gt__(self, other):
+        # type: (BigValue or mpf or float or int) -> bool
+        return self.__compare(other) > 0
+
+    def __ge__(self, other):
+        # type: (BigValue or mpf or float or int) -> bool
+        return self.__compare(other) >= 0
+
+    def __hash__(self):
+        # type: () -> int
+        return hash(float(self)) if self.exponent <= 1024 else hash((self.mantissa, self.exponent))
+
+    def __float__(self):
+        # type: () -> float
+        if self.exponent > 1024:
+            return math.copysign(float('inf'), self.mantissa)
+
+        return math.ldexp(self.mantissa, self.exponent)
+
+    def __int__(self):
+        # type: () -> int
+        if self.exponent <= 53:
+            return int(float(self))
+
+        return int(math.ldexp(self.mantissa, 53)) << (self.exponent - 53)
+
+    def __round__(self, ndigits=None):
+        # type: (int or None) -> float or int
+        return round(float(self), ndigits)
+
+    def __reduce__(self):
+        # type: () -> tuple
+        return BigValue, (self.mantissa, self.exponent)
+
+    def __str__(self):
+        # type: () -> str
+        return str(self.to_mpf())
+
+    def __repr__(self):
+        # type: () -> str
+        return str(self)
+
+    def clone(self):
+        # type: () -> BigValue
+        return copy.deepcopy(self)
+
+
 class Minigame:
     """
     This class contains attributes of a minigame in this game.
@@ -328,17 +802,7 @@ class Minigame:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def clone(self):
         # type: () -> Minigame
@@ -358,8 +822,9 @@ class BoxEatsPlantsBoard:
     BOARD_WIDTH: int = 10
     BOARD_HEIGHT: int = 10
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, rng=None):
+        # type: (random.Random or None) -> None
+        self.rng: random.Random or None = rng
         self.__tiles: list = []  # initial value
         for i in range(self.BOARD_HEIGHT):
             new: list = []  # initial value
@@ -403,12 +868,13 @@ class BoxEatsPlantsBoard:
 
     def spawn_plant(self):
         # type: () -> Plant
-        plant_x: int = random.randint(0, self.BOARD_WIDTH - 1)
-        plant_y: int = random.randint(0, self.BOARD_HEIGHT - 1)
+        rng = get_random_number_generator(self.rng)
+        plant_x: int = rng.randint(0, self.BOARD_WIDTH - 1)
+        plant_y: int = rng.randint(0, self.BOARD_HEIGHT - 1)
         plant_tile: BoxEatsPlantsTile = self.__tiles[plant_y][plant_x]
         while plant_tile.plant is not None:
-            plant_x = random.randint(0, self.BOARD_WIDTH - 1)
-            plant_y = random.randint(0, self.BOARD_HEIGHT - 1)
+            plant_x = rng.randint(0, self.BOARD_WIDTH - 1)
+            plant_y = rng.randint(0, self.BOARD_HEIGHT - 1)
             plant_tile = self.__tiles[plant_y][plant_x]
 
         plant: Plant = Plant(plant_x, plant_y)
@@ -417,12 +883,13 @@ class BoxEatsPlantsBoard:
 
     def spawn_rock(self):
         # type: () -> Rock
-        rock_x: int = random.randint(0, self.BOARD_WIDTH - 1)
-        rock_y: int = random.randint(0, self.BOARD_HEIGHT - 1)
+        rng = get_random_number_generator(self.rng)
+        rock_x: int = rng.randint(0, self.BOARD_WIDTH - 1)
+        rock_y: int = rng.randint(0, self.BOARD_HEIGHT - 1)
         rock_tile: BoxEatsPlantsTile = self.__tiles[rock_y][rock_x]
         while rock_tile.rock is not None:
-            rock_x = random.randint(0, self.BOARD_WIDTH - 1)
-            rock_y = random.randint(0, self.BOARD_HEIGHT - 1)
+            rock_x = rng.randint(0, self.BOARD_WIDTH - 1)
+            rock_y = rng.randint(0, self.BOARD_HEIGHT - 1)
             rock_tile = self.__tiles[rock_y][rock_x]
 
         rock: Rock = Rock(rock_x, rock_y)
@@ -431,12 +898,13 @@ class BoxEatsPlantsBoard:
 
     def spawn_box(self):
         # type: () -> Box
-        box_x: int = random.randint(0, self.BOARD_WIDTH - 1)
-        box_y: int = random.randint(0, self.BOARD_HEIGHT - 1)
+        rng = get_random_number_generator(self.rng)
+        box_x: int = rng.randint(0, self.BOARD_WIDTH - 1)
+        box_y: int = rng.randint(0, self.BOARD_HEIGHT - 1)
         box_tile: BoxEatsPlantsTile = self.__tiles[box_y][box_x]
         while box_tile.plant is not None or box_tile.rock is not None:
-            box_x = random.randint(0, self.BOARD_WIDTH - 1)
-            box_y = random.randint(0, self.BOARD_HEIGHT - 1)
+            box_x = rng.randint(0, self.BOARD_WIDTH - 1)
+            box_y = rng.randint(0, self.BOARD_HEIGHT - 1)
             box_tile = self.__tiles[box_y][box_x]
         box: Box = Box(box_x, box_y)
         box_tile.add_box(box)
@@ -658,12 +1126,22 @@ class BoxEatsPlantsTile:
     This class contains attributes of a tile in the minigame "Box Eats Plants".
     """
 
+    __slots__ = ("box", "plant", "rock")
+
     def __init__(self):
         # type: () -> None
         self.box: Box or None = None
         self.plant: Plant or None = None
         self.rock: Rock or None = None
 
+    def __getstate__(self):
+        # type: () -> dict
+        return get_object_state(self)
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        set_object_state(self, state)
+
     def add_box(self, box):
         # type: (Box) -> bool
         if self.box is None:
@@ -750,26 +1228,27 @@ class MatchWordPuzzleBoard:
     BOARD_WIDTH: int = 6
     BOARD_HEIGHT: int = 4
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, rng=None):
+        # type: (random.Random or None) -> None
+        rng = get_random_number_generator(rng)
         self.__tiles: list = []  # initial value
         chosen_keywords: list = []  # initial value
         chosen_keywords_tally: list = [0] * 12
         for i in range(12):
-            curr_keyword: str = MatchWordPuzzleTile.POSSIBLE_KEYWORDS[random.randint(0,
-                                                                                     len(MatchWordPuzzleTile.POSSIBLE_KEYWORDS) - 1)]
+            curr_keyword: str = MatchWordPuzzleTile.POSSIBLE_KEYWORDS[rng.randint(0,
+                                                                                  len(MatchWordPuzzleTile.POSSIBLE_KEYWORDS) - 1)]
             while curr_keyword in chosen_keywords:
-                curr_keyword = MatchWordPuzzleTile.POSSIBLE_KEYWORDS[random.randint(0,
-                                                                                    len(MatchWordPuzzleTile.POSSIBLE_KEYWORDS) - 1)]
+                curr_keyword = MatchWordPuzzleTile.POSSIBLE_KEYWORDS[rng.randint(0,
+                                                                                 len(MatchWordPuzzleTile.POSSIBLE_KEYWORDS) - 1)]
 
             chosen_keywords.append(curr_keyword)
 
         for i in range(self.BOARD_HEIGHT):
             new: list = []  # initial value
             for j in range(self.BOARD_WIDTH):
-                curr_keyword: str = chosen_keywords[random.randint(0, len(chosen_keywords) - 1)]
+                curr_keyword: str = chosen_keywords[rng.randint(0, len(chosen_keywords) - 1)]
                 while chosen_keywords_tally[get_index_of_element(chosen_keywords, curr_keyword)] >= 2:
-                    curr_keyword = chosen_keywords[random.randint(0, len(chosen_keywords) - 1)]
+                    curr_keyword = chosen_keywords[rng.randint(0, len(chosen_keywords) - 1)]
 
                 new.append(MatchWordPuzzleTile(curr_keyword))
                 chosen_keywords_tally[get_index_of_element(chosen_keywords, curr_keyword)] += 1
@@ -860,18 +1339,20 @@ class MatchThreeBoard:
     BOARD_WIDTH: int = 10
     BOARD_HEIGHT: int = 10
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, rng=None):
+        # type: (random.Random or None) -> None
+        self.rng: random.Random or None = rng
+        rng = get_random_number_generator(rng)
         self.__tiles: list = [["AND"] * self.BOARD_WIDTH for k in range(self.BOARD_HEIGHT)]  # initial value
         for i in range(self.BOARD_HEIGHT):
             new: list = []  # initial value
             for j in range(self.BOARD_WIDTH):
-                curr_keyword: str = MatchThreeTile.POSSIBLE_KEYWORDS[random.randint(0,
-                                                                                    len(MatchThreeTile.POSSIBLE_KEYWORDS) - 1)]
+                curr_keyword: str = MatchThreeTile.POSSIBLE_KEYWORDS[rng.randint(0,
+                                                                                 len(MatchThreeTile.POSSIBLE_KEYWORDS) - 1)]
                 while (i > 0 and self.__tiles[i][j].contents == self.__tiles[i - 1][j].contents) or \
                         (j > 0 and self.__tiles[i][j].contents == self.__tiles[i][j - 1].contents):
-                    curr_keyword = MatchThreeTile.POSSIBLE_KEYWORDS[random.randint(0,
-                                                                                   len(MatchThreeTile.POSSIBLE_KEYWORDS) - 1)]
+                    curr_keyword = MatchThreeTile.POSSIBLE_KEYWORDS[rng.randint(0,
+                                                                                len(MatchThreeTile.POSSIBLE_KEYWORDS) - 1)]
 
                 new.append(MatchThreeTile(curr_keyword))
 
@@ -953,21 +1434,22 @@ class MatchThreeBoard:
 
     def fill_board(self):
         # type: () -> None
+        rng = get_random_number_generator(self.rng)
         for j in range(self.BOARD_WIDTH):
             for i in range(self.BOARD_HEIGHT):
                 if self.__tiles[i][j].contents == "NONE":
                     for row in range(i, 0, -1):
                         self.__tiles[row][j].contents = self.__tiles[row - 1][j].contents
-                    self.__tiles[0][j].contents = MatchThreeTile.POSSIBLE_KEYWORDS[random.randint(0,
-                                                                                                  len(MatchThreeTile.POSSIBLE_KEYWORDS) - 1)]
+                    self.__tiles[0][j].contents = MatchThreeTile.POSSIBLE_KEYWORDS[rng.randint(0,
+                                                                                               len(MatchThreeTile.POSSIBLE_KEYWORDS) - 1)]
                     while self.__tiles[0][j].contents == self.__tiles[1][j].contents or (j > 0 and
                                                                                          self.__tiles[0][j].contents ==
                                                                                          self.__tiles[0][
                                                                                              j - 1].contents) or \
                             (j < self.BOARD_WIDTH - 1 and self.__tiles[0][j].contents == self.__tiles[0][
                                 j + 1].contents):
-                        self.__tiles[0][j].contents = MatchThreeTile.POSSIBLE_KEYWORDS[random.randint(0,
-                                                                                                      len(MatchThreeTile.POSSIBLE_KEYWORDS) - 1)]
+                        self.__tiles[0][j].contents = MatchThreeTile.POSSIBLE_KEYWORDS[rng.randint(0,
+                                                                                                   len(MatchThreeTile.POSSIBLE_KEYWORDS) - 1)]
 
     def get_tile_at(self, x, y):
         # type: (int, int) -> MatchThreeTile or None
@@ -993,6 +1475,8 @@ class MatchThreeTile:
     This class contains attributes of a tile in the minigame "Match-3 Game".
     """
 
+    __slots__ = ("contents",)
+
     POSSIBLE_KEYWORDS: list = ["AND", "AS", "ASSERT", "BREAK", "CLASS", "CONTINUE", "DEF", "DEL", "ELIF", "ELSE",
                                "EXCEPT", "FALSE", "FINALLY", "FOR", "FROM", "GLOBAL"]
 
@@ -1000,6 +1484,14 @@ class MatchThreeTile:
         # type: (str) -> None
         self.contents: str = contents if contents in self.POSSIBLE_KEYWORDS else "NONE"
 
+    def __getstate__(self):
+        # type: () -> dict
+        return get_object_state(self)
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        set_object_state(self, state)
+
     def __str__(self):
         # type: () -> str
         return str(self.contents)
@@ -1027,20 +1519,11 @@ class Action:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
-    def execute(self, user, target, skill_to_use=None):
-        # type: (LegendaryCreature, LegendaryCreature, Skill or None) -> bool
+    def execute(self, user, target, skill_to_use=None, rng=None):
+        # type: (LegendaryCreature, LegendaryCreature, Skill or None, random.Random or None) -> bool
+        rng = get_random_number_generator(rng)
         if self.name == "NORMAL ATTACK":
             if user == target:
                 return False
@@ -1048,10 +1531,11 @@ class Action:
             raw_damage: mpf = user.attack_power * (1 + user.attack_power_percentage_up / 100 -
                                                    user.attack_power_percentage_down / 100) * \
                               (1 + target.defense_percentage_up / 100 - target.defense_percentage_down / 100)
-            damage_reduction_factor: mpf = mpf("1e8") / (mpf("1e8") + 3.5 * target.defense)
+            damage_reduction_factor: mpf = 1e8 / (1e8 + 3.5 * target.defense)
             damage: mpf = raw_damage * damage_reduction_factor
             target.curr_hp -= damage
-            print(str(user.name) + " dealt " + str(damage) + " damage on " + str(target.name) + "!")
+            if BATTLE_MESSAGES_ENABLED:
+                print(str(user.name) + " dealt " + str(damage) + " damage on " + str(target.name) + "!")
             return True
 
         elif self.name == "NORMAL HEAL":
@@ -1077,37 +1561,39 @@ class Action:
                             damage: mpf = skill_to_use.damage_multiplier.calculate_raw_damage(user, enemy,
                                                                                               skill_to_use.does_ignore_enemies_defense,
                                                                                               skill_to_use.does_ignore_shield,
-                                                                                              skill_to_use.does_ignore_invincibility)
+                                                                                              skill_to_use.does_ignore_invincibility, rng)
                             enemy.curr_hp -= damage
-                            print(str(user.name) + " dealt " + str(damage) + " damage on " + str(enemy.name) + "!")
+                            if BATTLE_MESSAGES_ENABLED:
+                                print(str(user.name) + " dealt " + str(damage) + " damage on " + str(enemy.name) + "!")
 
                             # Considering life drain
                             life_drain: mpf = damage * (user.life_drain_percentage + user.life_drain_percentage_up) \
                                               / 100
                             user.curr_hp += life_drain
-                            print(str(user.name) + " drained " + str(life_drain) + " HP!")
+                            if BATTLE_MESSAGES_ENABLED:
+                                print(str(user.name) + " drained " + str(life_drain) + " HP!")
                             if user.curr_hp >= user.max_hp:
                                 user.curr_hp = user.max_hp
 
                             # Taking into account "ENDURE" effect
                             if not enemy.can_die:
-                                enemy.curr_hp = mpf("1")
+                                enemy.curr_hp = to_numeric(1)
 
                             if enemy.can_receive_harmful_effect:
                                 # Add negative effects to the enemy
                                 resist_chance: mpf = resistance_accuracy_rule(user.accuracy + user.accuracy_up,
                                                                               enemy.resistance + enemy.resistance_up)
                                 for harmful_effect in skill_to_use.get_harmful_effects_to_enemies():
-                                    if random.random() >= resist_chance:
+                                    if rng.random() >= resist_chance:
                                         enemy.add_harmful_effect(harmful_effect)
 
-                                if random.random() >= resist_chance:
-                                    enemy.attack_gauge -= skill_to_use.enemies_attack_gauge_down
+                                if rng.random() >= resist_chance:
+                                    enemy.attack_gauge -= to_numeric(skill_to_use.enemies_attack_gauge_down)
                                     if enemy.attack_gauge <= enemy.MIN_ATTACK_GAUGE:
-                                        enemy.attack_gauge = enemy.MIN_ATTACK_GAUGE
+                                        enemy.attack_gauge = to_numeric(enemy.MIN_ATTACK_GAUGE)
 
                             # Resetting user's attack gauge to zero at first
-                            user.attack_gauge = user.MIN_ATTACK_GAUGE
+                            user.attack_gauge = to_numeric(user.MIN_ATTACK_GAUGE)
 
                             # Consider effect of passive skills of the user
                             # 1. Beneficial effects to allies
@@ -1129,14 +1615,15 @@ class Action:
                                         for harmful_effect in \
                                                 skill.passive_skill_effect.get_harmful_effects_to_enemies():
                                             # Add negative effects to the enemy
-                                            if random.random() >= resist_chance:
+                                            if rng.random() >= resist_chance:
                                                 enemy.add_harmful_effect(harmful_effect)
 
                             # 3. Increase allies' attack gauge
                             for legendary_creature in user.corresponding_team.get_legendary_creatures():
                                 for skill in user.get_skills():
                                     if isinstance(skill, PassiveSkill):
-                                        legendary_creature.attack_gauge += skill.passive_skill_effect.allies_attack_gauge_up
+                                        legendary_creature.attack_gauge += \
+                                            to_numeric(skill.passive_skill_effect.allies_attack_gauge_up)
 
                             # 4. Decrease enemies' attack gauge
                             if enemy.can_receive_harmful_effect:
@@ -1145,52 +1632,56 @@ class Action:
                                         resist_chance = resistance_accuracy_rule(
                                             user.accuracy + user.accuracy_up,
                                             enemy.resistance + enemy.resistance_up)
-                                        if random.random() >= resist_chance:
-                                            enemy.attack_gauge -= skill.passive_skill_effect.enemies_attack_gauge_down
+                                        if rng.random() >= resist_chance:
+                                            enemy.attack_gauge -= \
+                                                to_numeric(skill.passive_skill_effect.enemies_attack_gauge_down)
 
                             # 5. Heal allies
                             for legendary_creature in user.corresponding_team.get_legendary_creatures():
                                 if legendary_creature.can_be_healed:
                                     for skill in user.get_skills():
                                         if isinstance(skill, PassiveSkill):
-                                            legendary_creature.curr_hp += skill.passive_skill_effect.heal_amount_to_allies
+                                            legendary_creature.curr_hp += \
+                                                to_numeric(skill.passive_skill_effect.heal_amount_to_allies)
                                             if legendary_creature.curr_hp >= legendary_creature.max_hp:
                                                 legendary_creature.curr_hp = legendary_creature.max_hp
                     else:
                         damage: mpf = skill_to_use.damage_multiplier.calculate_raw_damage(user, target,
                                                                                           skill_to_use.does_ignore_enemies_defense,
                                                                                           skill_to_use.does_ignore_shield,
-                                                                                          skill_to_use.does_ignore_invincibility)
+                                                                                          skill_to_use.does_ignore_invincibility, rng)
                         target.curr_hp -= damage
-                        print(str(user.name) + " dealt " + str(damage) + " damage on " + str(target.name) + "!")
+                        if BATTLE_MESSAGES_ENABLED:
+                            print(str(user.name) + " dealt " + str(damage) + " damage on " + str(target.name) + "!")
 
                         # Considering life drain
                         life_drain: mpf = damage * (user.life_drain_percentage + user.life_drain_percentage_up) \
                                           / 100
                         user.curr_hp += life_drain
-                        print(str(user.name) + " drained " + str(life_drain) + " HP!")
+                        if BATTLE_MESSAGES_ENABLED:
+                            print(str(user.name) + " drained " + str(life_drain) + " HP!")
                         if user.curr_hp >= user.max_hp:
                             user.curr_hp = user.max_hp
 
                         # Taking into account "ENDURE" effect
                         if not target.can_die:
-                            target.curr_hp = mpf("1")
+                            target.curr_hp = to_numeric(1)
 
                         if target.can_receive_harmful_effect:
                             # Add negative effects to the enemy
                             resist_chance: mpf = resistance_accuracy_rule(user.accuracy + user.accuracy_up,
                                                                           target.resistance + target.resistance_up)
                             for harmful_effect in skill_to_use.get_harmful_effects_to_enemies():
-                                if random.random() >= resist_chance:
+                                if rng.random() >= resist_chance:
                                     target.add_harmful_effect(harmful_effect)
 
-                            if random.random() >= resist_chance:
-                                target.attack_gauge -= skill_to_use.enemies_attack_gauge_down
+                            if rng.random() >= resist_chance:
+                                target.attack_gauge -= to_numeric(skill_to_use.enemies_attack_gauge_down)
                                 if target.attack_gauge <= target.MIN_ATTACK_GAUGE:
-                                    target.attack_gauge = target.MIN_ATTACK_GAUGE
+                                    target.attack_gauge = to_numeric(target.MIN_ATTACK_GAUGE)
 
                         # Resetting user's attack gauge to zero at first
-                        user.attack_gauge = user.MIN_ATTACK_GAUGE
+                        user.attack_gauge = to_numeric(user.MIN_ATTACK_GAUGE)
 
                         # Consider effect of passive skills of the user
                         # 1. Beneficial effects to allies
@@ -1211,14 +1702,15 @@ class Action:
                                     for harmful_effect in \
                                             skill.passive_skill_effect.get_harmful_effects_to_enemies():
                                         # Add negative effects to the enemy
-                                        if random.random() >= resist_chance:
+                                        if rng.random() >= resist_chance:
                                             target.add_harmful_effect(harmful_effect)
 
                         # 3. Increase allies' attack gauge
                         for legendary_creature in user.corresponding_team.get_legendary_creatures():
                             for skill in user.get_skills():
                                 if isinstance(skill, PassiveSkill):
-                                    legendary_creature.attack_gauge += skill.passive_skill_effect.allies_attack_gauge_up
+                                    legendary_creature.attack_gauge += \
+                                        to_numeric(skill.passive_skill_effect.allies_attack_gauge_up)
 
                         # 4. Decrease enemies' attack gauge
                         if target.can_receive_harmful_effect:
@@ -1226,15 +1718,17 @@ class Action:
                                 if isinstance(skill, PassiveSkill):
                                     resist_chance = resistance_accuracy_rule(user.accuracy + user.accuracy_up,
                                                                              target.resistance + target.resistance_up)
-                                    if random.random() >= resist_chance:
-                                        target.attack_gauge -= skill.passive_skill_effect.enemies_attack_gauge_down
+                                    if rng.random() >= resist_chance:
+                                        target.attack_gauge -= \
+                                            to_numeric(skill.passive_skill_effect.enemies_attack_gauge_down)
 
                         # 5. Heal allies
                         for legendary_creature in user.corresponding_team.get_legendary_creatures():
                             if legendary_creature.can_be_healed:
                                 for skill in user.get_skills():
                                     if isinstance(skill, PassiveSkill):
-                                        legendary_creature.curr_hp += skill.passive_skill_effect.heal_amount_to_allies
+                                        legendary_creature.curr_hp += \
+                                            to_numeric(skill.passive_skill_effect.heal_amount_to_allies)
                                         if legendary_creature.curr_hp >= legendary_creature.max_hp:
                                             legendary_creature.curr_hp = legendary_creature.max_hp
 
@@ -1246,12 +1740,12 @@ class Action:
                     if skill_to_use.is_aoe:
                         for ally in target.corresponding_team.get_legendary_creatures():
                             if ally.can_be_healed:
-                                ally.curr_hp += skill_to_use.heal_amount_to_allies
+                                ally.curr_hp += to_numeric(skill_to_use.heal_amount_to_allies)
                                 if ally.curr_hp >= ally.max_hp:
                                     ally.curr_hp = ally.max_hp
                     else:
                         if target.can_be_healed:
-                            target.curr_hp += skill_to_use.heal_amount_to_allies
+                            target.curr_hp += to_numeric(skill_to_use.heal_amount_to_allies)
                             if target.curr_hp >= target.max_hp:
                                 target.curr_hp = target.max_hp
 
@@ -1266,13 +1760,13 @@ class Action:
                                 for beneficial_effect in skill_to_use.get_beneficial_effects_to_allies():
                                     ally.add_beneficial_effect(beneficial_effect)
 
-                            ally.attack_gauge += skill_to_use.allies_attack_gauge_up
+                            ally.attack_gauge += to_numeric(skill_to_use.allies_attack_gauge_up)
                     else:
                         if target.can_receive_beneficial_effect:
                             for beneficial_effect in skill_to_use.get_beneficial_effects_to_allies():
                                 target.add_beneficial_effect(beneficial_effect)
 
-                        target.attack_gauge += skill_to_use.allies_attack_gauge_up
+                        target.attack_gauge += to_numeric(skill_to_use.allies_attack_gauge_up)
 
                 elif skill_to_use.active_skill_type == "ENEMIES EFFECT":
                     if user == target or user.corresponding_team == target.corresponding_team:
@@ -1283,23 +1777,23 @@ class Action:
                         for enemy in target.corresponding_team.get_legendary_creatures():
                             resist_chance: mpf = resistance_accuracy_rule(user.accuracy, enemy.resistance)
                             for harmful_effect in skill_to_use.get_harmful_effects_to_enemies():
-                                if random.random() >= resist_chance:
+                                if rng.random() >= resist_chance:
                                     enemy.add_harmful_effect(harmful_effect)
 
-                            if random.random() >= resist_chance:
-                                enemy.attack_gauge -= skill_to_use.enemies_attack_gauge_down
+                            if rng.random() >= resist_chance:
+                                enemy.attack_gauge -= to_numeric(skill_to_use.enemies_attack_gauge_down)
                                 if enemy.attack_gauge <= enemy.MIN_ATTACK_GAUGE:
-                                    enemy.attack_gauge = enemy.MIN_ATTACK_GAUGE
+                                    enemy.attack_gauge = to_numeric(enemy.MIN_ATTACK_GAUGE)
                     else:
                         resist_chance: mpf = resistance_accuracy_rule(user.accuracy, target.resistance)
                         for harmful_effect in skill_to_use.get_harmful_effects_to_enemies():
-                            if random.random() >= resist_chance:
+                            if rng.random() >= resist_chance:
                                 target.add_harmful_effect(harmful_effect)
 
-                        if random.random() >= resist_chance:
-                            target.attack_gauge -= skill_to_use.enemies_attack_gauge_down
+                        if rng.random() >= resist_chance:
+                            target.attack_gauge -= to_numeric(skill_to_use.enemies_attack_gauge_down)
                             if target.attack_gauge <= target.MIN_ATTACK_GAUGE:
-                                target.attack_gauge = target.MIN_ATTACK_GAUGE
+                                target.attack_gauge = to_numeric(target.MIN_ATTACK_GAUGE)
 
                 skill_to_use.cooltime = skill_to_use.max_cooltime
                 return True
@@ -1335,17 +1829,7 @@ class AwakenBonus:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def clone(self):
         # type: () -> AwakenBonus
@@ -1357,8 +1841,10 @@ class Battle:
     This class contains attributes of a battle which takes place in this game.
     """
 
-    def __init__(self, team1, team2):
-        # type: (Team, Team) -> None
+    ATTACK_GAUGE_UP_PER_ATTACK_SPEED: float = 0.07
+
+    def __init__(self, team1, team2, rng=None):
+        # type: (Team, Team, random.Random or None) -> None
         self.team1: Team = team1
         self.team2: Team = team2
         self.reward: Reward = Reward(mpf("10") ** sum(legendary_creature.rating for legendary_creature
@@ -1371,20 +1857,38 @@ class Battle:
                                                       in self.team2.get_legendary_creatures()))
         self.whose_turn: LegendaryCreature or None = None
         self.winner: Team or None = None
+        self.rng: random.Random or None = rng  # the global random number generator is used if this is None
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+        return render_object(self, vars(self))
+
+    def get_ticks_to_full_attack_gauge(self, legendary_creature):
+        # type: (LegendaryCreature) -> int or None
+        """
+        Getting the number of times the clock has to tick until the attack gauge of a legendary creature is full.
+        :return: None if the attack gauge of the legendary creature never becomes full
+        """
+
+        if legendary_creature.attack_gauge >= legendary_creature.FULL_ATTACK_GAUGE:
+            return 0
+
+        attack_gauge_up: mpf = legendary_creature.attack_speed * self.ATTACK_GAUGE_UP_PER_ATTACK_SPEED
+        if attack_gauge_up <= 0:
+            return None
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+        ticks: int = max(1, math.ceil(float((legendary_creature.FULL_ATTACK_GAUGE - legendary_creature.attack_gauge)
+                                            / attack_gauge_up)))
 
-            index += 1
+        # Correcting rounding errors so that the attack gauge becomes full after exactly 'ticks' ticks
+        while ticks > 1 and legendary_creature.attack_gauge + attack_gauge_up * (ticks - 1) >= \
+                legendary_creature.FULL_ATTACK_GAUGE:
+            ticks -= 1
 
-        return res + ")"
+        while legendary_creature.attack_gauge + attack_gauge_up * ticks < legendary_creature.FULL_ATTACK_GAUGE:
+            ticks += 1
+
+        return ticks
 
     def get_someone_to_move(self):
         # type: () -> None
@@ -1393,87 +1897,751 @@ class Battle:
         :return: None
         """
 
-        # Finding out which legendary creature moves
-        full_attack_gauge_list: list = []  # initial value
-        while len(full_attack_gauge_list) == 0:
-            for legendary_creature in self.team1.get_legendary_creatures():
-                if legendary_creature.attack_gauge >= legendary_creature.FULL_ATTACK_GAUGE and legendary_creature not \
-                        in full_attack_gauge_list:
-                    full_attack_gauge_list.append(legendary_creature)
-
-            for legendary_creature in self.team2.get_legendary_creatures():
-                if legendary_creature.attack_gauge >= legendary_creature.FULL_ATTACK_GAUGE and legendary_creature not \
-                        in full_attack_gauge_list:
-                    full_attack_gauge_list.append(legendary_creature)
-
-            self.tick()
-
-        max_attack_gauge: mpf = max(legendary_creature.attack_gauge for legendary_creature in full_attack_gauge_list)
-        for legendary_creature in full_attack_gauge_list:
-            if legendary_creature.attack_gauge == max_attack_gauge:
-                self.whose_turn = legendary_creature
-
-    def tick(self):
-        # type: () -> None
+        # Working out the number of ticks until the attack gauge of every legendary creature is full in one pass over
+        # both teams rather than ticking the clock one tick at a time. Skills can change the attack gauges and the
+        # attack speeds of any legendary creature, so the numbers of ticks are worked out again for every turn.
+        legendary_creatures: list = self.team1.get_legendary_creatures() + self.team2.get_legendary_creatures()
+        min_ticks: int or None = None  # initial value
+        full_attack_gauge_positions: list = []  # initial value
+        for position in range(len(legendary_creatures)):
+            ticks: int or None = self.get_ticks_to_full_attack_gauge(legendary_creatures[position])
+            if ticks is None:
+                continue
+
+            if min_ticks is None or ticks < min_ticks:
+                min_ticks = ticks
+                full_attack_gauge_positions = [position]
+            elif ticks == min_ticks:
+                full_attack_gauge_positions.append(position)
+
+        if min_ticks is None:
+            # Nobody will ever be able to move
+            self.whose_turn = None
+            return
+
+        # The clock ticks once more after the legendary creatures with full attack gauges are found.
+        self.tick(min_ticks + 1)
+
+        # The legendary creature with the highest attack gauge moves. If there is a tie, the one listed last in the
+        # teams moves.
+        max_attack_gauge: mpf or None = None  # initial value
+        for position in full_attack_gauge_positions:
+            if max_attack_gauge is None or legendary_creatures[position].attack_gauge >= max_attack_gauge:
+                max_attack_gauge = legendary_creatures[position].attack_gauge
+                self.whose_turn = legendary_creatures[position]
+
+    def tick(self, num_ticks=1):
+        # type: (int) -> None
         """
         The clock ticks when battles are carried out.
         :return: None
         """
 
         for legendary_creature in self.team1.get_legendary_creatures():
-            legendary_creature.attack_gauge += legendary_creature.attack_speed * 0.07
+            legendary_creature.attack_gauge += legendary_creature.attack_speed * self.ATTACK_GAUGE_UP_PER_ATTACK_SPEED \
+                                               * num_ticks
 
         for legendary_creature in self.team2.get_legendary_creatures():
-            legendary_creature.attack_gauge += legendary_creature.attack_speed * 0.07
+            legendary_creature.attack_gauge += legendary_creature.attack_speed * self.ATTACK_GAUGE_UP_PER_ATTACK_SPEED \
+                                               * num_ticks
 
     def clone(self):
         # type: () -> Battle
         return copy.deepcopy(self)
 
 
+class BattleResult:
+    """
+    This class contains attributes of the result of a battle played by a battle engine.
+    """
+
+    def __init__(self, winner, number_of_turns, team1_survivors, team2_survivors, seed=None):
+        # type: (int, int, int, int, object) -> None
+        self.winner: int = winner  # 1 if team 1 won, 2 if team 2 won and 0 if nobody won
+        self.number_of_turns: int = number_of_turns
+        self.team1_survivors: int = team1_survivors
+        self.team2_survivors: int = team2_survivors
+        self.seed: object = seed
+
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, vars(self))
+
+    def clone(self):
+        # type: () -> BattleResult
+        return copy.deepcopy(self)
+
+
+class BattlePolicy(ABC):
+    """
+    This class contains attributes of a policy deciding what a legendary creature does in its turn during a battle.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        pass
+
+    @abstractmethod
+    def choose_action(self, battle, legendary_creature, allies, enemies):
+        # type: (Battle, LegendaryCreature, Team, Team) -> tuple
+        """
+        Choosing the action of a legendary creature in its turn.
+        :return: a tuple (action name, active skill or None, target)
+        """
+
+    @staticmethod
+    def get_usable_skills(legendary_creature):
+        # type: (LegendaryCreature) -> list
+        return [skill for skill in legendary_creature.get_skills() if legendary_creature.curr_magic_points >=
+                skill.magic_points_cost and isinstance(skill, ActiveSkill)]
+
+    @staticmethod
+    def get_living_legendary_creatures(team):
+        # type: (Team) -> list
+        living_legendary_creatures: list = [legendary_creature for legendary_creature in
+                                            team.get_legendary_creatures() if legendary_creature.get_is_alive()]
+        return living_legendary_creatures if len(living_legendary_creatures) > 0 else team.get_legendary_creatures()
+
+    def __str__(self):
+        # type: () -> str
+        return str(type(self).__name__) + "()"
+
+    def clone(self):
+        # type: () -> BattlePolicy
+        return copy.deepcopy(self)
+
+
+class RandomBattlePolicy(BattlePolicy):
+    """
+    This class contains attributes of the policy used by CPU players, which chooses actions and targets at random.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        BattlePolicy.__init__(self)
+
+    def choose_action(self, battle, legendary_creature, allies, enemies):
+        # type: (Battle, LegendaryCreature, Team, Team) -> tuple
+        rng = get_random_number_generator(battle.rng)
+        chance: float = rng.random()
+        action_name: str = "NORMAL ATTACK" if chance <= 1 / 3 else \
+            "NORMAL HEAL" if 1 / 3 < chance <= 2 / 3 else "USE SKILL"
+        usable_skills: list = self.get_usable_skills(legendary_creature)
+
+        # If there are no usable skills and 'action_name' is set to "USE SKILL", change the value of 'action_name'
+        if len(usable_skills) == 0:
+            action_name = "NORMAL ATTACK" if rng.random() < 0.5 else "NORMAL HEAL"
+
+        skill_to_use: ActiveSkill or None = None  # initial value
+        if action_name == "USE SKILL":
+            skill_to_use = usable_skills[rng.randint(0, len(usable_skills) - 1)]
+
+        if action_name == "NORMAL ATTACK" or (skill_to_use is not None and (skill_to_use.active_skill_type ==
+                                                                            "ATTACK" or
+                                                                            skill_to_use.active_skill_type ==
+                                                                            "ENEMIES EFFECT")):
+            targets: list = self.get_living_legendary_creatures(enemies)
+        else:
+            targets: list = self.get_living_legendary_creatures(allies)
+
+        return action_name, skill_to_use, targets[rng.randint(0, len(targets) - 1)]
+
+
+class FocusFireBattlePolicy(BattlePolicy):
+    """
+    This class contains attributes of a deterministic policy which always attacks the living enemy with the least HP,
+    using the first usable attacking skill if there is one.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        BattlePolicy.__init__(self)
+
+    def choose_action(self, battle, legendary_creature, allies, enemies):
+        # type: (Battle, LegendaryCreature, Team, Team) -> tuple
+        target: LegendaryCreature = min(self.get_living_legendary_creatures(enemies),
+                                        key=lambda enemy: enemy.curr_hp)
+        for skill in self.get_usable_skills(legendary_creature):
+            if skill.active_skill_type == "ATTACK":
+                return "USE SKILL", skill, target
+
+        return "NORMAL ATTACK", None, target
+
+
+class InteractiveBattlePolicy(BattlePolicy):
+    """
+    This class contains attributes of the policy asking the player what to do in the command line window.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        BattlePolicy.__init__(self)
+
+    @staticmethod
+    def choose_target(team, label, purpose):
+        # type: (Team, str, str) -> LegendaryCreature
+        print("Below is a list of " + str(label.lower()) + " you can " + str(purpose) + ".")
+        curr_index: int = 1  # initial value
+        for legendary_creature in team.get_legendary_creatures():
+            print(("ENEMY #" if label == "ENEMIES" else "ALLY #") + str(curr_index))
+            print(str(legendary_creature) + "\n")
+            curr_index += 1
+
+        name: str = "enemy" if label == "ENEMIES" else "ally"
+        chosen_index: int = int(input("Please enter the index of the " + str(name) + " you want to " +
+                                      str(purpose) + " (1 - " + str(len(team.get_legendary_creatures())) + "): "))
+        while chosen_index < 1 or chosen_index > len(team.get_legendary_creatures()):
+            chosen_index = int(input("Sorry, invalid input! Please enter the index of the " + str(name) +
+                                     " you want to " + str(purpose) + " (1 - " +
+                                     str(len(team.get_legendary_creatures())) + "): "))
+
+        return team.get_legendary_creatures()[chosen_index - 1]
+
+    def choose_action(self, battle, legendary_creature, allies, enemies):
+        # type: (Battle, LegendaryCreature, Team, Team) -> tuple
+        # Printing out the stats of legendary creatures in both teams
+        print("Below are the stats of all legendary creatures in player's team.\n")
+        for ally in allies.get_legendary_creatures():
+            print(str(ally) + "\n")
+
+        print("Below are the stats of all legendary creatures in enemy's team.\n")
+        for enemy in enemies.get_legendary_creatures():
+            print(str(enemy) + "\n")
+
+        # Asking the player what he/she wants to do
+        print("Enter 'NORMAL ATTACK' for normal attack.")
+        print("Enter 'NORMAL HEAL' for normal heal.")
+        print("Enter anything else to use a skill (only applicable if you have usable skills).")
+        usable_skills: list = self.get_usable_skills(legendary_creature)
+        possible_actions: list = ["NORMAL ATTACK", "NORMAL HEAL"]
+        action_name: str = input("What do you want to do? ")
+        while len(usable_skills) == 0 and action_name not in possible_actions:
+            print("Enter 'NORMAL ATTACK' for normal attack.")
+            print("Enter 'NORMAL HEAL' for normal heal.")
+            action_name = input("Sorry, invalid input! What do you want to do? ")
+
+        if action_name == "NORMAL ATTACK":
+            return action_name, None, self.choose_target(enemies, "ENEMIES", "attack")
+        elif action_name == "NORMAL HEAL":
+            return action_name, None, self.choose_target(allies, "ALLIES", "heal")
+
+        # Show a list of skills the player can use
+        print("Below is a list of skills you can use.\n")
+        curr_skill_index: int = 1  # initial value
+        for skill in usable_skills:
+            print("SKILL #" + str(curr_skill_index))
+            print(str(skill) + "\n")
+            curr_skill_index += 1
+
+        skill_index: int = int(input("Please enter the index of the skill you want to use (1 - " +
+                                     str(len(usable_skills)) + "): "))
+        while skill_index < 1 or skill_index > len(usable_skills):
+            skill_index = int(input("Sorry, invalid input! Please enter the index of the skill you want to use "
+                                    "(1 - " + str(len(usable_skills)) + "): "))
+
+        skill_to_use: ActiveSkill = usable_skills[skill_index - 1]
+        if skill_to_use.active_skill_type == "ATTACK":
+            return "USE SKILL", skill_to_use, self.choose_target(enemies, "ENEMIES", "attack")
+        elif skill_to_use.active_skill_type == "HEAL":
+            return "USE SKILL", skill_to_use, self.choose_target(allies, "ALLIES", "heal")
+        elif skill_to_use.active_skill_type == "ALLIES EFFECT":
+            return "USE SKILL", skill_to_use, self.choose_target(allies, "ALLIES", "apply ally effect on")
+        else:
+            return "USE SKILL", skill_to_use, self.choose_target(enemies, "ENEMIES", "apply enemy effect on")
+
+
+class BattleEngine:
+    """
+    This class contains attributes of an engine playing battles between two teams until there is a winner, with
+    every team choosing its actions using a battle policy.
+    """
+
+    MAX_TURNS: int = 10000
+
+    def __init__(self, verbose=False):
+        # type: (bool) -> None
+        self.verbose: bool = verbose
+
+    def run(self, team1, team2, policy1, policy2, seed=None):
+        # type: (Team, Team, BattlePolicy, BattlePolicy, object) -> BattleResult
+        return self.play(Battle(team1, team2), policy1, policy2, seed)
+
+    def play(self, battle, policy1, policy2, seed=None):
+        # type: (Battle, BattlePolicy, BattlePolicy, object) -> BattleResult
+        """
+        Playing a battle until either team has all died or the maximum number of turns is reached.
+        :return: the result of the battle
+        """
+
+        global BATTLE_MESSAGES_ENABLED
+        battle_messages_enabled: bool = BATTLE_MESSAGES_ENABLED
+        if seed is not None:
+            battle.rng = random.Random(seed)
+
+        BATTLE_MESSAGES_ENABLED = self.verbose
+        try:
+            number_of_turns: int = self.__play_turns(battle, policy1, policy2)
+        finally:
+            BATTLE_MESSAGES_ENABLED = battle_messages_enabled
+
+        winner: int = 1 if battle.winner == battle.team1 else 2 if battle.winner == battle.team2 else 0
+        return BattleResult(winner, number_of_turns,
+                            len([legendary_creature for legendary_creature in battle.team1.get_legendary_creatures()
+                                 if legendary_creature.get_is_alive()]),
+                            len([legendary_creature for legendary_creature in battle.team2.get_legendary_creatures()
+                                 if legendary_creature.get_is_alive()]), seed)
+
+    def __play_turns(self, battle, policy1, policy2):
+        # type: (Battle, BattlePolicy, BattlePolicy) -> int
+        rng = get_random_number_generator(battle.rng)
+        battle.team1.recover_all()
+        battle.team2.recover_all()
+        number_of_turns: int = 0  # initial value
+        has_extra_turn: bool = False  # initial value
+        while battle.winner is None and number_of_turns < self.MAX_TURNS:
+            # Make a legendary creature move
+            if not has_extra_turn:
+                battle.get_someone_to_move()
+                if battle.whose_turn is None:
+                    break
+
+            has_extra_turn = False
+            moving_legendary_creature: LegendaryCreature = battle.whose_turn
+            if not moving_legendary_creature.get_is_alive():
+                # Dead legendary creatures do not have turns
+                moving_legendary_creature.attack_gauge = to_numeric(moving_legendary_creature.MIN_ATTACK_GAUGE)
+                continue
+
+            number_of_turns += 1
+            if not moving_legendary_creature.can_move:
+                # Skip turn
+                moving_legendary_creature.have_turn(moving_legendary_creature, None, "NORMAL HEAL", battle.rng)
+                moving_legendary_creature.attack_gauge = to_numeric(moving_legendary_creature.MIN_ATTACK_GAUGE)
+                continue
+
+            if moving_legendary_creature in battle.team1.get_legendary_creatures():
+                allies, enemies, policy = battle.team1, battle.team2, policy1
+            else:
+                allies, enemies, policy = battle.team2, battle.team1, policy2
+
+            # Recovering magic points
+            moving_legendary_creature.recover_magic_points()
+            action_name, skill_to_use, target = policy.choose_action(battle, moving_legendary_creature, allies,
+                                                                     enemies)
+            moving_legendary_creature.have_turn(target, skill_to_use, action_name, battle.rng)
+            if target in enemies.get_legendary_creatures() and target.get_is_alive() and \
+                    (action_name == "NORMAL ATTACK" or (isinstance(skill_to_use, ActiveSkill) and
+                                                        skill_to_use.active_skill_type == "ATTACK")):
+                if rng.random() < target.counterattack_chance + target.counterattack_chance_up:
+                    target.counterattack(moving_legendary_creature, battle.rng)
+
+            moving_legendary_creature.attack_gauge = to_numeric(moving_legendary_creature.MIN_ATTACK_GAUGE)
+
+            # Checking whether either team has all died
+            if battle.team2.all_died():
+                battle.winner = battle.team1
+            elif battle.team1.all_died():
+                battle.winner = battle.team2
+
+            # Checking the case where the moving legendary creature gets an extra turn
+            if battle.winner is None and moving_legendary_creature.get_is_alive() and \
+                    rng.random() < moving_legendary_creature.extra_turn_chance + \
+                    moving_legendary_creature.extra_turn_chance_up and moving_legendary_creature.can_move:
+                has_extra_turn = True
+
+        return number_of_turns
+
+
+class BattleStatistics:
+    """
+    This class contains attributes of the aggregated results of many battles between the same two teams.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.wins: int = 0
+        self.losses: int = 0
+        self.draws: int = 0
+        self.turn_counts: dict = {}  # number of turns -> number of battles lasting that many turns
+
+    def add_battle_result(self, battle_result):
+        # type: (BattleResult) -> None
+        if battle_result.winner == 1:
+            self.wins += 1
+        elif battle_result.winner == 2:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+        self.turn_counts[battle_result.number_of_turns] = self.turn_counts.get(battle_result.number_of_turns, 0) + 1
+
+    def merge(self, other):
+        # type: (BattleStatistics) -> None
+        self.wins += other.wins
+        self.losses += other.losses
+        self.draws += other.draws
+        for number_of_turns, number_of_battles in other.turn_counts.items():
+            self.turn_counts[number_of_turns] = self.turn_counts.get(number_of_turns, 0) + number_of_battles
+
+    def get_number_of_battles(self):
+        # type: () -> int
+        return self.wins + self.losses + self.draws
+
+    def get_win_rate(self):
+        # type: () -> float
+        return self.wins / self.get_number_of_battles() if self.get_number_of_battles() > 0 else 0.0
+
+    def get_average_number_of_turns(self):
+        # type: () -> float
+        return sum(number_of_turns * number_of_battles for number_of_turns, number_of_battles in
+                   self.turn_counts.items()) / self.get_number_of_battles() if self.get_number_of_battles() > 0 \
+            else 0.0
+
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, vars(self))
+
+    def clone(self):
+        # type: () -> BattleStatistics
+        return copy.deepcopy(self)
+
+
+class VectorisedBattles:
+    """
+    This class contains attributes of many battles played at once using NumPy arrays, with one row per battle and one
+    column per position in the teams. Battles follow a simplified rule set: every legendary creature uses its first
+    attacking active skill if it has enough magic points for it and a normal attack otherwise, always against the
+    living enemy with the least HP. Beneficial and harmful effects, passive skills, heals, counterattacks and extra
+    turns are not simulated.
+    """
+
+    STAT_NAMES: list = ["curr_hp", "max_hp", "curr_magic_points", "max_magic_points", "attack_power", "defense",
+                        "attack_speed", "attack_gauge", "crit_rate", "crit_damage", "crit_resist", "accuracy",
+                        "resistance", "life_drain_percentage", "shield_percentage", "max_hp_percentage_up",
+                        "max_magic_points_percentage_up", "attack_power_percentage_up", "attack_power_percentage_down",
+                        "attack_speed_percentage_up", "attack_speed_percentage_down", "defense_percentage_up",
+                        "defense_percentage_down", "crit_rate_up", "crit_damage_up", "crit_resist_up", "accuracy_up",
+                        "resistance_up", "life_drain_percentage_up", "damage_received_percentage_up"]
+    DAMAGE_MULTIPLIER_NAMES: list = ["multiplier_to_self_max_hp", "multiplier_to_enemy_max_hp",
+                                     "multiplier_to_self_attack_power", "multiplier_to_enemy_attack_power",
+                                     "multiplier_to_self_defense", "multiplier_to_enemy_defense",
+                                     "multiplier_to_self_max_magic_points", "multiplier_to_enemy_max_magic_points",
+                                     "multiplier_to_self_attack_speed", "multiplier_to_enemy_attack_speed",
+                                     "multiplier_to_self_current_hp_percentage",
+                                     "multiplier_to_self_hp_percentage_loss",
+                                     "multiplier_to_enemy_current_hp_percentage"]
+
+    def __init__(self, matchups):
+        # type: (list) -> None
+        if np is None:
+            raise ModuleNotFoundError("NumPy is required to play vectorised battles!")
+
+        # Matchups between the same teams are only read once and then copied to every battle between them
+        first_rows: dict = {}  # initial value
+        unique_matchups: list = []  # initial value
+        source_rows: list = []  # initial value
+        for team1, team2 in matchups:
+            if (id(team1), id(team2)) not in first_rows:
+                first_rows[(id(team1), id(team2))] = len(unique_matchups)
+                unique_matchups.append((team1, team2))
+
+            source_rows.append(first_rows[(id(team1), id(team2))])
+
+        self.team_size: int = max([max(len(team1.get_legendary_creatures()), len(team2.get_legendary_creatures()))
+                                   for team1, team2 in unique_matchups] + [1])
+        shape: tuple = (len(unique_matchups), 2 * self.team_size)
+        self.stats: dict = {stat_name: np.zeros(shape) for stat_name in self.STAT_NAMES}
+        self.stats["max_hp"][:] = 1  # Empty positions have 1 max HP so that HP percentages are defined
+        self.exists = np.zeros(shape, dtype=bool)
+        self.element_ids = np.zeros(shape, dtype=np.int64)
+        self.best_elemental_damage_multipliers = np.zeros(shape + (len(ELEMENTS),))
+        self.has_skill = np.zeros(shape, dtype=bool)
+        self.skill_damage_multipliers = np.zeros(shape + (len(self.DAMAGE_MULTIPLIER_NAMES),))
+        self.skill_magic_points_costs = np.zeros(shape)
+        self.skill_enemies_attack_gauge_down = np.zeros(shape)
+        self.skill_is_aoe = np.zeros(shape, dtype=bool)
+        self.skill_ignores_defense = np.zeros(shape, dtype=bool)
+        self.skill_ignores_shield = np.zeros(shape, dtype=bool)
+        self.team2_positions = np.arange(2 * self.team_size) >= self.team_size
+        for row in range(len(unique_matchups)):
+            for team, first_position in [(unique_matchups[row][0], 0), (unique_matchups[row][1], self.team_size)]:
+                team.recover_all()
+                for i in range(len(team.get_legendary_creatures())):
+                    self.__read_legendary_creature(team.get_legendary_creatures()[i], row, first_position + i)
+
+        for stat_name in self.STAT_NAMES:
+            self.stats[stat_name] = self.stats[stat_name][source_rows]
+
+        self.exists = self.exists[source_rows]
+        self.element_ids = self.element_ids[source_rows]
+        self.best_elemental_damage_multipliers = self.best_elemental_damage_multipliers[source_rows]
+        self.has_skill = self.has_skill[source_rows]
+        self.skill_damage_multipliers = self.skill_damage_multipliers[source_rows]
+        self.skill_magic_points_costs = self.skill_magic_points_costs[source_rows]
+        self.skill_enemies_attack_gauge_down = self.skill_enemies_attack_gauge_down[source_rows]
+        self.skill_is_aoe = self.skill_is_aoe[source_rows]
+        self.skill_ignores_defense = self.skill_ignores_defense[source_rows]
+        self.skill_ignores_shield = self.skill_ignores_shield[source_rows]
+        self.winners = np.zeros(len(matchups), dtype=np.int64)
+        self.numbers_of_turns = np.zeros(len(matchups), dtype=np.int64)
+        self.is_finished = np.zeros(len(matchups), dtype=bool)
+
+    @staticmethod
+    def from_matchup(team1, team2, number_of_battles):
+        # type: (Team, Team, int) -> VectorisedBattles
+        return VectorisedBattles([(team1, team2)] * number_of_battles)
+
+    def __read_legendary_creature(self, legendary_creature, row, position):
+        # type: (LegendaryCreature, int, int) -> None
+        for stat_name in self.STAT_NAMES:
+            self.stats[stat_name][row, position] = float(getattr(legendary_creature, stat_name))
+
+        self.exists[row, position] = True
+        self.element_ids[row, position] = legendary_creature.get_element_ids()[0]
+        self.best_elemental_damage_multipliers[row, position] = \
+            legendary_creature.get_best_elemental_damage_multipliers()
+        for skill in legendary_creature.get_skills():
+            if isinstance(skill, ActiveSkill) and skill.active_skill_type == "ATTACK":
+                self.has_skill[row, position] = True
+                self.skill_damage_multipliers[row, position] = [float(getattr(skill.damage_multiplier, name))
+                                                                for name in self.DAMAGE_MULTIPLIER_NAMES]
+                self.skill_magic_points_costs[row, position] = float(skill.magic_points_cost)
+                self.skill_enemies_attack_gauge_down[row, position] = float(skill.enemies_attack_gauge_down)
+                self.skill_is_aoe[row, position] = skill.is_aoe
+                self.skill_ignores_defense[row, position] = skill.does_ignore_enemies_defense
+                self.skill_ignores_shield[row, position] = skill.does_ignore_shield
+                break
+
+    def get_is_alive(self):
+        # type: () -> np.ndarray
+        return self.exists & (self.stats["curr_hp"] > 0)
+
+    def get_number_of_battles(self):
+        # type: () -> int
+        return len(self.winners)
+
+    def calculate_damage(self, actors, crit_rolls):
+        # type: (np.ndarray, np.ndarray) -> tuple
+        """
+        Calculating the damage the legendary creature at position 'actors[i]' in battle 'i' deals to the legendary
+        creature at every position in battle 'i', using the same formulas as normal attacks and
+        DamageMultiplier.calculate_raw_damage(). A hit by a skill is a critical hit if its crit roll is less than
+        the crit chance.
+        :return: a tuple (damage of normal attacks, damage of the first attacking active skills)
+        """
+
+        rows = np.arange(len(actors))
+        stats: dict = self.stats
+        user: dict = {stat_name: stats[stat_name][rows, actors][:, None] for stat_name in self.STAT_NAMES}
+        multipliers = self.skill_damage_multipliers[rows, actors].T[:, :, None]
+        user_attack_power = user["attack_power"] * (1 + user["attack_power_percentage_up"] / 100 -
+                                                    user["attack_power_percentage_down"] / 100)
+        target_defense_percentage = 1 + stats["defense_percentage_up"] / 100 - stats["defense_percentage_down"] / 100
+        damage_reduction_factor = 1e8 / (1e8 + 3.5 * stats["defense"])
+        normal_attack_damage = user_attack_power * target_defense_percentage * damage_reduction_factor
+
+        target_attack_power = stats["attack_power"] * (1 + stats["attack_power_percentage_up"] / 100 -
+                                                       stats["attack_power_percentage_down"] / 100)
+        self_current_hp_percentage = (user["curr_hp"] / user["max_hp"]) * 100
+        target_current_hp_percentage = (stats["curr_hp"] / stats["max_hp"]) * 100
+        raw_damage = (user["max_hp"] * (1 + user["max_hp_percentage_up"] / 100) * multipliers[0] +
+                      stats["max_hp"] * multipliers[1] * (1 + stats["max_hp_percentage_up"] / 100) +
+                      user_attack_power * (multipliers[8] * user["attack_speed"] *
+                                           (1 + user["attack_speed_percentage_up"] / 100 -
+                                            user["attack_speed_percentage_down"] / 100)) * multipliers[2] +
+                      target_attack_power + target_attack_power *
+                      (multipliers[9] * stats["attack_speed"] * (1 + stats["attack_speed_percentage_up"] / 100 -
+                                                                 stats["attack_speed_percentage_down"] / 100)) *
+                      multipliers[3] +
+                      user["defense"] * (1 + user["defense_percentage_up"] / 100 -
+                                         user["defense_percentage_down"] / 100) * multipliers[4] +
+                      stats["defense"] * target_defense_percentage * multipliers[5] +
+                      user["max_magic_points"] * (1 + user["max_magic_points_percentage_up"] / 100) *
+                      multipliers[6] + stats["max_magic_points"] * (1 + stats["max_magic_points_percentage_up"] /
+                                                                    100) * multipliers[7]) * \
+            (1 + self_current_hp_percentage * multipliers[10]) * \
+            (1 + (100 - self_current_hp_percentage) * multipliers[11]) * \
+            (1 + target_current_hp_percentage * multipliers[12]) * (1 + stats["damage_received_percentage_up"] / 100)
+        raw_damage = np.where(~self.skill_ignores_shield[rows, actors][:, None] & (stats["shield_percentage"] > 0),
+                              raw_damage * (1 - stats["shield_percentage"] / 100), raw_damage)
+        skill_damage_reduction_factor = np.where(self.skill_ignores_defense[rows, actors][:, None], 1.0,
+                                                 damage_reduction_factor)
+
+        # Checking for critical hits, which are the only hits affected by elements
+        crit_chance = np.maximum(float(LegendaryCreature.MIN_CRIT_RATE), user["crit_rate"] + user["crit_rate_up"] -
+                                 stats["crit_resist"] - stats["crit_resist_up"])
+        damage_multiplier_by_element = np.take_along_axis(self.best_elemental_damage_multipliers[rows, actors],
+                                                          self.element_ids, axis=1)
+        skill_damage = np.where(crit_rolls < crit_chance, raw_damage * (user["crit_damage"] + user["crit_damage_up"])
+                                * skill_damage_reduction_factor * damage_multiplier_by_element,
+                                raw_damage * skill_damage_reduction_factor)
+        return normal_attack_damage, skill_damage
+
+    def get_ticks_to_full_attack_gauge(self):
+        # type: () -> np.ndarray
+        gauge = self.stats["attack_gauge"]
+        full_attack_gauge: float = float(LegendaryCreature.FULL_ATTACK_GAUGE)
+        attack_gauge_up = self.stats["attack_speed"] * Battle.ATTACK_GAUGE_UP_PER_ATTACK_SPEED
+        can_move = self.get_is_alive() & (attack_gauge_up > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ticks = np.maximum(1.0, np.ceil((full_attack_gauge - gauge) / attack_gauge_up))
+
+        # Legendary creatures whose attack gauges never fill up are given a finite number of ticks here so that the
+        # corrections below do not multiply infinities by zero, and are given infinite ticks at the end.
+        ticks = np.where(attack_gauge_up > 0, ticks, 1.0)
+
+        # Correcting rounding errors in the same way as Battle.get_ticks_to_full_attack_gauge()
+        ticks = np.where((ticks > 1) & (gauge + attack_gauge_up * (ticks - 1) >= full_attack_gauge), ticks - 1,
+                         ticks)
+        ticks = np.where(gauge + attack_gauge_up * ticks < full_attack_gauge, ticks + 1, ticks)
+        ticks = np.where(gauge >= full_attack_gauge, 0.0, ticks)
+        return np.where(can_move, ticks, np.inf)
+
+    def step(self, rng):
+        # type: (np.random.Generator) -> int
+        """
+        Playing one turn in every battle which is not finished yet.
+        :return: the number of battles which are not finished yet
+        """
+
+        rows = np.arange(self.get_number_of_battles())
+        stats: dict = self.stats
+
+        # Filling the attack gauges until somebody in every battle can move
+        ticks = self.get_ticks_to_full_attack_gauge()
+        min_ticks = ticks.min(axis=1)
+        self.is_finished |= np.isinf(min_ticks)
+        playing = ~self.is_finished
+        stats["attack_gauge"] += np.where(playing[:, None] & ~np.isinf(ticks), stats["attack_speed"] *
+                                          Battle.ATTACK_GAUGE_UP_PER_ATTACK_SPEED *
+                                          np.where(playing, min_ticks + 1, 0)[:, None], 0)
+
+        # The legendary creature with the highest attack gauge moves. If there is a tie, the one listed last moves.
+        candidate_gauges = np.where(ticks == min_ticks[:, None], stats["attack_gauge"], -np.inf)[:, ::-1]
+        actors = candidate_gauges.shape[1] - 1 - np.argmax(candidate_gauges, axis=1)
+
+        # Recovering magic points
+        stats["curr_magic_points"][rows, actors] = np.where(
+            playing, np.minimum(stats["max_magic_points"][rows, actors], stats["curr_magic_points"][rows, actors] +
+                                stats["max_magic_points"][rows, actors] / 12), stats["curr_magic_points"][rows, actors])
+
+        # Choosing the targets
+        is_alive = self.get_is_alive()
+        is_enemy = is_alive & (self.team2_positions[None, :] != self.team2_positions[actors][:, None])
+        uses_skill = playing & self.has_skill[rows, actors] & \
+            (stats["curr_magic_points"][rows, actors] >= self.skill_magic_points_costs[rows, actors])
+        weakest_enemies = np.argmin(np.where(is_enemy, stats["curr_hp"], np.inf), axis=1)
+        is_target = np.zeros(is_enemy.shape, dtype=bool)
+        is_target[rows, weakest_enemies] = True
+        is_target = np.where((uses_skill & self.skill_is_aoe[rows, actors])[:, None], is_enemy, is_target & is_enemy)
+        is_target &= playing[:, None]
+
+        # Dealing damage
+        normal_attack_damage, skill_damage = self.calculate_damage(actors, rng.random(is_target.shape))
+        damage = np.where(is_target, np.where(uses_skill[:, None], skill_damage, normal_attack_damage), 0)
+        stats["curr_hp"] -= damage
+        stats["curr_magic_points"][rows, actors] -= np.where(uses_skill, self.skill_magic_points_costs[rows, actors],
+                                                             0)
+
+        # Considering life drain of skills
+        life_drain = np.where(uses_skill, damage.sum(axis=1) * (stats["life_drain_percentage"][rows, actors] +
+                                                                stats["life_drain_percentage_up"][rows, actors])
+                              / 100, 0)
+        stats["curr_hp"][rows, actors] = np.where(life_drain > 0, np.minimum(stats["max_hp"][rows, actors],
+                                                                             stats["curr_hp"][rows, actors] +
+                                                                             life_drain),
+                                                  stats["curr_hp"][rows, actors])
+
+        # Decreasing the attack gauges of the targets of skills which were not resisted
+        resistance = stats["resistance"] + stats["resistance_up"]
+        accuracy = (stats["accuracy"] + stats["accuracy_up"])[rows, actors][:, None]
+        resist_chance = np.where(resistance - accuracy <= 0.15, 0.15, resistance - accuracy)
+        is_not_resisted = is_target & uses_skill[:, None] & (rng.random(is_target.shape) >= resist_chance)
+        stats["attack_gauge"] = np.where(is_not_resisted, np.maximum(
+            0.0, stats["attack_gauge"] - self.skill_enemies_attack_gauge_down[rows, actors][:, None]),
+                                         stats["attack_gauge"])
+        stats["attack_gauge"][rows, actors] = np.where(playing, float(LegendaryCreature.MIN_ATTACK_GAUGE),
+                                                       stats["attack_gauge"][rows, actors])
+
+        # Checking whether either team has all died
+        self.numbers_of_turns += playing
+        is_alive = self.get_is_alive()
+        team1_all_died = ~(is_alive & ~self.team2_positions[None, :]).any(axis=1)
+        team2_all_died = ~(is_alive & self.team2_positions[None, :]).any(axis=1)
+        self.winners = np.where(playing & team2_all_died, 1, np.where(playing & team1_all_died, 2, self.winners))
+        self.is_finished |= team1_all_died | team2_all_died | (self.numbers_of_turns >= BattleEngine.MAX_TURNS)
+        return int((~self.is_finished).sum())
+
+    def run(self, seed=None):
+        # type: (object) -> BattleStatistics
+        rng: np.random.Generator = np.random.default_rng(seed)
+        while self.step(rng) > 0:
+            pass
+
+        return self.get_battle_statistics()
+
+    def get_battle_statistics(self):
+        # type: () -> BattleStatistics
+        battle_statistics: BattleStatistics = BattleStatistics()
+        battle_statistics.wins = int((self.winners == 1).sum())
+        battle_statistics.losses = int((self.winners == 2).sum())
+        battle_statistics.draws = self.get_number_of_battles() - battle_statistics.wins - battle_statistics.losses
+        turn_counts, number_of_battles = np.unique(self.numbers_of_turns, return_counts=True)
+        battle_statistics.turn_counts = {int(turn_counts[i]): int(number_of_battles[i])
+                                         for i in range(len(turn_counts))}
+        return battle_statistics
+
+    def __str__(self):
+        # type: () -> str
+        return str(type(self).__name__) + "(number_of_battles=" + str(self.get_number_of_battles()) + \
+            ", team_size=" + str(self.team_size) + ")"
+
+    def clone(self):
+        # type: () -> VectorisedBattles
+        return copy.deepcopy(self)
+
+
 class Arena:
     """
     This class contains attributes of a battle arena in this game. This arena allows players to attack CPU controlled
     opponents.
     """
 
-    def __init__(self, potential_opponents=None):
-        # type: (list) -> None
-        if potential_opponents is None:
-            potential_opponents = []
-        self.__potential_opponents: list = potential_opponents  # initial value
+    def __init__(self, potential_opponents=None, roster_seed=None, roster_cache_directory=None):
+        # type: (list, int or None, str or None) -> None
+        # If no opponents are given, the roster of CPU players is only generated the first time it is needed.
+        self.__potential_opponents: list or None = potential_opponents  # initial value
+        self.roster_seed: int or None = roster_seed
+        self.roster_cache_directory: str or None = roster_cache_directory
 
     def add_opponent(self, opponent):
         # type: (CPU) -> bool
-        if opponent not in self.__potential_opponents:
+        if opponent not in self.get_potential_opponents():
             self.__potential_opponents.append(opponent)
             return True
         return False
 
     def remove_opponent(self, opponent):
         # type: (CPU) -> bool
-        if opponent in self.__potential_opponents:
+        if opponent in self.get_potential_opponents():
             self.__potential_opponents.remove(opponent)
             return True
         return False
 
+    def roster_is_generated(self):
+        # type: () -> bool
+        return self.__potential_opponents is not None
+
     def get_potential_opponents(self):
         # type: () -> list
+        if self.__potential_opponents is None:
+            self.__potential_opponents = load_potential_cpu_players(self.roster_seed, self.roster_cache_directory)
+
         return self.__potential_opponents
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
 
 class Level:
@@ -1509,17 +2677,7 @@ class Level:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def clone(self):
         # type: () -> Level
@@ -1542,17 +2700,7 @@ class Stage:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def clone(self):
         # type: () -> Stage
@@ -1564,18 +2712,23 @@ class Player:
     This class contains attributes of the player in this game.
     """
 
-    def __init__(self, name):
-        # type: (str) -> None
+    def __init__(self, name, rng=None):
+        # type: (str, random.Random or None) -> None
         self.player_id: str = str(uuid.uuid1())  # generating random player ID
         self.name: str = name
+        self.rng: random.Random or None = rng  # the global random number generator is used if this is None
         self.level: int = 1
-        self.exp: mpf = mpf("0")
-        self.required_exp: mpf = mpf("1e6")
+        self.exp: BigValue = BigValue(0.0)
+        self.required_exp: BigValue = BigValue(1e6)
         self.exp_per_second: mpf = mpf("0")
-        self.gold: mpf = mpf("5e6")
+        self.gold: BigValue = BigValue(5e6)
         self.gold_per_second: mpf = mpf("0")
-        self.gems: mpf = mpf("100")
+        self.gems: BigValue = BigValue(100.0)
         self.gems_per_second: mpf = mpf("0")
+        # The parts of the gold and gems gained over time which are too small to change the gold and gems the player
+        # has. They are added together with the gold and gems gained later on.
+        self.gold_remainder: BigValue = BigValue(0.0)
+        self.gems_remainder: BigValue = BigValue(0.0)
         self.food: mpf = mpf("0")
         self.food_per_second: mpf = mpf("0")
         self.arena_points: int = 1000
@@ -1584,72 +2737,172 @@ class Player:
         self.battle_team: Team = Team()
         self.item_inventory: ItemInventory = ItemInventory()
         self.legendary_creature_inventory: LegendaryCreatureInventory = LegendaryCreatureInventory()
-        self.player_city: PlayerCity = PlayerCity()
+        self.player_city: PlayerCity = PlayerCity(rng)
         self.__unlocked_levels: list = []  # initial value
-        self.add_unlocked_level()  # ensuring that the player has unlocked at least one level
+        self.add_unlocked_level(rng)  # ensuring that the player has unlocked at least one level
+        # The number of seconds in which the player has gained resources so far, and the number of seconds at which
+        # the EXP gained by each legendary creature gaining EXP in a training area was last added to it
+        self.seconds_passed: int = 0
+        self.__legendary_creatures_gaining_exp: dict = {}  # initial value
+        self.last_seen: datetime = datetime.now()  # the time at which the player's resources were last updated
+        # A heap of the eggs placed in hatcheries by the times at which they hatch, which contains tuples of the
+        # hatch time, the number of eggs placed before, the egg and the hatchery
+        self.__egg_hatch_queue: list = []  # initial value
+        self.__eggs_placed: int = 0
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+        return render_object(self, vars(self))
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        # Players saved by older versions of this game store their gold, gems and EXP as mpf objects.
+        for attribute in ["exp", "required_exp", "gold", "gems"]:
+            state[attribute] = BigValue.to_big_value(state[attribute])
+
+        if "seconds_passed" not in state.keys():
+            state["seconds_passed"] = 0
+            state["_Player__legendary_creatures_gaining_exp"] = {
+                legendary_creature: 0 for legendary_creature in
+                state["legendary_creature_inventory"].get_legendary_creatures() if
+                legendary_creature.exp_per_second > 0
+            }
+
+        if "last_seen" not in state.keys():
+            state["last_seen"] = datetime.now()
+
+        if "rng" not in state.keys():
+            state["rng"] = None
+
+        if "gold_remainder" not in state.keys():
+            state["gold_remainder"] = BigValue(0.0)
+            state["gems_remainder"] = BigValue(0.0)
+
+        schedule_egg_hatches: bool = "_Player__egg_hatch_queue" not in state.keys()
+        if schedule_egg_hatches:
+            state["_Player__egg_hatch_queue"] = []
+            state["_Player__eggs_placed"] = 0
+
+        self.__dict__.update(state)
+        if schedule_egg_hatches:
+            # Players saved by older versions of this game do not have a queue of the eggs placed in hatcheries
+            for hatchery in self.player_city.get_buildings(Hatchery):
+                for egg in hatchery.get_eggs_placed():
+                    if egg.hatch_time is not None:
+                        self.__schedule_egg_hatch(egg, hatchery)
+
+    def catch_up(self, now=None):
+        # type: (datetime or None) -> int
+        """
+        Adding the resources gained since the player was last seen, including while the game was closed, and hatching
+        the eggs which should have hatched by now. This takes the same time however long the player has been away.
+        :return: the number of seconds since the player was last seen
+        """
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+        if now is None:
+            now = datetime.now()
 
-            index += 1
+        # Time which has gone backwards, e.g. after the clock of the computer was changed, is ignored. The fraction of
+        # a second left over is counted the next time.
+        seconds: int = max(0, int((now - self.last_seen).total_seconds()))
+        self.last_seen += timedelta(seconds=seconds)
+        self.gain_resources(seconds)
+        self.hatch_eggs_in_hatcheries(now)
+        return seconds
 
-        return res + ")"
+    def gain_resources(self, seconds):
+        # type: (int) -> None
+        """
+        Adding the EXP, gold and gems the player gains in a number of seconds. The rates at which they are gained are
+        updated whenever the buildings or the legendary creatures placed in them change, and the EXP gained by
+        legendary creatures in training areas is only added to them when settle_legendary_creature_exp() is called.
+        """
+
+        self.exp += BigValue(self.exp_per_second) * seconds
+        self.level_up()
+        self.gold, self.gold_remainder = Player.__add_with_remainder(self.gold, BigValue(self.gold_per_second) *
+                                                                     seconds, self.gold_remainder)
+        self.gems, self.gems_remainder = Player.__add_with_remainder(self.gems, BigValue(self.gems_per_second) *
+                                                                     seconds, self.gems_remainder)
+        self.seconds_passed += seconds
+
+    @staticmethod
+    def __add_with_remainder(total, gain, remainder):
+        # type: (BigValue, BigValue, BigValue) -> tuple
+        # The part of the gain which is lost to rounding when it is added to the total is returned as the new
+        # remainder, so that many small gains still add up.
+        gain += remainder
+        new_total: BigValue = total + gain
+        return new_total, gain - (new_total - total)
+
+    def settle_legendary_creature_exp(self, legendary_creature=None):
+        # type: (LegendaryCreature or None) -> None
+        """
+        Adding the EXP gained since it was last added to a legendary creature, or to all legendary creatures
+        gaining EXP if no legendary creature is given.
+        """
+
+        legendary_creatures: list = list(self.__legendary_creatures_gaining_exp.keys()) if legendary_creature is None \
+            else [legendary_creature]
+        for curr_legendary_creature in legendary_creatures:
+            if curr_legendary_creature in self.__legendary_creatures_gaining_exp.keys():
+                seconds: int = self.seconds_passed - self.__legendary_creatures_gaining_exp[curr_legendary_creature]
+                self.__legendary_creatures_gaining_exp[curr_legendary_creature] = self.seconds_passed
+                if seconds > 0 and curr_legendary_creature.exp_per_second > 0:
+                    curr_legendary_creature.exp += BigValue(curr_legendary_creature.exp_per_second) * seconds
+                    curr_legendary_creature.level_up()
+
+    def get_legendary_creatures_gaining_exp(self):
+        # type: () -> list
+        return list(self.__legendary_creatures_gaining_exp.keys())
 
     def place_egg_in_hatchery(self, egg, hatchery):
         # type: (Egg, Hatchery) -> bool
-        if egg not in self.item_inventory.get_items():
+        if not self.item_inventory.has_item(egg):
             return False
 
-        hatchery_exists: bool = False
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if curr_tile.building == hatchery:
-                        hatchery_exists = True
-                        break
-
-        if not hatchery_exists:
+        if not self.player_city.has_building(hatchery):
             return False
 
         if hatchery.add_egg(egg):
             # Make the egg hatch in 5 minutes
             egg.hatch_time = datetime.now() + timedelta(minutes=5)
             egg.already_placed = True
+            self.__schedule_egg_hatch(egg, hatchery)
             return True
         return False
 
-    def hatch_eggs_in_hatcheries(self):
-        # type: () -> None
+    def __schedule_egg_hatch(self, egg, hatchery):
+        # type: (Egg, Hatchery) -> None
+        heapq.heappush(self.__egg_hatch_queue, (egg.hatch_time, self.__eggs_placed, egg, hatchery))
+        self.__eggs_placed += 1
+
+    def hatch_eggs_in_hatcheries(self, now=None):
+        # type: (datetime or None) -> None
         """
-        This function automatically hatches all eggs in the hatcheries
+        This function automatically hatches all eggs in the hatcheries which are due to hatch
         :return: None
         """
-        hatcheries: list = []  # initial value
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if isinstance(curr_tile.building, Hatchery):
-                        hatcheries.append(curr_tile.building)
-
-        for hatchery in hatcheries:
-            assert isinstance(hatchery, Hatchery), "Not a hatchery! Invalid instance in 'hatcheries' list!"
-            for egg in hatchery.get_eggs_placed():
-                if egg.hatch_time is not None:
-                    if datetime.now() >= egg.hatch_time:
-                        # Initialise a random legendary creature
-                        hatchery.remove_egg(egg)
-                        self.remove_item_from_inventory(egg)
-                        new_legendary_creature: LegendaryCreature = generate_random_legendary_creature(egg.element)
-                        self.add_legendary_creature(new_legendary_creature)
+        if now is None:
+            now = datetime.now()
+
+        hatched_eggs: list = []  # initial value
+        while len(self.__egg_hatch_queue) > 0 and self.__egg_hatch_queue[0][0] <= now:
+            hatch_time, number, egg, hatchery = heapq.heappop(self.__egg_hatch_queue)
+            # Eggs in hatcheries which are no longer in the city do not hatch
+            if self.player_city.has_building(hatchery) and hatchery.remove_egg(egg):
+                self.remove_item_from_inventory(egg)
+                hatched_eggs.append(egg)
+
+        # Initialise random legendary creatures from all the eggs hatched
+        rng: random.Random = self.__get_random_number_generator()
+        for new_legendary_creature in [generate_random_legendary_creature(egg.element, rng) for egg in hatched_eggs]:
+            self.add_legendary_creature(new_legendary_creature)
+
+    def get_eggs_hatching(self):
+        # type: () -> list
+        return [egg for hatch_time, number, egg, hatchery in sorted(self.__egg_hatch_queue, key=lambda entry:
+                                                                     entry[:2])]
 
     def claim_reward(self, reward):
         # type: (Reward) -> None
@@ -1667,7 +2920,7 @@ class Player:
 
     def feed_legendary_creature(self, legendary_creature, food):
         # type: (LegendaryCreature, mpf) -> bool
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures():
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             return False
 
         if food > self.food:
@@ -1677,26 +2930,22 @@ class Player:
         legendary_creature.level_up()
         return True
 
-    def make_a_wish(self, temple_of_wishes):
-        # type: (TempleOfWishes) -> bool
-        temple_of_wishes_exists: bool = False
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if curr_tile.building == temple_of_wishes:
-                        temple_of_wishes_exists = True
-                        break
+    def __get_random_number_generator(self, rng=None):
+        # type: (random.Random or None) -> random.Random
+        # The random number generator of the player is used unless another one is given
+        return get_random_number_generator(self.rng if rng is None else rng)
 
-        if not temple_of_wishes_exists:
+    def make_a_wish(self, temple_of_wishes, rng=None):
+        # type: (TempleOfWishes, random.Random or None) -> bool
+        if not self.player_city.has_building(temple_of_wishes):
             return False
 
         if temple_of_wishes.wishes_left <= 0:
             return False
 
-        potential_objects: list = temple_of_wishes.get_obtainable_objects()
+        potential_objects: list or CatalogueView = temple_of_wishes.get_obtainable_objects()
         object_obtained: Item or Reward or LegendaryCreature = \
-            potential_objects[random.randint(0, len(potential_objects) - 1)]
+            potential_objects[self.__get_random_number_generator(rng).randint(0, len(potential_objects) - 1)]
         if isinstance(object_obtained, Item):
             self.add_item_to_inventory(object_obtained)
         elif isinstance(object_obtained, Reward):
@@ -1710,8 +2959,8 @@ class Player:
 
     def fuse_legendary_creatures(self, legendary_creature1, legendary_creature2, fusion_center):
         # type: (LegendaryCreature, LegendaryCreature, FusionCenter) -> bool
-        if legendary_creature1 not in self.legendary_creature_inventory.get_legendary_creatures() or \
-                legendary_creature2 not in self.legendary_creature_inventory.get_legendary_creatures():
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature1) or \
+                not self.legendary_creature_inventory.has_legendary_creature(legendary_creature2):
             return False
 
         if legendary_creature1 in self.battle_team.get_legendary_creatures() or \
@@ -1722,20 +2971,11 @@ class Player:
                 legendary_creature2.placed_in_training_area or legendary_creature2.placed_in_habitat:
             return False
 
-        fusion_center_exists: bool = False
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if curr_tile.building == fusion_center:
-                        fusion_center_exists = True
-                        break
-
-        if not fusion_center_exists:
+        if not self.player_city.has_building(fusion_center):
             return False
 
         # Fuse both legendary creatures into a new one
-        name: str = generate_random_name()
+        name: str = generate_random_name(self.__get_random_number_generator())
         main_element: str = legendary_creature1.get_elements()[0]
         elements: list = [element for element in legendary_creature1.get_elements()] + \
                          [element for element in legendary_creature2.get_elements()]
@@ -1769,12 +3009,12 @@ class Player:
         self.add_legendary_creature(new_legendary_creature)
         return True
 
-    def give_item_to_legendary_creature(self, item, legendary_creature):
-        # type: (Item, LegendaryCreature) -> bool
-        if item not in self.item_inventory.get_items():
+    def give_item_to_legendary_creature(self, item, legendary_creature, rng=None):
+        # type: (Item, LegendaryCreature, random.Random or None) -> bool
+        if not self.item_inventory.has_item(item):
             return False
 
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures():
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             return False
 
         if isinstance(item, EXPShard):
@@ -1788,7 +3028,8 @@ class Player:
             self.remove_item_from_inventory(item)
             return True
         elif isinstance(item, SkillLevelUpShard):
-            skill_index: int = random.randint(0, len(legendary_creature.get_skills()) - 1)
+            skill_index: int = self.__get_random_number_generator(rng).randint(0, len(legendary_creature.get_skills())
+                                                                               - 1)
             curr_skill: Skill = legendary_creature.get_skills()[skill_index]
             curr_skill.level_up()
             self.remove_item_from_inventory(item)
@@ -1808,19 +3049,10 @@ class Player:
                 power_up_circle.MAX_MATERIAL_LEGENDARY_CREATURES:
             return False
 
-        if legendary_creature_to_power_up not in self.legendary_creature_inventory.get_legendary_creatures():
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature_to_power_up):
             return False
 
-        power_up_circle_exists: bool = False
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if curr_tile.building == power_up_circle:
-                        power_up_circle_exists = True
-                        break
-
-        if not power_up_circle_exists:
+        if not self.player_city.has_building(power_up_circle):
             return False
 
         power_up_circle.deselect_legendary_creature_to_power_up()
@@ -1840,19 +3072,10 @@ class Player:
                 power_up_circle.MAX_MATERIAL_LEGENDARY_CREATURES:
             return False
 
-        if legendary_creature_to_evolve not in self.legendary_creature_inventory.get_legendary_creatures():
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature_to_evolve):
             return False
 
-        power_up_circle_exists: bool = False
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if curr_tile.building == power_up_circle:
-                        power_up_circle_exists = True
-                        break
-
-        if not power_up_circle_exists:
+        if not self.player_city.has_building(power_up_circle):
             return False
 
         power_up_circle.deselect_legendary_creature_to_power_up()
@@ -1860,6 +3083,7 @@ class Player:
         power_up_circle.set_material_legendary_creatures(material_legendary_creatures)
         legendary_creature_to_evolve = power_up_circle.execute_evolution()
         assert isinstance(legendary_creature_to_evolve, LegendaryCreature), "Legendary creature evolution failed!"
+        self.legendary_creature_inventory.update_legendary_creature(legendary_creature_to_evolve)
         for legendary_creature in material_legendary_creatures:
             self.remove_legendary_creature(legendary_creature)
 
@@ -1867,21 +3091,12 @@ class Player:
 
     def add_legendary_creature_to_habitat(self, legendary_creature, habitat):
         # type: (LegendaryCreature, Habitat) -> bool
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures() or \
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature) or \
                 legendary_creature in self.battle_team.get_legendary_creatures() or \
                 legendary_creature.placed_in_training_area:
             return False
 
-        habitat_exists: bool = False
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if curr_tile.building == habitat:
-                        habitat_exists = True
-                        break
-
-        if not habitat_exists:
+        if not self.player_city.has_building(habitat):
             return False
 
         if habitat.add_legendary_creature(legendary_creature) and habitat.element in legendary_creature.get_elements():
@@ -1893,21 +3108,12 @@ class Player:
 
     def remove_legendary_creature_from_habitat(self, legendary_creature, habitat):
         # type: (LegendaryCreature, Habitat) -> bool
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures() or \
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature) or \
                 legendary_creature in self.battle_team.get_legendary_creatures() or \
                 legendary_creature.placed_in_training_area:
             return False
 
-        habitat_exists: bool = False
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if curr_tile.building == habitat:
-                        habitat_exists = True
-                        break
-
-        if not habitat_exists:
+        if not self.player_city.has_building(habitat):
             return False
 
         if habitat.remove_legendary_creature(legendary_creature):
@@ -1919,51 +3125,39 @@ class Player:
 
     def add_legendary_creature_to_training_area(self, legendary_creature, training_area):
         # type: (LegendaryCreature, TrainingArea) -> bool
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures() or \
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature) or \
                 legendary_creature in self.battle_team.get_legendary_creatures() or \
                 legendary_creature.placed_in_habitat:
             return False
 
-        training_area_exists: bool = False
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if curr_tile.building == training_area:
-                        training_area_exists = True
-                        break
-
-        if not training_area_exists:
+        if not self.player_city.has_building(training_area):
             return False
 
         if training_area.add_legendary_creature(legendary_creature):
+            self.settle_legendary_creature_exp(legendary_creature)
             legendary_creature.exp_per_second += training_area.legendary_creature_exp_per_second
             legendary_creature.placed_in_training_area = True
+            if legendary_creature.exp_per_second > 0:
+                self.__legendary_creatures_gaining_exp[legendary_creature] = self.seconds_passed
             return True
         return False
 
     def remove_legendary_creature_from_training_area(self, legendary_creature, training_area):
         # type: (LegendaryCreature, TrainingArea) -> bool
-        if legendary_creature not in self.legendary_creature_inventory.get_legendary_creatures() or \
+        if not self.legendary_creature_inventory.has_legendary_creature(legendary_creature) or \
                 legendary_creature in self.battle_team.get_legendary_creatures() or \
                 legendary_creature.placed_in_habitat:
             return False
 
-        training_area_exists: bool = False
-        for section in self.player_city.get_sections():
-            for y in range(section.SECTION_HEIGHT):
-                for x in range(section.SECTION_WIDTH):
-                    curr_tile: CityTile = section.get_tile_at(x, y)
-                    if curr_tile.building == training_area:
-                        training_area_exists = True
-                        break
-
-        if not training_area_exists:
+        if not self.player_city.has_building(training_area):
             return False
 
         if training_area.remove_legendary_creature(legendary_creature):
+            self.settle_legendary_creature_exp(legendary_creature)
             legendary_creature.exp_per_second -= training_area.legendary_creature_exp_per_second
             legendary_creature.placed_in_training_area = False
+            if legendary_creature.exp_per_second <= 0:
+                self.__legendary_creatures_gaining_exp.pop(legendary_creature, None)
             return True
         return False
 
@@ -1971,7 +3165,7 @@ class Player:
         # type: () -> bool
         if self.gold >= self.player_city.section_build_gold_cost:
             self.gold -= self.player_city.section_build_gold_cost
-            self.player_city.add_section()
+            self.player_city.add_section(self.__get_random_number_generator())
             return True
         return False
 
@@ -2166,8 +3360,7 @@ class Player:
                 # Cannot build obstacle
                 return False
 
-            curr_tile.building = building
-            return True
+            return self.player_city.place_building(section_index, tile_x, tile_y, building)
         return False
 
     def remove_building_from_section_tile(self, section_index, tile_x, tile_y):
@@ -2240,22 +3433,22 @@ class Player:
                     self.gold += curr_building.remove_gold_gain
                     self.gems += curr_building.remove_gem_gain
 
-                curr_tile.building = None
+                self.player_city.remove_building(section_index, tile_x, tile_y)
                 return True
             return False
         return False
 
     def place_rune_on_legendary_creature(self, legendary_creature, rune):
         # type: (LegendaryCreature, Rune) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures() and rune in \
-                self.item_inventory.get_items():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature) and \
+                self.item_inventory.has_item(rune):
             legendary_creature.place_rune(rune)
             return True
         return False
 
     def remove_rune_from_legendary_creature(self, legendary_creature, slot_number):
         # type: (LegendaryCreature, int) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             if slot_number in legendary_creature.get_runes().keys():
                 legendary_creature.remove_rune(slot_number)
                 return True
@@ -2266,7 +3459,7 @@ class Player:
         # type: () -> None
         while self.exp >= self.required_exp:
             self.level += 1
-            self.required_exp *= mpf("10") ** self.level
+            self.required_exp *= BigValue(10.0) ** self.level
 
     def purchase_item(self, item):
         # type: (Item) -> bool
@@ -2279,7 +3472,7 @@ class Player:
 
     def sell_item(self, item):
         # type: (Item) -> bool
-        if item in self.item_inventory.get_items():
+        if self.item_inventory.has_item(item):
             if isinstance(item, Rune):
                 if item.already_placed:
                     return False
@@ -2290,12 +3483,13 @@ class Player:
             return True
         return False
 
-    def level_up_rune(self, rune):
-        # type: (Rune) -> bool
-        if rune in self.item_inventory.get_items():
+    def level_up_rune(self, rune, rng=None):
+        # type: (Rune, random.Random or None) -> bool
+        rng = self.__get_random_number_generator(rng)
+        if self.item_inventory.has_item(rune):
             if self.gold >= rune.level_up_gold_cost:
                 self.gold -= rune.level_up_gold_cost
-                return rune.level_up()
+                return rune.level_up(rng)
             return False
         else:
             # Check whether a legendary creature has the rune 'rune' or not
@@ -2303,7 +3497,7 @@ class Player:
                 if rune in legendary_creature.get_runes().values():
                     if self.gold >= rune.level_up_gold_cost:
                         self.gold -= rune.level_up_gold_cost
-                        return legendary_creature.level_up_rune(rune.slot_number)
+                        return legendary_creature.level_up_rune(rune.slot_number, rng)
                     return False
             return False
 
@@ -2336,7 +3530,7 @@ class Player:
 
     def add_legendary_creature_to_team(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             if self.battle_team.add_legendary_creature(legendary_creature):
                 legendary_creature.corresponding_team = self.battle_team
                 return True
@@ -2345,7 +3539,7 @@ class Player:
 
     def remove_legendary_creature_from_team(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.legendary_creature_inventory.get_legendary_creatures():
+        if self.legendary_creature_inventory.has_legendary_creature(legendary_creature):
             legendary_creature.corresponding_team = Team()
             return self.battle_team.remove_legendary_creature(legendary_creature)
         return False
@@ -2354,35 +3548,32 @@ class Player:
         # type: () -> list
         return self.__unlocked_levels
 
-    def add_unlocked_level(self):
-        # type: () -> None
+    def add_unlocked_level(self, rng=None):
+        # type: (random.Random or None) -> None
+        rng = self.__get_random_number_generator(rng)
         new_level_number: int = Level.LEVEL_NUMBER + 1
         level_stages: list = []  # initial value
         for i in range(5):
             level_stages.append(Stage([generate_random_legendary_creature(
-                Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
+                Egg.POTENTIAL_ELEMENTS[rng.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)], rng
             ),
                 generate_random_legendary_creature(
-                    Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
+                    Egg.POTENTIAL_ELEMENTS[rng.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)], rng
                 ),
                 generate_random_legendary_creature(
-                    Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
+                    Egg.POTENTIAL_ELEMENTS[rng.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)], rng
                 ),
                 generate_random_legendary_creature(
-                    Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
+                    Egg.POTENTIAL_ELEMENTS[rng.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)], rng
                 ),
                 generate_random_legendary_creature(
-                    Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
+                    Egg.POTENTIAL_ELEMENTS[rng.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)], rng
                 )]))
 
         level_ups: int = 5 * (new_level_number - 1)
         for stage in level_stages:
             for legendary_creature in stage.get_enemies_list():
-                for k in range(level_ups):
-                    legendary_creature.exp = legendary_creature.required_exp
-                    legendary_creature.level_up()
-                    if legendary_creature.level == legendary_creature.max_level:
-                        legendary_creature.evolve()
+                legendary_creature.advance_levels(level_ups)
 
         new_level: Level = Level(level_stages, Reward(
             mpf("10") ** (5 * new_level_number),
@@ -2390,9 +3581,9 @@ class Player:
             mpf(5 * new_level_number),
             mpf("10") ** (5 * new_level_number),
             [Egg(mpf("1e6"), mpf("10"),
-                 Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]),
+                 Egg.POTENTIAL_ELEMENTS[rng.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]),
              AwakenShard(mpf("1e6"), mpf("10"),
-                         Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)])]
+                         Egg.POTENTIAL_ELEMENTS[rng.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)])]
         ))
         self.__unlocked_levels.append(new_level)
 
@@ -2406,20 +3597,23 @@ class CPU(Player):
     This class contains attributes of a CPU controlled player.
     """
 
-    def __init__(self, name):
-        # type: (str) -> None
-        Player.__init__(self, name)
+    def __init__(self, name, rng=None):
+        # type: (str, random.Random or None) -> None
+        Player.__init__(self, name, rng)
         self.times_beaten: int = 0  # initial value
 
+    def __getstate__(self):
+        # type: () -> dict
+        # CPU players never play in their levels nor build their cities, so these are not saved.
+        state: dict = self.__dict__.copy()
+        state["_Player__unlocked_levels"] = []
+        state["player_city"] = None
+        return state
+
     def strengthen(self):
         # type: () -> None
         for legendary_creature in self.battle_team.get_legendary_creatures():
-            level_ups: int = 2 ** self.times_beaten
-            for i in range(level_ups):
-                legendary_creature.exp = legendary_creature.required_exp
-                legendary_creature.level_up()
-                if legendary_creature.level == legendary_creature.max_level:
-                    legendary_creature.evolve()
+            legendary_creature.advance_levels(2 ** self.times_beaten)
 
 
 class PlayerCity:
@@ -2427,33 +3621,124 @@ class PlayerCity:
     This class contains attributes of the city the player builds.
     """
 
-    def __init__(self):
-        # type: () -> None
-        self.__sections: list = [Section()]  # initial value
+    def __init__(self, rng=None):
+        # type: (random.Random or None) -> None
+        self.__sections: list = [Section(rng)]  # initial value
         self.section_build_gold_cost: mpf = mpf("1e8")
+        # Indices of the locations (section index, x, y) of the buildings in the city by the IDs of the buildings and
+        # by the types of the buildings. They are only created when they are first needed and are not saved.
+        self.__building_locations: dict or None = None
+        self.__building_locations_by_type: dict or None = None
 
-    def add_section(self):
-        # type: () -> None
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = self.__dict__.copy()
+        del state["_PlayerCity__building_locations"]
+        del state["_PlayerCity__building_locations_by_type"]
+        return state
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        self.__building_locations = None
+        self.__building_locations_by_type = None
+
+    def add_section(self, rng=None):
+        # type: (random.Random or None) -> None
         self.section_build_gold_cost *= mpf("10") ** (triangular(len(self.__sections)))
-        self.__sections.append(Section())
+        self.__sections.append(Section(rng))
+        if self.__building_locations is not None:
+            self.__index_section(len(self.__sections) - 1)
+
+    def get_sections(self):
+        # type: () -> list
+        return self.__sections
+
+    def place_building(self, section_index, tile_x, tile_y, building):
+        # type: (int, int, int, Building) -> bool
+        if section_index < 0 or section_index >= len(self.__sections):
+            return False
+
+        curr_tile: CityTile or None = self.__sections[section_index].get_tile_at(tile_x, tile_y)
+        if curr_tile is None or curr_tile.building is not None:
+            return False
+
+        self.__index_buildings()
+        curr_tile.building = building
+        self.__add_building_location(building, (section_index, tile_x, tile_y))
+        return True
+
+    def remove_building(self, section_index, tile_x, tile_y):
+        # type: (int, int, int) -> Building or None
+        if section_index < 0 or section_index >= len(self.__sections):
+            return None
+
+        curr_tile: CityTile or None = self.__sections[section_index].get_tile_at(tile_x, tile_y)
+        if curr_tile is None or curr_tile.building is None:
+            return None
+
+        self.__index_buildings()
+        building: Building = curr_tile.building
+        curr_tile.building = None
+        location: tuple = (section_index, tile_x, tile_y)
+        self.__building_locations[id(building)].discard(location)
+        if len(self.__building_locations[id(building)]) == 0:
+            del self.__building_locations[id(building)]
+
+        del self.__building_locations_by_type[type(building)][location]
+        return building
+
+    def has_building(self, building):
+        # type: (Building) -> bool
+        self.__index_buildings()
+        return id(building) in self.__building_locations.keys()
+
+    def get_buildings(self, building_type):
+        # type: (type) -> list
+        """
+        Getting the buildings of a type (including its subclasses) in the city.
+        :return: a list of buildings ordered by section, x-coordinates and then y-coordinates
+        """
+
+        self.__index_buildings()
+        buildings: dict = {}  # initial value
+        for curr_type, building_locations in self.__building_locations_by_type.items():
+            if issubclass(curr_type, building_type):
+                buildings.update(building_locations)
+
+        return [buildings[location] for location in sorted(buildings.keys())]
 
-    def get_sections(self):
-        # type: () -> list
-        return self.__sections
+    def __index_buildings(self):
+        # type: () -> None
+        if self.__building_locations is None:
+            self.__building_locations = {}
+            self.__building_locations_by_type = {}
+            for section_index in range(len(self.__sections)):
+                self.__index_section(section_index)
+
+    def __index_section(self, section_index):
+        # type: (int) -> None
+        section: Section = self.__sections[section_index]
+        for x in range(section.SECTION_WIDTH):
+            for y in range(section.SECTION_HEIGHT):
+                curr_tile: CityTile = section.get_tile_at(x, y)
+                if curr_tile.building is not None:
+                    self.__add_building_location(curr_tile.building, (section_index, x, y))
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+    def __add_building_location(self, building, location):
+        # type: (Building, tuple) -> None
+        if id(building) not in self.__building_locations.keys():
+            self.__building_locations[id(building)] = set()
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+        self.__building_locations[id(building)].add(location)
+        if type(building) not in self.__building_locations_by_type.keys():
+            self.__building_locations_by_type[type(building)] = {}
 
-            index += 1
+        self.__building_locations_by_type[type(building)][location] = building
 
-        return res + ")"
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, self.__getstate__())
 
     def clone(self):
         # type: () -> PlayerCity
@@ -2468,16 +3753,17 @@ class Section:
     SECTION_WIDTH: int = 10
     SECTION_HEIGHT: int = 10
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, rng=None):
+        # type: (random.Random or None) -> None
+        rng = get_random_number_generator(rng)
         self.__tiles: list = []  # initial value
         for i in range(self.SECTION_WIDTH):
             new = []  # initial value
             for k in range(self.SECTION_HEIGHT):
                 # Ensuring that obstacles are not placed at the edges of the section
-                place_obstacle: bool = random.random() <= 0.3
+                place_obstacle: bool = rng.random() <= 0.3
                 if place_obstacle and not self.is_edge(i, k):
-                    new.append(CityTile(Obstacle()))
+                    new.append(CityTile(Obstacle(rng)))
                 else:
                     new.append(CityTile())
 
@@ -2513,10 +3799,20 @@ class CityTile:
     This class contains attributes of a tile which can be built in a player's city.
     """
 
+    __slots__ = ("building",)
+
     def __init__(self, building=None):
         # type: (Building or None) -> None
         self.building: Building or None = building
 
+    def __getstate__(self):
+        # type: () -> dict
+        return get_object_state(self)
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        set_object_state(self, state)
+
     def __str__(self):
         # type: () -> str
         if isinstance(self.building, Building):
@@ -2556,6 +3852,10 @@ class Team:
         for legendary_creature in self.__legendary_creatures:
             legendary_creature.restore()
 
+    def get_main_element_ids(self):
+        # type: () -> list
+        return [legendary_creature.get_element_ids()[0] for legendary_creature in self.__legendary_creatures]
+
     def all_died(self):
         # type: () -> bool
         for legendary_creature in self.__legendary_creatures:
@@ -2566,9 +3866,8 @@ class Team:
     def add_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> bool
         if len(self.__legendary_creatures) < self.MAX_LEGENDARY_CREATURES:
-            legendary_creature_ids: list = [creature.legendary_creature_id for creature
-                                            in self.__legendary_creatures]
-            if legendary_creature.legendary_creature_id not in legendary_creature_ids:
+            if all(creature.legendary_creature_id != legendary_creature.legendary_creature_id for creature in
+                   self.__legendary_creatures):
                 self.__legendary_creatures.append(legendary_creature)
                 self.set_leader()
                 return True
@@ -2589,17 +3888,7 @@ class Team:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def clone(self):
         # type: () -> Team
@@ -2613,36 +3902,99 @@ class LegendaryCreatureInventory:
 
     def __init__(self):
         # type: () -> None
-        self.__legendary_creatures: list = []  # initial value
+        # The legendary creatures by their IDs in the order they were added, and the IDs of the legendary creatures
+        # by their elements and by their ratings
+        self.__legendary_creatures: dict = {}  # initial value
+        self.__legendary_creature_ids_by_element: dict = {}  # initial value
+        self.__legendary_creature_ids_by_rating: dict = {}  # initial value
+        # The list of the legendary creatures returned by get_legendary_creatures(), which is only made again after
+        # legendary creatures are added or removed
+        self.__legendary_creature_list: list or None = None
+
+    def __getstate__(self):
+        # type: () -> dict
+        # The indices are saved as the list of legendary creatures which older versions of this game saved.
+        return {"_LegendaryCreatureInventory__legendary_creatures": self.get_legendary_creatures()}
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__init__()
+        for legendary_creature in state["_LegendaryCreatureInventory__legendary_creatures"]:
+            self.add_legendary_creature(legendary_creature)
 
     def add_legendary_creature(self, legendary_creature):
         # type: (LegendaryCreature) -> None
-        self.__legendary_creatures.append(legendary_creature)
+        self.remove_legendary_creature(self.get_legendary_creature(legendary_creature.legendary_creature_id))
+        self.__legendary_creatures[legendary_creature.legendary_creature_id] = legendary_creature
+        self.__legendary_creature_list = None
+        for element in legendary_creature.get_elements():
+            self.__legendary_creature_ids_by_element.setdefault(element, {})[
+                legendary_creature.legendary_creature_id] = True
+
+        self.__legendary_creature_ids_by_rating.setdefault(legendary_creature.rating, {})[
+            legendary_creature.legendary_creature_id] = True
 
     def remove_legendary_creature(self, legendary_creature):
-        # type: (LegendaryCreature) -> bool
-        if legendary_creature in self.__legendary_creatures:
-            self.__legendary_creatures.remove(legendary_creature)
-            return True
-        return False
+        # type: (LegendaryCreature or None) -> bool
+        if not self.has_legendary_creature(legendary_creature):
+            return False
+
+        del self.__legendary_creatures[legendary_creature.legendary_creature_id]
+        self.__legendary_creature_list = None
+        for legendary_creature_ids in list(self.__legendary_creature_ids_by_element.values()) + \
+                list(self.__legendary_creature_ids_by_rating.values()):
+            legendary_creature_ids.pop(legendary_creature.legendary_creature_id, None)
+
+        return True
+
+    def update_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature) -> None
+        """
+        Updating the index of the ratings of the legendary creatures after the rating of a legendary creature changed.
+        """
+
+        if self.has_legendary_creature(legendary_creature):
+            for legendary_creature_ids in self.__legendary_creature_ids_by_rating.values():
+                legendary_creature_ids.pop(legendary_creature.legendary_creature_id, None)
+
+            self.__legendary_creature_ids_by_rating.setdefault(legendary_creature.rating, {})[
+                legendary_creature.legendary_creature_id] = True
+
+    def has_legendary_creature(self, legendary_creature):
+        # type: (LegendaryCreature or None) -> bool
+        return legendary_creature is not None and \
+            self.get_legendary_creature(legendary_creature.legendary_creature_id) is legendary_creature
+
+    def get_legendary_creature(self, legendary_creature_id):
+        # type: (str) -> LegendaryCreature or None
+        return self.__legendary_creatures.get(legendary_creature_id)
 
     def get_legendary_creatures(self):
         # type: () -> list
-        return self.__legendary_creatures
+        """
+        Getting the legendary creatures in the inventory in the order they were added. The same list is returned until
+        the legendary creatures in the inventory change, so it must not be changed by the caller.
+        :return: a list of legendary creatures
+        """
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+        if self.__legendary_creature_list is None:
+            self.__legendary_creature_list = list(self.__legendary_creatures.values())
+
+        return self.__legendary_creature_list
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+    def get_legendary_creatures_by_element(self, element):
+        # type: (str) -> list
+        return [self.__legendary_creatures[legendary_creature_id] for legendary_creature_id in
+                self.__legendary_creature_ids_by_element.get(element, {}).keys()]
 
-            index += 1
+    def get_legendary_creatures_by_rating(self, rating):
+        # type: (int) -> list
+        return [self.__legendary_creatures[legendary_creature_id] for legendary_creature_id in
+                self.__legendary_creature_ids_by_rating.get(rating, {}).keys()]
 
-        return res + ")"
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, self.__getstate__())
 
     def clone(self):
         # type: () -> LegendaryCreatureInventory
@@ -2656,36 +4008,74 @@ class ItemInventory:
 
     def __init__(self):
         # type: () -> None
-        self.__items: list = []  # initial value
+        # The items by their instance IDs in the order they were added, and the items by their classes
+        self.__items: dict = {}  # initial value
+        self.__items_by_class: dict = {}  # initial value
+        # The list of the items returned by get_items(), which is only made again after items are added or removed
+        self.__item_list: list or None = None
+
+    def __getstate__(self):
+        # type: () -> dict
+        # The instance IDs of the items change when they are loaded, so the items are saved as the list of items
+        # which older versions of this game saved.
+        return {"_ItemInventory__items": self.get_items()}
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__init__()
+        for item in state["_ItemInventory__items"]:
+            self.add_item(item)
 
     def add_item(self, item):
         # type: (Item) -> None
-        self.__items.append(item)
+        if not self.has_item(item):
+            self.__items[id(item)] = item
+            self.__item_list = None
+            self.__items_by_class.setdefault(type(item), {})[id(item)] = item
 
     def remove_item(self, item):
         # type: (Item) -> bool
-        if item in self.__items:
-            self.__items.remove(item)
+        if self.has_item(item):
+            del self.__items[id(item)]
+            self.__item_list = None
+            del self.__items_by_class[type(item)][id(item)]
             return True
         return False
 
+    def has_item(self, item):
+        # type: (Item) -> bool
+        return id(item) in self.__items.keys()
+
     def get_items(self):
         # type: () -> list
-        return self.__items
+        """
+        Getting the items in the inventory in the order they were added. The same list is returned until the items in
+        the inventory change, so it must not be changed by the caller.
+        :return: a list of items
+        """
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+        if self.__item_list is None:
+            self.__item_list = list(self.__items.values())
+
+        return self.__item_list
+
+    def get_items_by_class(self, item_class):
+        # type: (type) -> list
+        """
+        Getting the items of a class (including its subclasses) in the inventory.
+        :return: a list of items in the order they were added
+        """
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+        item_classes: list = [curr_class for curr_class in self.__items_by_class.keys() if
+                              issubclass(curr_class, item_class)]
+        if len(item_classes) == 1:
+            return list(self.__items_by_class[item_classes[0]].values())
 
-            index += 1
+        return [item for item in self.__items.values() if type(item) in item_classes]
 
-        return res + ")"
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, self.__getstate__())
 
     def clone(self):
         # type: () -> ItemInventory
@@ -2697,6 +4087,26 @@ class LegendaryCreature:
     This class contains attributes of a legendary creature in this game.
     """
 
+    __slots__ = ("DEFAULT_MAX_HP_PERCENTAGE_UP", "DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP",
+                 "DEFAULT_ATTACK_POWER_PERCENTAGE_UP", "DEFAULT_ATTACK_SPEED_PERCENTAGE_UP",
+                 "DEFAULT_DEFENSE_PERCENTAGE_UP", "DEFAULT_CRIT_DAMAGE_UP", "legendary_creature_id", "name",
+                 "__elements", "__element_ids", "__best_elemental_damage_multipliers", "rating", "level", "max_level",
+                 "exp", "required_exp", "exp_per_second", "player_gold_per_second", "curr_hp", "curr_magic_points",
+                 "base_max_hp", "base_max_magic_points", "base_attack_power", "base_defense", "base_attack_speed",
+                 "base_crit_rate", "base_crit_damage", "base_resistance", "base_accuracy", "base_extra_turn_chance",
+                 "base_counterattack_chance", "base_reflected_damage_percentage", "base_life_drain_percentage",
+                 "base_crit_resist", "base_stun_rate", "__effective_stats", "__beneficial_effects", "__harmful_effects",
+                 "__skills", "awaken_bonus", "__runes", "max_hp_percentage_up", "max_magic_points_percentage_up",
+                 "attack_power_percentage_up", "attack_power_percentage_down", "attack_speed_percentage_up",
+                 "attack_speed_percentage_down", "defense_percentage_up", "defense_percentage_down", "crit_rate_up",
+                 "crit_damage_up", "resistance_up", "accuracy_up", "extra_turn_chance_up", "counterattack_chance_up",
+                 "reflected_damage_percentage_up", "life_drain_percentage_up", "crit_resist_up", "shield_percentage",
+                 "damage_percentage_per_turn", "heal_percentage_per_turn", "has_awakened", "can_move", "can_be_healed",
+                 "can_receive_beneficial_effect", "can_receive_damage", "can_receive_harmful_effect", "can_die",
+                 "damage_received_percentage_up", "attack_gauge", "can_use_skills_with_cooltime",
+                 "can_use_passive_skills", "passive_skills_activated", "leader_skills_activated",
+                 "placed_in_training_area", "placed_in_habitat", "corresponding_team")
+
     MIN_RATING: int = 1
     MAX_RATING: int = 6
     MIN_CRIT_RATE: mpf = mpf("0.15")
@@ -2719,49 +4129,57 @@ class LegendaryCreature:
     MAX_BENEFICIAL_EFFECTS: int = 10
     MIN_HARMFUL_EFFECTS: int = 0
     MAX_HARMFUL_EFFECTS: int = 10
-    POTENTIAL_ELEMENTS: list = ["TERRA", "FLAME", "SEA", "NATURE", "ELECTRIC", "ICE", "METAL", "DARK", "LIGHT", "WAR",
-                                "PURE", "LEGEND", "PRIMAL", "WIND", "BEAUTY", "MAGIC", "CHAOS", "HAPPY", "DREAM",
-                                "SOUL"]
-    DEFAULT_MAX_HP_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_ATTACK_POWER_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_ATTACK_SPEED_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_DEFENSE_PERCENTAGE_UP: mpf = mpf("0")
-    DEFAULT_CRIT_DAMAGE_UP: mpf = mpf("0")
+    POTENTIAL_ELEMENTS: list = ELEMENTS.copy()
+    DEFAULT_NAMES: list = ["DEFAULT_MAX_HP_PERCENTAGE_UP", "DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP",
+                           "DEFAULT_ATTACK_POWER_PERCENTAGE_UP", "DEFAULT_ATTACK_SPEED_PERCENTAGE_UP",
+                           "DEFAULT_DEFENSE_PERCENTAGE_UP", "DEFAULT_CRIT_DAMAGE_UP"]
 
     def __init__(self, name, main_element, rating, max_hp, max_magic_points, attack_power, defense, attack_speed,
                  skills,
                  awaken_bonus):
         # type: (str, str, int, mpf, mpf, mpf, mpf, mpf, list, AwakenBonus) -> None
         self.legendary_creature_id: str = str(uuid.uuid1())  # generating random legendary creature ID
+        # The percentages of stats which the legendary creature is restored to, raised by buildings in the city
+        self.DEFAULT_MAX_HP_PERCENTAGE_UP: mpf = mpf("0")
+        self.DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP: mpf = mpf("0")
+        self.DEFAULT_ATTACK_POWER_PERCENTAGE_UP: mpf = mpf("0")
+        self.DEFAULT_ATTACK_SPEED_PERCENTAGE_UP: mpf = mpf("0")
+        self.DEFAULT_DEFENSE_PERCENTAGE_UP: mpf = mpf("0")
+        self.DEFAULT_CRIT_DAMAGE_UP: mpf = mpf("0")
         self.name: str = name
         self.__elements: list = [main_element if main_element in self.POTENTIAL_ELEMENTS else
                                  self.POTENTIAL_ELEMENTS[0]]  # a list of elements the legendary creature has. The main
         # (i.e., first) element will be the element considered as the defending element of this legendary creature.
+        self.__element_ids: list = [ELEMENT_IDS[element] for element in self.__elements]
+        self.__best_elemental_damage_multipliers: list = get_best_elemental_damage_multipliers(self.__element_ids)
         self.rating: int = rating if self.MIN_RATING <= rating <= self.MAX_RATING else self.MIN_RATING
         self.level: int = 1  # initial value
         self.max_level: int = 10 * triangular(self.rating) if self.rating < self.MAX_RATING else float('inf')
-        self.exp: mpf = mpf("0")
-        self.required_exp: mpf = mpf("1e6")
+        self.exp: BigValue = BigValue(0.0)
+        self.required_exp: BigValue = BigValue(1e6)
         self.exp_per_second: mpf = mpf("0")
         self.player_gold_per_second: mpf = mpf(int(max_hp / 500))
         self.curr_hp: mpf = max_hp
-        self.max_hp: mpf = max_hp
         self.curr_magic_points: mpf = max_magic_points
-        self.max_magic_points: mpf = max_magic_points
-        self.attack_power: mpf = attack_power
-        self.defense: mpf = defense
-        self.attack_speed: mpf = attack_speed
-        self.crit_rate: mpf = self.MIN_CRIT_RATE
-        self.crit_damage: mpf = self.MIN_CRIT_DAMAGE
-        self.resistance: mpf = self.MIN_RESISTANCE
-        self.accuracy: mpf = self.MIN_ACCURACY
-        self.extra_turn_chance: mpf = self.MIN_EXTRA_TURN_CHANCE
-        self.counterattack_chance: mpf = self.MIN_COUNTERATTACK_CHANCE
-        self.reflected_damage_percentage: mpf = self.MIN_REFLECTED_DAMAGE_PERCENTAGE
-        self.life_drain_percentage: mpf = self.MIN_LIFE_DRAIN_PERCENTAGE
-        self.crit_resist: mpf = self.MIN_CRIT_RESIST
-        self.stun_rate: mpf = mpf("0")
+        # The base stats only change when the legendary creature levels up, evolves or awakens. The effective stats
+        # (e.g., 'max_hp' and 'attack_power') also include the runes placed on the legendary creature, and they are
+        # computed again only after any of these change.
+        self.base_max_hp: mpf = max_hp
+        self.base_max_magic_points: mpf = max_magic_points
+        self.base_attack_power: mpf = attack_power
+        self.base_defense: mpf = defense
+        self.base_attack_speed: mpf = attack_speed
+        self.base_crit_rate: mpf = self.MIN_CRIT_RATE
+        self.base_crit_damage: mpf = self.MIN_CRIT_DAMAGE
+        self.base_resistance: mpf = self.MIN_RESISTANCE
+        self.base_accuracy: mpf = self.MIN_ACCURACY
+        self.base_extra_turn_chance: mpf = self.MIN_EXTRA_TURN_CHANCE
+        self.base_counterattack_chance: mpf = self.MIN_COUNTERATTACK_CHANCE
+        self.base_reflected_damage_percentage: mpf = self.MIN_REFLECTED_DAMAGE_PERCENTAGE
+        self.base_life_drain_percentage: mpf = self.MIN_LIFE_DRAIN_PERCENTAGE
+        self.base_crit_resist: mpf = self.MIN_CRIT_RESIST
+        self.base_stun_rate: mpf = mpf("0")
+        self.__effective_stats: EffectiveStats or None = None
         self.__beneficial_effects: list = []
         self.__harmful_effects: list = []
         self.__skills: list = skills
@@ -2807,41 +4225,47 @@ class LegendaryCreature:
     def set_elements(self, elements):
         # type: (list) -> None
         self.__elements = elements
+        self.__update_element_ids()
+
+    def __update_element_ids(self):
+        # type: () -> None
+        self.__element_ids = [ELEMENT_IDS[element] for element in self.__elements if element in ELEMENT_IDS]
+        self.__best_elemental_damage_multipliers = get_best_elemental_damage_multipliers(self.__element_ids)
 
     def restore(self):
         # type: () -> None
-        self.curr_hp = self.max_hp * (1 + self.max_hp_percentage_up / 100)
-        self.curr_magic_points = self.max_magic_points * (1 + self.max_magic_points_percentage_up / 100)
-        self.max_hp_percentage_up = self.DEFAULT_MAX_HP_PERCENTAGE_UP
-        self.max_magic_points_percentage_up = self.DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP
-        self.attack_power_percentage_up = self.DEFAULT_ATTACK_POWER_PERCENTAGE_UP
-        self.attack_power_percentage_down = mpf("0")
-        self.attack_speed_percentage_up = self.DEFAULT_ATTACK_SPEED_PERCENTAGE_UP
-        self.attack_speed_percentage_down = mpf("0")
-        self.defense_percentage_up = self.DEFAULT_DEFENSE_PERCENTAGE_UP
-        self.defense_percentage_down = mpf("0")
-        self.crit_rate_up = mpf("0")
-        self.crit_damage_up = self.DEFAULT_CRIT_DAMAGE_UP
-        self.resistance_up = mpf("0")
-        self.accuracy_up = mpf("0")
-        self.extra_turn_chance_up = mpf("0")
-        self.counterattack_chance_up = mpf("0")
-        self.reflected_damage_percentage_up = mpf("0")
-        self.life_drain_percentage_up = mpf("0")
-        self.crit_resist_up = mpf("0")
-        self.shield_percentage = mpf("0")
-        self.damage_percentage_per_turn = mpf("0")
-        self.heal_percentage_per_turn = mpf("0")
+        self.curr_hp = to_numeric(self.max_hp * (1 + self.max_hp_percentage_up / 100))
+        self.curr_magic_points = to_numeric(self.max_magic_points * (1 + self.max_magic_points_percentage_up / 100))
+        self.max_hp_percentage_up = to_numeric(self.DEFAULT_MAX_HP_PERCENTAGE_UP)
+        self.max_magic_points_percentage_up = to_numeric(self.DEFAULT_MAX_MAGIC_POINTS_PERCENTAGE_UP)
+        self.attack_power_percentage_up = to_numeric(self.DEFAULT_ATTACK_POWER_PERCENTAGE_UP)
+        self.attack_power_percentage_down = to_numeric(mpf("0"))
+        self.attack_speed_percentage_up = to_numeric(self.DEFAULT_ATTACK_SPEED_PERCENTAGE_UP)
+        self.attack_speed_percentage_down = to_numeric(mpf("0"))
+        self.defense_percentage_up = to_numeric(self.DEFAULT_DEFENSE_PERCENTAGE_UP)
+        self.defense_percentage_down = to_numeric(mpf("0"))
+        self.crit_rate_up = to_numeric(mpf("0"))
+        self.crit_damage_up = to_numeric(self.DEFAULT_CRIT_DAMAGE_UP)
+        self.resistance_up = to_numeric(mpf("0"))
+        self.accuracy_up = to_numeric(mpf("0"))
+        self.extra_turn_chance_up = to_numeric(mpf("0"))
+        self.counterattack_chance_up = to_numeric(mpf("0"))
+        self.reflected_damage_percentage_up = to_numeric(mpf("0"))
+        self.life_drain_percentage_up = to_numeric(mpf("0"))
+        self.crit_resist_up = to_numeric(mpf("0"))
+        self.shield_percentage = to_numeric(mpf("0"))
+        self.damage_percentage_per_turn = to_numeric(mpf("0"))
+        self.heal_percentage_per_turn = to_numeric(mpf("0"))
         self.can_move = True
         self.can_be_healed = True
         self.can_receive_beneficial_effect = True
         self.can_receive_damage = True
         self.can_receive_harmful_effect = True
         self.can_die = True
-        self.damage_received_percentage_up = mpf("0")
+        self.damage_received_percentage_up = to_numeric(mpf("0"))
         self.__beneficial_effects = []
         self.__harmful_effects = []
-        self.attack_gauge: mpf = self.MIN_ATTACK_GAUGE
+        self.attack_gauge = to_numeric(self.MIN_ATTACK_GAUGE)
         self.can_use_skills_with_cooltime: bool = True
         self.can_use_passive_skills: bool = True
 
@@ -2849,22 +4273,23 @@ class LegendaryCreature:
         # type: () -> bool
         if not self.has_awakened:
             self.name = "AWAKENED " + str(self.name)
-            self.max_hp *= 1 + self.awaken_bonus.max_hp_percentage_up / 100
-            self.max_magic_points *= 1 + self.awaken_bonus.max_magic_points_percentage_up / 100
-            self.attack_power *= 1 + self.awaken_bonus.attack_power_percentage_up / 100
-            self.defense *= 1 + self.awaken_bonus.defense_percentage_up / 100
-            self.attack_speed += self.awaken_bonus.attack_speed_up
-            self.crit_rate += self.awaken_bonus.crit_rate_up
-            self.crit_damage += self.awaken_bonus.crit_damage_up
-            self.resistance += self.awaken_bonus.resistance_up
-            if self.resistance > self.MAX_RESISTANCE:
-                self.resistance = self.MAX_RESISTANCE
-
-            self.accuracy += self.awaken_bonus.accuracy_up
-            if self.accuracy > self.MAX_ACCURACY:
-                self.accuracy = self.MAX_ACCURACY
+            self.base_max_hp *= 1 + self.awaken_bonus.max_hp_percentage_up / 100
+            self.base_max_magic_points *= 1 + self.awaken_bonus.max_magic_points_percentage_up / 100
+            self.base_attack_power *= 1 + self.awaken_bonus.attack_power_percentage_up / 100
+            self.base_defense *= 1 + self.awaken_bonus.defense_percentage_up / 100
+            self.base_attack_speed += self.awaken_bonus.attack_speed_up
+            self.base_crit_rate += self.awaken_bonus.crit_rate_up
+            self.base_crit_damage += self.awaken_bonus.crit_damage_up
+            self.base_resistance += self.awaken_bonus.resistance_up
+            if self.base_resistance > self.MAX_RESISTANCE:
+                self.base_resistance = self.MAX_RESISTANCE
+
+            self.base_accuracy += self.awaken_bonus.accuracy_up
+            if self.base_accuracy > self.MAX_ACCURACY:
+                self.base_accuracy = self.MAX_ACCURACY
 
             self.__skills.append(self.awaken_bonus.new_skill_gained)
+            self.invalidate_effective_stats()
             self.restore()
             self.has_awakened = True
             return True
@@ -2873,27 +4298,59 @@ class LegendaryCreature:
     def evolve(self):
         # type: () -> bool
         if self.level == self.max_level and self.rating < self.MAX_RATING and self.exp >= self.required_exp:
-            self.rating += 1
-            self.level = 1
-            self.max_level = 10 * triangular(self.rating) if self.rating < self.MAX_RATING else float('inf')
-            self.exp = mpf("0")
-            self.required_exp = mpf("1e6")
-            temp_runes: dict = self.__runes
-            for slot_number in self.__runes.keys():
-                self.remove_rune(slot_number)
-
-            self.attack_power *= triangular(self.level) + 1
-            self.max_hp *= triangular(self.level) + 1
-            self.max_magic_points *= triangular(self.level) + 1
-            self.defense *= triangular(self.level) + 1
-            self.attack_speed += 3
-            for rune in temp_runes.values():
-                self.place_rune(rune)
-
+            self.__evolve_to_next_rating()
             self.restore()
             return True
         return False
 
+    def __evolve_to_next_rating(self):
+        # type: () -> None
+        self.rating += 1
+        self.level = 1
+        self.max_level = 10 * triangular(self.rating) if self.rating < self.MAX_RATING else float('inf')
+        self.exp = BigValue(0.0)
+        self.required_exp = BigValue(1e6)
+        self.base_attack_power *= triangular(self.level) + 1
+        self.base_max_hp *= triangular(self.level) + 1
+        self.base_max_magic_points *= triangular(self.level) + 1
+        self.base_defense *= triangular(self.level) + 1
+        self.base_attack_speed += 3
+        self.invalidate_effective_stats()
+
+    def can_advance_level(self):
+        # type: () -> bool
+        return self.level < self.max_level or (self.level == self.max_level and self.rating < self.MAX_RATING)
+
+    def advance_levels(self, num_levels):
+        # type: (int) -> int
+        # Has the same effect as 'num_levels' times giving the legendary creature exactly the EXP it requires, calling
+        # level_up() and evolving it once it reaches its maximum level. However, the stats are multiplied by the
+        # product of all the level multipliers at once.
+        if num_levels <= 0:
+            return 0
+
+        if not self.can_advance_level():
+            self.exp = self.required_exp
+            return 0
+
+        levels_gained: int = 0  # initial value
+        while num_levels > 0:
+            if self.level < self.max_level:
+                last_level: int = int(min(self.level + num_levels, self.max_level))
+                num_levels -= last_level - self.level
+                levels_gained += self.__gain_levels(last_level)
+                # The EXP is what was required before the last level was gained.
+                self.exp = self.required_exp / BigValue(10.0) ** last_level
+            elif self.can_advance_level():
+                self.__evolve_to_next_rating()
+                num_levels -= 1
+            else:
+                self.exp = self.required_exp
+                break
+
+        self.restore()
+        return levels_gained
+
     def use_passive_skills(self):
         # type: () -> bool
         if self.can_use_passive_skills and not self.passive_skills_activated:
@@ -2997,6 +4454,15 @@ class LegendaryCreature:
     def add_element(self, element):
         # type: (str) -> None
         self.__elements.append(element)
+        self.__update_element_ids()
+
+    def get_element_ids(self):
+        # type: () -> list
+        return self.__element_ids
+
+    def get_best_elemental_damage_multipliers(self):
+        # type: () -> list
+        return self.__best_elemental_damage_multipliers
 
     def get_beneficial_effects(self):
         # type: () -> list
@@ -3013,10 +4479,10 @@ class LegendaryCreature:
                     beneficial_effect.can_be_stacked:
                 return False
 
-            self.attack_power_percentage_up += beneficial_effect.attack_power_percentage_up
-            self.attack_speed_percentage_up += beneficial_effect.attack_speed_percentage_up
-            self.defense_percentage_up += beneficial_effect.defense_percentage_up
-            self.crit_rate_up += beneficial_effect.crit_rate_up
+            self.attack_power_percentage_up += to_numeric(beneficial_effect.attack_power_percentage_up)
+            self.attack_speed_percentage_up += to_numeric(beneficial_effect.attack_speed_percentage_up)
+            self.defense_percentage_up += to_numeric(beneficial_effect.defense_percentage_up)
+            self.crit_rate_up += to_numeric(beneficial_effect.crit_rate_up)
             if beneficial_effect.prevents_damage:
                 self.can_receive_damage = False
 
@@ -3026,12 +4492,12 @@ class LegendaryCreature:
             if beneficial_effect.prevents_death:
                 self.can_die = False
 
-            self.heal_percentage_per_turn += beneficial_effect.heal_percentage_per_turn
-            self.counterattack_chance_up += beneficial_effect.counterattack_chance_up
-            self.reflected_damage_percentage_up += beneficial_effect.reflected_damage_percentage_up
-            self.life_drain_percentage_up += beneficial_effect.life_drain_percentage_up
-            self.crit_resist_up += beneficial_effect.crit_resist_up
-            self.shield_percentage += beneficial_effect.shield_percentage_up
+            self.heal_percentage_per_turn += to_numeric(beneficial_effect.heal_percentage_per_turn)
+            self.counterattack_chance_up += to_numeric(beneficial_effect.counterattack_chance_up)
+            self.reflected_damage_percentage_up += to_numeric(beneficial_effect.reflected_damage_percentage_up)
+            self.life_drain_percentage_up += to_numeric(beneficial_effect.life_drain_percentage_up)
+            self.crit_resist_up += to_numeric(beneficial_effect.crit_resist_up)
+            self.shield_percentage += to_numeric(beneficial_effect.shield_percentage_up)
             self.__beneficial_effects.append(beneficial_effect)
             return True
         return False
@@ -3039,10 +4505,10 @@ class LegendaryCreature:
     def remove_beneficial_effect(self, beneficial_effect):
         # type: (BeneficialEffect) -> bool
         if beneficial_effect in self.__beneficial_effects:
-            self.attack_power_percentage_up -= beneficial_effect.attack_power_percentage_up
-            self.attack_speed_percentage_up -= beneficial_effect.attack_speed_percentage_up
-            self.defense_percentage_up -= beneficial_effect.defense_percentage_up
-            self.crit_rate_up -= beneficial_effect.crit_rate_up
+            self.attack_power_percentage_up -= to_numeric(beneficial_effect.attack_power_percentage_up)
+            self.attack_speed_percentage_up -= to_numeric(beneficial_effect.attack_speed_percentage_up)
+            self.defense_percentage_up -= to_numeric(beneficial_effect.defense_percentage_up)
+            self.crit_rate_up -= to_numeric(beneficial_effect.crit_rate_up)
             if beneficial_effect.prevents_damage:
                 self.can_receive_damage = True
 
@@ -3052,12 +4518,12 @@ class LegendaryCreature:
             if beneficial_effect.prevents_death:
                 self.can_die = True
 
-            self.heal_percentage_per_turn -= beneficial_effect.heal_percentage_per_turn
-            self.counterattack_chance_up -= beneficial_effect.counterattack_chance_up
-            self.reflected_damage_percentage_up -= beneficial_effect.reflected_damage_percentage_up
-            self.life_drain_percentage_up -= beneficial_effect.life_drain_percentage_up
-            self.crit_resist_up -= beneficial_effect.crit_resist_up
-            self.shield_percentage -= beneficial_effect.shield_percentage_up
+            self.heal_percentage_per_turn -= to_numeric(beneficial_effect.heal_percentage_per_turn)
+            self.counterattack_chance_up -= to_numeric(beneficial_effect.counterattack_chance_up)
+            self.reflected_damage_percentage_up -= to_numeric(beneficial_effect.reflected_damage_percentage_up)
+            self.life_drain_percentage_up -= to_numeric(beneficial_effect.life_drain_percentage_up)
+            self.crit_resist_up -= to_numeric(beneficial_effect.crit_resist_up)
+            self.shield_percentage -= to_numeric(beneficial_effect.shield_percentage_up)
             self.__beneficial_effects.remove(beneficial_effect)
             return True
         return False
@@ -3069,13 +4535,13 @@ class LegendaryCreature:
                     harmful_effect.can_be_stacked:
                 return False
 
-            self.attack_power_percentage_down += harmful_effect.attack_power_percentage_down
-            self.attack_speed_percentage_down += harmful_effect.attack_speed_percentage_down
-            self.defense_percentage_down += harmful_effect.defense_percentage_down
+            self.attack_power_percentage_down += to_numeric(harmful_effect.attack_power_percentage_down)
+            self.attack_speed_percentage_down += to_numeric(harmful_effect.attack_speed_percentage_down)
+            self.defense_percentage_down += to_numeric(harmful_effect.defense_percentage_down)
             if harmful_effect.blocks_beneficial_effects:
                 self.can_receive_beneficial_effect = False
 
-            self.damage_received_percentage_up += harmful_effect.damage_received_percentage_up
+            self.damage_received_percentage_up += to_numeric(harmful_effect.damage_received_percentage_up)
             if harmful_effect.blocks_heal:
                 self.can_be_healed = False
 
@@ -3086,7 +4552,7 @@ class LegendaryCreature:
             if harmful_effect.blocks_skills_with_cooltime:
                 self.can_use_skills_with_cooltime = False
 
-            self.damage_percentage_per_turn += harmful_effect.damage_percentage_per_turn
+            self.damage_percentage_per_turn += to_numeric(harmful_effect.damage_percentage_per_turn)
             if harmful_effect.prevents_moves:
                 self.can_move = False
 
@@ -3097,13 +4563,13 @@ class LegendaryCreature:
     def remove_harmful_effect(self, harmful_effect):
         # type: (HarmfulEffect) -> bool
         if harmful_effect in self.__harmful_effects:
-            self.attack_power_percentage_down -= harmful_effect.attack_power_percentage_down
-            self.attack_speed_percentage_down -= harmful_effect.attack_speed_percentage_down
-            self.defense_percentage_down -= harmful_effect.defense_percentage_down
+            self.attack_power_percentage_down -= to_numeric(harmful_effect.attack_power_percentage_down)
+            self.attack_speed_percentage_down -= to_numeric(harmful_effect.attack_speed_percentage_down)
+            self.defense_percentage_down -= to_numeric(harmful_effect.defense_percentage_down)
             if harmful_effect.blocks_beneficial_effects:
                 self.can_receive_beneficial_effect = True
 
-            self.damage_received_percentage_up -= harmful_effect.damage_received_percentage_up
+            self.damage_received_percentage_up -= to_numeric(harmful_effect.damage_received_percentage_up)
             if harmful_effect.blocks_heal:
                 self.can_be_healed = True
 
@@ -3114,7 +4580,7 @@ class LegendaryCreature:
             if harmful_effect.blocks_skills_with_cooltime:
                 self.can_use_skills_with_cooltime = True
 
-            self.damage_percentage_per_turn -= harmful_effect.damage_percentage_per_turn
+            self.damage_percentage_per_turn -= to_numeric(harmful_effect.damage_percentage_per_turn)
             if harmful_effect.prevents_moves:
                 self.can_move = True
 
@@ -3139,190 +4605,246 @@ class LegendaryCreature:
         if rune.already_placed:
             return False
 
-        if rune.slot_number in self.__runes.keys():
-            self.remove_rune(rune.slot_number)
-
+        self.remove_rune(rune.slot_number)
         self.__runes[rune.slot_number] = rune
-        self.max_hp *= 1 + (rune.stat_increase.max_hp_percentage_up / 100)
-        self.max_hp += rune.stat_increase.max_hp_up
-        self.max_magic_points *= 1 + (rune.stat_increase.max_magic_points_percentage_up / 100)
-        self.max_magic_points += rune.stat_increase.max_magic_points_up
-        self.attack_power *= 1 + (rune.stat_increase.attack_percentage_up / 100)
-        self.attack_power += rune.stat_increase.attack_up
-        self.defense *= 1 + (rune.stat_increase.defense_percentage_up / 100)
-        self.defense += rune.stat_increase.defense_up
-        self.attack_speed += rune.stat_increase.attack_speed_up
-        self.crit_rate += rune.stat_increase.crit_rate_up
-        self.crit_damage += rune.stat_increase.crit_damage_up
-        self.resistance += rune.stat_increase.resistance_up
-        if self.resistance >= self.MAX_RESISTANCE:
-            self.resistance = self.MAX_RESISTANCE
-
-        self.accuracy += rune.stat_increase.accuracy_up
-        if self.accuracy >= self.MAX_ACCURACY:
-            self.accuracy = self.MAX_ACCURACY
-
-        # Try to activate the set effect of the rune if possible.
-        matching_runes: int = sum(1 for curr_rune in self.__runes.values() if curr_rune.set_name == rune.set_name)
-        if matching_runes >= rune.set_size and not rune.set_effect_is_active:
-            self.max_hp *= 1 + (rune.set_effect.max_hp_percentage_up / 100)
-            self.max_magic_points *= 1 + (rune.set_effect.max_magic_points_percentage_up / 100)
-            self.attack_power *= 1 + (rune.set_effect.attack_percentage_up / 100)
-            self.defense *= 1 + (rune.set_effect.defense_percentage_up / 100)
-            self.attack_speed *= 1 + (rune.set_effect.attack_speed_percentage_up / 100)
-            self.crit_rate += rune.set_effect.crit_rate_up
-            self.crit_damage += rune.set_effect.crit_damage_up
-            self.resistance += rune.set_effect.resistance_up
-            if self.resistance >= self.MAX_RESISTANCE:
-                self.resistance = self.MAX_RESISTANCE
-
-            self.accuracy += rune.set_effect.accuracy_up
-            if self.accuracy >= self.MAX_ACCURACY:
-                self.accuracy = self.MAX_ACCURACY
-
-            self.extra_turn_chance += rune.set_effect.extra_turn_chance_up
-            if self.extra_turn_chance >= self.MAX_EXTRA_TURN_CHANCE:
-                self.extra_turn_chance = self.MAX_EXTRA_TURN_CHANCE
-
-            self.counterattack_chance += rune.set_effect.counterattack_chance_up
-            if self.counterattack_chance >= self.MAX_COUNTERATTACK_CHANCE:
-                self.counterattack_chance = self.MAX_COUNTERATTACK_CHANCE
-
-            self.reflected_damage_percentage += rune.set_effect.reflected_damage_percentage_up
-            self.life_drain_percentage += rune.set_effect.life_drain_percentage_up
-            self.crit_resist += rune.set_effect.crit_resist_up
-            if self.crit_resist >= self.MAX_CRIT_RESIST:
-                self.crit_resist = self.MAX_CRIT_RESIST
-
-            self.stun_rate += rune.set_effect.stun_rate_up
-            rune.set_effect_is_active = True
-            count: int = 0
-            while count < rune.set_size:
-                for other_rune in self.__runes.values():
-                    if other_rune.set_name == rune.set_name:
-                        other_rune.set_effect_is_active = True
-                        count += 1
-
-        self.restore()
         rune.already_placed = True
+        self.invalidate_effective_stats()
+        self.restore()
         return True
 
     def level_up(self):
         # type: () -> None
-        while self.exp >= self.required_exp and self.level < self.max_level:
-            self.level += 1
-            self.required_exp *= mpf("10") ** self.level
-            temp_runes: dict = self.__runes
-            for slot_number in self.__runes.keys():
-                self.remove_rune(slot_number)
-
-            self.attack_power *= triangular(self.level)
-            self.max_hp *= triangular(self.level)
-            self.player_gold_per_second *= triangular(self.level)
-            self.max_magic_points *= triangular(self.level)
-            self.defense *= triangular(self.level)
-            self.attack_speed += 2
-            for rune in temp_runes.values():
-                self.place_rune(rune)
-
+        # Finding out how many levels the current EXP is enough for before rescaling the stats once for all of them
+        last_level: int = self.level
+        required_exp: BigValue = self.required_exp
+        while self.exp >= required_exp and last_level < self.max_level:
+            last_level += 1
+            required_exp *= BigValue(10.0) ** last_level
+
+        if last_level > self.level:
+            self.__gain_levels(last_level)
             self.restore()
 
-    def level_up_rune(self, slot_number):
-        # type: (int) -> bool
+    def __gain_levels(self, last_level):
+        # type: (int) -> int
+        first_level: int = self.level + 1
+        levels_gained: int = last_level - self.level
+        stat_multiplier: mpf = product_of_triangular_numbers(first_level, last_level)
+        self.required_exp *= BigValue(10.0) ** ((first_level + last_level) * levels_gained // 2)
+        self.base_attack_power *= stat_multiplier
+        self.base_max_hp *= stat_multiplier
+        self.player_gold_per_second *= stat_multiplier
+        self.base_max_magic_points *= stat_multiplier
+        self.base_defense *= stat_multiplier
+        self.base_attack_speed += 2 * levels_gained
+        self.level = last_level
+        self.invalidate_effective_stats()
+        return levels_gained
+
+    def level_up_rune(self, slot_number, rng=None):
+        # type: (int, random.Random or None) -> bool
         if slot_number not in self.__runes.keys():
             return False
 
-        current_rune: Rune = self.__runes[slot_number]
-        self.remove_rune(slot_number)
-        success: bool = current_rune.level_up()
-        self.place_rune(current_rune)
+        success: bool = self.__runes[slot_number].level_up(rng)
+        self.invalidate_effective_stats()
+        self.restore()
         return success
 
     def remove_rune(self, slot_number):
         # type: (int) -> bool
         if slot_number in self.__runes.keys():
             # Remove the rune at slot number 'slot_number'
-            current_rune: Rune = self.__runes[slot_number]
-            self.max_hp -= current_rune.stat_increase.max_hp_up
-            self.max_hp /= 1 + (current_rune.stat_increase.max_hp_percentage_up / 100)
-            self.max_magic_points -= current_rune.stat_increase.max_magic_points_up
-            self.max_magic_points /= 1 + (current_rune.stat_increase.max_magic_points_percentage_up / 100)
-            self.attack_power -= current_rune.stat_increase.attack_up
-            self.attack_power /= 1 + (current_rune.stat_increase.attack_percentage_up / 100)
-            self.defense -= current_rune.stat_increase.defense_up
-            self.defense /= 1 + (current_rune.stat_increase.defense_percentage_up / 100)
-            self.attack_speed -= current_rune.stat_increase.attack_speed_up
-            self.crit_rate -= current_rune.stat_increase.crit_rate_up
-            if self.crit_rate <= self.MIN_CRIT_RATE:
-                self.crit_rate = self.MIN_CRIT_RATE
-
-            self.crit_damage -= current_rune.stat_increase.crit_damage_up
-            if self.crit_damage <= self.MIN_CRIT_DAMAGE:
-                self.crit_damage = self.MIN_CRIT_DAMAGE
-
-            self.resistance -= current_rune.stat_increase.resistance_up
-            if self.resistance <= self.MIN_RESISTANCE:
-                self.resistance = self.MIN_RESISTANCE
-
-            self.accuracy -= current_rune.stat_increase.accuracy_up
-            if self.accuracy <= self.MIN_ACCURACY:
-                self.accuracy = self.MIN_ACCURACY
-
-            # Try to deactivate the set effect of the rune if possible.
-            matching_runes: int = sum(1 for rune in self.__runes.values() if rune.set_name == current_rune.set_name)
-            if matching_runes >= current_rune.set_size and current_rune.set_effect_is_active:
-                self.max_hp /= 1 + (current_rune.stat_increase.max_hp_percentage_up / 100)
-                self.max_magic_points /= 1 + (current_rune.set_effect.max_magic_points_percentage_up / 100)
-                self.attack_power /= 1 + (current_rune.set_effect.attack_percentage_up / 100)
-                self.defense /= 1 + (current_rune.set_effect.defense_percentage_up / 100)
-                self.attack_speed /= 1 + (current_rune.set_effect.attack_speed_percentage_up / 100)
-                self.crit_rate -= current_rune.set_effect.crit_rate_up
-                if self.crit_rate <= self.MIN_CRIT_RATE:
-                    self.crit_rate = self.MIN_CRIT_RATE
-
-                self.crit_damage -= current_rune.set_effect.crit_damage_up
-                if self.crit_damage <= self.MIN_CRIT_DAMAGE:
-                    self.crit_damage = self.MIN_CRIT_DAMAGE
-
-                self.resistance -= current_rune.set_effect.resistance_up
-                if self.resistance <= self.MIN_RESISTANCE:
-                    self.resistance = self.MIN_RESISTANCE
-
-                self.accuracy -= current_rune.set_effect.accuracy_up
-                if self.accuracy <= self.MIN_ACCURACY:
-                    self.accuracy = self.MIN_ACCURACY
-
-                self.extra_turn_chance -= current_rune.set_effect.extra_turn_chance_up
-                if self.extra_turn_chance <= self.MIN_EXTRA_TURN_CHANCE:
-                    self.extra_turn_chance = self.MIN_EXTRA_TURN_CHANCE
-
-                self.counterattack_chance -= current_rune.set_effect.counterattack_chance_up
-                if self.counterattack_chance <= self.MIN_COUNTERATTACK_CHANCE:
-                    self.counterattack_chance = self.MIN_COUNTERATTACK_CHANCE
-
-                self.reflected_damage_percentage -= current_rune.set_effect.reflected_damage_percentage_up
-                self.life_drain_percentage -= current_rune.set_effect.life_drain_percentage_up
-                self.crit_resist -= current_rune.set_effect.crit_resist_up
-                if self.crit_resist <= self.MIN_CRIT_RESIST:
-                    self.crit_resist = self.MIN_CRIT_RESIST
-
-                self.stun_rate -= current_rune.set_effect.stun_rate_up
-                current_rune.set_effect_is_active = False
-                count: int = 0
-                while count < current_rune.set_size:
-                    for other_rune in self.__runes.values():
-                        if other_rune.set_name == current_rune.set_name:
-                            other_rune.set_effect_is_active = False
-                            count += 1
-
-            self.restore()
-            self.__runes.pop(current_rune.slot_number)
+            current_rune: Rune = self.__runes.pop(slot_number)
             current_rune.already_placed = False
+            current_rune.set_effect_is_active = False
+            self.invalidate_effective_stats()
+            self.restore()
             return True
         return False
 
-    def have_turn(self, other, active_skill, action_name):
-        # type: (LegendaryCreature, ActiveSkill or None, str) -> bool
+    def invalidate_effective_stats(self):
+        # type: () -> None
+        self.__effective_stats = None
+
+    def get_effective_stats(self):
+        # type: () -> EffectiveStats
+        if self.__effective_stats is None or self.__effective_stats.numeric_mode != NUMERIC_MODE:
+            self.__effective_stats = self.__compute_effective_stats()
+
+        return self.__effective_stats
+
+    def __compute_effective_stats(self):
+        # type: () -> EffectiveStats
+        # The stat increases of all runes are added up before being applied to the base stats. After that, the set
+        # effect of every complete set of runes is applied.
+        stat_increases: list = [rune.stat_increase for rune in self.__runes.values()]
+        set_effects: list = []  # initial value
+        runes_in_sets: dict = {}  # initial value
+        for rune in self.__runes.values():
+            runes_in_sets.setdefault(rune.set_name, []).append(rune)
+
+        for runes_in_set in runes_in_sets.values():
+            complete_sets: int = len(runes_in_set) // runes_in_set[0].set_size
+            set_effects += [runes_in_set[0].set_effect] * complete_sets
+            for i in range(len(runes_in_set)):
+                runes_in_set[i].set_effect_is_active = i < complete_sets * runes_in_set[0].set_size
+
+        return EffectiveStats(
+            max_hp=(self.base_max_hp * (1 + sum(s.max_hp_percentage_up for s in stat_increases) / 100) +
+                    sum(s.max_hp_up for s in stat_increases)) *
+                   (1 + sum(e.max_hp_percentage_up for e in set_effects) / 100),
+            max_magic_points=(self.base_max_magic_points *
+                              (1 + sum(s.max_magic_points_percentage_up for s in stat_increases) / 100) +
+                              sum(s.max_magic_points_up for s in stat_increases)) *
+                             (1 + sum(e.max_magic_points_percentage_up for e in set_effects) / 100),
+            attack_power=(self.base_attack_power * (1 + sum(s.attack_percentage_up for s in stat_increases) / 100) +
+                          sum(s.attack_up for s in stat_increases)) *
+                         (1 + sum(e.attack_percentage_up for e in set_effects) / 100),
+            defense=(self.base_defense * (1 + sum(s.defense_percentage_up for s in stat_increases) / 100) +
+                     sum(s.defense_up for s in stat_increases)) *
+                    (1 + sum(e.defense_percentage_up for e in set_effects) / 100),
+            attack_speed=(self.base_attack_speed + sum(s.attack_speed_up for s in stat_increases)) *
+                         (1 + sum(e.attack_speed_percentage_up for e in set_effects) / 100),
+            crit_rate=self.base_crit_rate + sum(s.crit_rate_up for s in stat_increases) +
+                      sum(e.crit_rate_up for e in set_effects),
+            crit_damage=self.base_crit_damage + sum(s.crit_damage_up for s in stat_increases) +
+                        sum(e.crit_damage_up for e in set_effects),
+            resistance=min(self.MAX_RESISTANCE, self.base_resistance + sum(s.resistance_up for s in stat_increases) +
+                           sum(e.resistance_up for e in set_effects)),
+            accuracy=min(self.MAX_ACCURACY, self.base_accuracy + sum(s.accuracy_up for s in stat_increases) +
+                         sum(e.accuracy_up for e in set_effects)),
+            extra_turn_chance=min(self.MAX_EXTRA_TURN_CHANCE, self.base_extra_turn_chance +
+                                  sum(e.extra_turn_chance_up for e in set_effects)),
+            counterattack_chance=min(self.MAX_COUNTERATTACK_CHANCE, self.base_counterattack_chance +
+                                     sum(e.counterattack_chance_up for e in set_effects)),
+            reflected_damage_percentage=self.base_reflected_damage_percentage +
+                                        sum(e.reflected_damage_percentage_up for e in set_effects),
+            life_drain_percentage=self.base_life_drain_percentage +
+                                  sum(e.life_drain_percentage_up for e in set_effects),
+            crit_resist=min(self.MAX_CRIT_RESIST, self.base_crit_resist + sum(e.crit_resist_up for e in set_effects)),
+            stun_rate=self.base_stun_rate + sum(e.stun_rate_up for e in set_effects)
+        )
+
+    @property
+    def max_hp(self):
+        # type: () -> mpf
+        return self.get_effective_stats().max_hp
+
+    @property
+    def max_magic_points(self):
+        # type: () -> mpf
+        return self.get_effective_stats().max_magic_points
+
+    @property
+    def attack_power(self):
+        # type: () -> mpf
+        return self.get_effective_stats().attack_power
+
+    @property
+    def defense(self):
+        # type: () -> mpf
+        return self.get_effective_stats().defense
+
+    @property
+    def attack_speed(self):
+        # type: () -> mpf
+        return self.get_effective_stats().attack_speed
+
+    @property
+    def crit_rate(self):
+        # type: () -> mpf
+        return self.get_effective_stats().crit_rate
+
+    @property
+    def crit_damage(self):
+        # type: () -> mpf
+        return self.get_effective_stats().crit_damage
+
+    @property
+    def resistance(self):
+        # type: () -> mpf
+        return self.get_effective_stats().resistance
+
+    @property
+    def accuracy(self):
+        # type: () -> mpf
+        return self.get_effective_stats().accuracy
+
+    @property
+    def extra_turn_chance(self):
+        # type: () -> mpf
+        return self.get_effective_stats().extra_turn_chance
+
+    @property
+    def counterattack_chance(self):
+        # type: () -> mpf
+        return self.get_effective_stats().counterattack_chance
+
+    @property
+    def reflected_damage_percentage(self):
+        # type: () -> mpf
+        return self.get_effective_stats().reflected_damage_percentage
+
+    @property
+    def life_drain_percentage(self):
+        # type: () -> mpf
+        return self.get_effective_stats().life_drain_percentage
+
+    @property
+    def crit_resist(self):
+        # type: () -> mpf
+        return self.get_effective_stats().crit_resist
+
+    @property
+    def stun_rate(self):
+        # type: () -> mpf
+        return self.get_effective_stats().stun_rate
+
+    def __getstate__(self):
+        # type: () -> dict
+        return get_object_state(self)
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        # Legendary creatures saved by older versions of this game store their stats with the stat increases of their
+        # runes already applied, so those are taken away again to get the base stats.
+        if "base_max_hp" not in state:
+            stat_increases: list = [rune.stat_increase for rune in state["_LegendaryCreature__runes"].values()]
+            for stat_name, percentage_up_name, up_name in [("max_hp", "max_hp_percentage_up", "max_hp_up"),
+                                                           ("max_magic_points", "max_magic_points_percentage_up",
+                                                            "max_magic_points_up"),
+                                                           ("attack_power", "attack_percentage_up", "attack_up"),
+                                                           ("defense", "defense_percentage_up", "defense_up")]:
+                state["base_" + stat_name] = (state.pop(stat_name) - sum(getattr(s, up_name) for s in
+                                                                          stat_increases)) / \
+                                             (1 + sum(getattr(s, percentage_up_name) for s in stat_increases) / 100)
+
+            for stat_name, up_name in [("attack_speed", "attack_speed_up"), ("crit_rate", "crit_rate_up"),
+                                       ("crit_damage", "crit_damage_up"), ("resistance", "resistance_up"),
+                                       ("accuracy", "accuracy_up")]:
+                state["base_" + stat_name] = state.pop(stat_name) - sum(getattr(s, up_name) for s in stat_increases)
+
+            for stat_name in ["extra_turn_chance", "counterattack_chance", "reflected_damage_percentage",
+                              "life_drain_percentage", "crit_resist", "stun_rate"]:
+                state["base_" + stat_name] = state.pop(stat_name)
+
+        # The effective stats are computed again after loading since they depend on the numeric mode of the game.
+        state["_LegendaryCreature__effective_stats"] = None
+        for attribute in ["exp", "required_exp"]:
+            state[attribute] = BigValue.to_big_value(state[attribute])
+
+        # Legendary creatures saved by older versions of this game only store the percentages of stats raised by
+        # buildings in the city if they were raised.
+        for default_name in self.DEFAULT_NAMES:
+            state.setdefault(default_name, mpf("0"))
+
+        set_object_state(self, state)
+        if "_LegendaryCreature__element_ids" not in state:
+            self.__update_element_ids()
+
+    def have_turn(self, other, active_skill, action_name, rng=None):
+        # type: (LegendaryCreature, ActiveSkill or None, str, random.Random or None) -> bool
         if self.can_use_passive_skills and not self.passive_skills_activated:
             self.use_passive_skills()
 
@@ -3338,19 +4860,19 @@ class LegendaryCreature:
 
         if self.can_move:
             if action_name == "NORMAL ATTACK":
-                self.normal_attack(other)
+                self.normal_attack(other, rng)
             elif action_name == "NORMAL HEAL":
-                self.normal_heal(other)
+                self.normal_heal(other, rng)
             elif action_name == "USE SKILL" and isinstance(active_skill, ActiveSkill):
-                self.use_skill(other, active_skill)
+                self.use_skill(other, active_skill, rng)
             else:
                 pass
 
             return True
         return False
 
-    def counterattack(self, other):
-        # type: (LegendaryCreature) -> bool
+    def counterattack(self, other, rng=None):
+        # type: (LegendaryCreature, random.Random or None) -> bool
         if self.can_move:
             first_attacking_active_skill: ActiveSkill or None = None  # initial value
             for skill in self.get_skills():
@@ -3359,29 +4881,29 @@ class LegendaryCreature:
                         first_attacking_active_skill = skill
 
             if first_attacking_active_skill is None:
-                self.normal_attack(other)
+                self.normal_attack(other, rng)
             else:
                 assert isinstance(first_attacking_active_skill, ActiveSkill)
                 if self.curr_magic_points < first_attacking_active_skill.magic_points_cost:
-                    self.normal_attack(other)
+                    self.normal_attack(other, rng)
                 else:
-                    self.use_skill(other, first_attacking_active_skill)
+                    self.use_skill(other, first_attacking_active_skill, rng)
             return True
         else:
             return False
 
-    def normal_attack(self, other):
-        # type: (LegendaryCreature) -> None
+    def normal_attack(self, other, rng=None):
+        # type: (LegendaryCreature, random.Random or None) -> None
         action: Action = Action("NORMAL ATTACK")
-        action.execute(self, other)
+        action.execute(self, other, None, rng)
 
-    def normal_heal(self, other):
-        # type: (LegendaryCreature) -> None
+    def normal_heal(self, other, rng=None):
+        # type: (LegendaryCreature, random.Random or None) -> None
         action: Action = Action("NORMAL HEAL")
-        action.execute(self, other)
+        action.execute(self, other, None, rng)
 
-    def use_skill(self, other, active_skill):
-        # type: (LegendaryCreature, ActiveSkill) -> bool
+    def use_skill(self, other, active_skill, rng=None):
+        # type: (LegendaryCreature, ActiveSkill, random.Random or None) -> bool
         if active_skill not in self.__skills:
             return False
 
@@ -3389,26 +4911,54 @@ class LegendaryCreature:
             return False
 
         action: Action = Action("USE SKILL")
-        action.execute(self, other, active_skill)
-        self.curr_magic_points -= active_skill.magic_points_cost
+        action.execute(self, other, active_skill, rng)
+        self.curr_magic_points -= to_numeric(active_skill.magic_points_cost)
         return True
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+        return render_object(self, get_object_state(self))
+
+    def clone(self):
+        # type: () -> LegendaryCreature
+        return copy.deepcopy(self)
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
 
-            index += 1
+class EffectiveStats:
+    """
+    This class contains attributes of the stats of a legendary creature after the stat increases and set effects of
+    its runes are applied. The stats are stored using the numeric mode the game was in when they were computed.
+    """
+
+    def __init__(self, max_hp=mpf("0"), max_magic_points=mpf("0"), attack_power=mpf("0"), defense=mpf("0"),
+                 attack_speed=mpf("0"), crit_rate=mpf("0"), crit_damage=mpf("0"), resistance=mpf("0"),
+                 accuracy=mpf("0"), extra_turn_chance=mpf("0"), counterattack_chance=mpf("0"),
+                 reflected_damage_percentage=mpf("0"), life_drain_percentage=mpf("0"), crit_resist=mpf("0"),
+                 stun_rate=mpf("0")):
+        # type: (mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf) -> None
+        self.numeric_mode: str = NUMERIC_MODE
+        self.max_hp: mpf or float = to_numeric(max_hp)
+        self.max_magic_points: mpf or float = to_numeric(max_magic_points)
+        self.attack_power: mpf or float = to_numeric(attack_power)
+        self.defense: mpf or float = to_numeric(defense)
+        self.attack_speed: mpf or float = to_numeric(attack_speed)
+        self.crit_rate: mpf or float = to_numeric(crit_rate)
+        self.crit_damage: mpf or float = to_numeric(crit_damage)
+        self.resistance: mpf or float = to_numeric(resistance)
+        self.accuracy: mpf or float = to_numeric(accuracy)
+        self.extra_turn_chance: mpf or float = to_numeric(extra_turn_chance)
+        self.counterattack_chance: mpf or float = to_numeric(counterattack_chance)
+        self.reflected_damage_percentage: mpf or float = to_numeric(reflected_damage_percentage)
+        self.life_drain_percentage: mpf or float = to_numeric(life_drain_percentage)
+        self.crit_resist: mpf or float = to_numeric(crit_resist)
+        self.stun_rate: mpf or float = to_numeric(stun_rate)
 
-        return res + ")"
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, vars(self))
 
     def clone(self):
-        # type: () -> LegendaryCreature
+        # type: () -> EffectiveStats
         return copy.deepcopy(self)
 
 
@@ -3417,6 +4967,8 @@ class Item:
     This class contains attributes of an item in this game.
     """
 
+    __slots__ = ("name", "description", "gold_cost", "gem_cost", "sell_gold_gain", "sell_gem_gain")
+
     def __init__(self, name, description, gold_cost, gem_cost):
         # type: (str, str, mpf, mpf) -> None
         self.name: str = name
@@ -3426,19 +4978,17 @@ class Item:
         self.sell_gold_gain: mpf = gold_cost / 5
         self.sell_gem_gain: mpf = gem_cost / 5
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+    def __getstate__(self):
+        # type: () -> dict
+        return get_object_state(self)
 
-            index += 1
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        set_object_state(self, state)
 
-        return res + ")"
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, get_object_state(self))
 
     def clone(self):
         # type: () -> Item
@@ -3450,9 +5000,9 @@ class Egg(Item):
     This class contains attributes of an egg which can be hatched for legendary creatures to come out.
     """
 
-    POTENTIAL_ELEMENTS: list = ["TERRA", "FLAME", "SEA", "NATURE", "ELECTRIC", "ICE", "METAL", "DARK", "LIGHT", "WAR",
-                                "PURE", "LEGEND", "PRIMAL", "WIND", "BEAUTY", "MAGIC", "CHAOS", "HAPPY", "DREAM",
-                                "SOUL"]
+    __slots__ = ("hatch_time", "element", "already_placed")
+
+    POTENTIAL_ELEMENTS: list = ELEMENTS.copy()
 
     def __init__(self, gold_cost, gem_cost, element):
         # type: (mpf, mpf, str) -> None
@@ -3469,6 +5019,10 @@ class Rune(Item):
     This class contains attributes of a rune used to strengthen legendary creatures.
     """
 
+    __slots__ = ("rating", "slot_number", "set_name", "set_size", "main_stat", "__sub_stats", "set_effect_is_active",
+                 "stat_increase", "set_effect", "level", "level_up_gold_cost", "level_up_success_rate",
+                 "already_placed")
+
     MIN_SLOT_NUMBER: int = 1
     MAX_SLOT_NUMBER: int = 6
     MIN_RATING: int = 1
@@ -3478,6 +5032,7 @@ class Rune(Item):
     POTENTIAL_MAIN_STATS: list = ["HP", "HP%", "MP", "MP%", "ATK", "ATK%", "DEF", "DEF%", "SPD", "CR", "CD", "RES",
                                   "ACC"]
     MAX_SUB_STATS: int = 4
+    __SET_EFFECTS: dict = {}  # initial value
 
     def __init__(self, name, description, gold_cost, gem_cost, rating, slot_number, set_name, main_stat):
         # type: (str, str, mpf, mpf, int, int, str, str) -> None
@@ -3492,7 +5047,7 @@ class Rune(Item):
         self.__sub_stats: list = []  # initial value
         self.set_effect_is_active: bool = False
         self.stat_increase: StatIncrease = self.__get_stat_increase()
-        self.set_effect: SetEffect = self.__get_set_effect()
+        self.set_effect: SetEffect = self.get_set_effect(self.set_name)
         self.level: int = 1
         self.level_up_gold_cost: mpf = gold_cost
         self.level_up_success_rate: mpf = mpf("1")
@@ -3500,17 +5055,7 @@ class Rune(Item):
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, get_object_state(self))
 
     def get_sub_stats(self):
         # type: () -> list
@@ -3546,44 +5091,55 @@ class Rune(Item):
             return StatIncrease(accuracy_up=mpf(0.01 * self.rating))
         return StatIncrease()
 
-    def __get_set_effect(self):
-        # type: () -> SetEffect
-        if self.set_name == "ENERGY":
+    @staticmethod
+    def get_set_effect(set_name):
+        # type: (str) -> SetEffect
+        # Set effects never change, so all runes in the same set share one set effect.
+        if set_name not in Rune.__SET_EFFECTS.keys():
+            Rune.__SET_EFFECTS[set_name] = Rune.__create_set_effect(set_name)
+
+        return Rune.__SET_EFFECTS[set_name]
+
+    @staticmethod
+    def __create_set_effect(set_name):
+        # type: (str) -> SetEffect
+        if set_name == "ENERGY":
             return SetEffect(max_hp_percentage_up=mpf("15"))
-        elif self.set_name == "MAGIC":
+        elif set_name == "MAGIC":
             return SetEffect(max_magic_points_percentage_up=mpf("15"))
-        elif self.set_name == "FATAL":
+        elif set_name == "FATAL":
             return SetEffect(attack_percentage_up=mpf("35"))
-        elif self.set_name == "BLADE":
+        elif set_name == "BLADE":
             return SetEffect(crit_rate_up=mpf("0.12"))
-        elif self.set_name == "SWIFT":
+        elif set_name == "SWIFT":
             return SetEffect(attack_speed_percentage_up=mpf("25"))
-        elif self.set_name == "FOCUS":
+        elif set_name == "FOCUS":
             return SetEffect(accuracy_up=mpf("0.2"))
-        elif self.set_name == "GUARD":
+        elif set_name == "GUARD":
             return SetEffect(defense_percentage_up=mpf("20"))
-        elif self.set_name == "ENDURE":
+        elif set_name == "ENDURE":
             return SetEffect(resistance_up=mpf("0.2"))
-        elif self.set_name == "REVENGE":
+        elif set_name == "REVENGE":
             return SetEffect(counterattack_chance_up=mpf("0.15"))
-        elif self.set_name == "VAMPIRE":
+        elif set_name == "VAMPIRE":
             return SetEffect(life_drain_percentage_up=mpf("35"))
-        elif self.set_name == "RAGE":
+        elif set_name == "RAGE":
             return SetEffect(crit_damage_up=mpf("0.4"))
-        elif self.set_name == "VIOLENT":
+        elif set_name == "VIOLENT":
             return SetEffect(extra_turn_chance_up=mpf("0.22"))
-        elif self.set_name == "REFLECT":
+        elif set_name == "REFLECT":
             return SetEffect(reflected_damage_percentage_up=mpf("35"))
-        elif self.set_name == "RESIST":
+        elif set_name == "RESIST":
             return SetEffect(crit_resist_up=mpf("0.15"))
-        elif self.set_name == "DESPAIR":
+        elif set_name == "DESPAIR":
             return SetEffect(stun_rate_up=mpf("0.25"))
         return SetEffect()
 
-    def level_up(self):
-        # type: () -> bool
+    def level_up(self, rng=None):
+        # type: (random.Random or None) -> bool
+        rng = get_random_number_generator(rng)
         # Check whether levelling up is successful or not
-        if random.random() > self.level_up_success_rate:
+        if rng.random() > self.level_up_success_rate:
             return False
 
         # Increase the level of the rune
@@ -3624,7 +5180,7 @@ class Rune(Item):
             print("Cannot increase rune main stat: " + str(self.main_stat) + "\n")
 
         # Add new sub-stat if possible.
-        new_sub_stat: str = self.POTENTIAL_MAIN_STATS[random.randint(0, len(self.POTENTIAL_MAIN_STATS) - 1)]
+        new_sub_stat: str = self.POTENTIAL_MAIN_STATS[rng.randint(0, len(self.POTENTIAL_MAIN_STATS) - 1)]
         if new_sub_stat not in self.__sub_stats and len(self.__sub_stats) < self.MAX_SUB_STATS and \
                 new_sub_stat != self.main_stat:
             self.__sub_stats.append(new_sub_stat)
@@ -3670,6 +5226,12 @@ class SetEffect:
     This class contains attributes of the set effect of a rune.
     """
 
+    __slots__ = ("max_hp_percentage_up", "max_magic_points_percentage_up", "attack_percentage_up",
+                 "defense_percentage_up", "attack_speed_percentage_up", "crit_rate_up", "crit_damage_up",
+                 "resistance_up", "accuracy_up", "extra_turn_chance_up", "counterattack_chance_up",
+                 "reflected_damage_percentage_up", "life_drain_percentage_up", "crit_resist_up", "stun_rate_up",
+                 "__string")
+
     def __init__(self, max_hp_percentage_up=mpf("0"), max_magic_points_percentage_up=mpf("0"),
                  attack_percentage_up=mpf("0"), defense_percentage_up=mpf("0"), attack_speed_percentage_up=mpf("0"),
                  crit_rate_up=mpf("0"), crit_damage_up=mpf("0"), resistance_up=mpf("0"), accuracy_up=mpf("0"),
@@ -3693,19 +5255,29 @@ class SetEffect:
         self.crit_resist_up: mpf = crit_resist_up
         self.stun_rate_up: mpf = stun_rate_up
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+    def __setattr__(self, name, value):
+        # type: (str, object) -> None
+        # The stored string representation is worked out again after any attribute changes.
+        object.__setattr__(self, name, value)
+        if name != "_SetEffect__string":
+            object.__setattr__(self, "_SetEffect__string", None)
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = get_object_state(self)
+        state.pop("_SetEffect__string", None)
+        return state
 
-            index += 1
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__string = None
+        set_object_state(self, state)
 
-        return res + ")"
+    def __str__(self):
+        # type: () -> str
+        if self.__string is None:
+            self.__string = render_object(self, self.__getstate__())
+        return self.__string
 
     def clone(self):
         # type: () -> SetEffect
@@ -3717,6 +5289,10 @@ class StatIncrease:
     This class contains attributes of the increase in stats of a rune.
     """
 
+    __slots__ = ("max_hp_up", "max_hp_percentage_up", "max_magic_points_up", "max_magic_points_percentage_up",
+                 "attack_up", "attack_percentage_up", "defense_up", "defense_percentage_up", "attack_speed_up",
+                 "crit_rate_up", "crit_damage_up", "resistance_up", "accuracy_up", "__string")
+
     def __init__(self, max_hp_up=mpf("0"), max_hp_percentage_up=mpf("0"), max_magic_points_up=mpf("0"),
                  max_magic_points_percentage_up=mpf("0"), attack_up=mpf("0"), attack_percentage_up=mpf("0"),
                  defense_up=mpf("0"), defense_percentage_up=mpf("0"), attack_speed_up=mpf("0"), crit_rate_up=mpf("0"),
@@ -3736,19 +5312,29 @@ class StatIncrease:
         self.resistance_up: mpf = resistance_up
         self.accuracy_up: mpf = accuracy_up
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+    def __setattr__(self, name, value):
+        # type: (str, object) -> None
+        # The stored string representation is worked out again after any attribute changes.
+        object.__setattr__(self, name, value)
+        if name != "_StatIncrease__string":
+            object.__setattr__(self, "_StatIncrease__string", None)
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+    def __getstate__(self):
+        # type: () -> dict
+        state: dict = get_object_state(self)
+        state.pop("_StatIncrease__string", None)
+        return state
 
-            index += 1
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__string = None
+        set_object_state(self, state)
 
-        return res + ")"
+    def __str__(self):
+        # type: () -> str
+        if self.__string is None:
+            self.__string = render_object(self, self.__getstate__())
+        return self.__string
 
     def clone(self):
         # type: () -> StatIncrease
@@ -3760,6 +5346,8 @@ class AwakenShard(Item):
     This class contains attributes of a shard used to awaken a legendary creature.
     """
 
+    __slots__ = ("legendary_creature_element",)
+
     def __init__(self, gold_cost, gem_cost, legendary_creature_element):
         # type: (mpf, mpf, str) -> None
         Item.__init__(self, "AWAKEN SHARD", "A shard used to immediately awaken a legendary creature.", gold_cost,
@@ -3773,6 +5361,8 @@ class EXPShard(Item):
     This class contains attributes of a shard used to increase the EXP of legendary creatures.
     """
 
+    __slots__ = ("exp_granted",)
+
     def __init__(self, gold_cost, gem_cost, exp_granted):
         # type: (mpf, mpf, mpf) -> None
         Item.__init__(self, "EXP SHARD", "A shard used to immediately increase the EXP of a legendary creature.",
@@ -3785,6 +5375,8 @@ class LevelUpShard(Item):
     This class contains attributes of a level up shard used to immediately level up a legendary creature.
     """
 
+    __slots__ = ()
+
     def __init__(self, gold_cost, gem_cost):
         # type: (mpf, mpf) -> None
         Item.__init__(self, "LEVEL UP SHARD", "A shard used to immediately increase the level of a legendary creature.",
@@ -3796,6 +5388,8 @@ class SkillLevelUpShard(Item):
     This class contains attributes of a skill level up shard to level up skills owned by legendary creatures.
     """
 
+    __slots__ = ()
+
     def __init__(self, gold_cost, gem_cost):
         # type: (mpf, mpf) -> None
         Item.__init__(self, "SKILL LEVEL UP SHARD", "A shard used to immediately increase the level of a "
@@ -3817,17 +5411,7 @@ class Skill:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def level_up(self):
         # type: () -> None
@@ -3922,9 +5506,13 @@ class PassiveSkillEffect:
                  attack_power_percentage_up=mpf("0"), defense_percentage_up=mpf("0"),
                  attack_speed_percentage_up=mpf("0"), crit_rate_up=mpf("0"), crit_damage_up=mpf("0"),
                  resistance_up=mpf("0"), accuracy_up=mpf("0"), extra_turn_chance_up=mpf("0"),
-                 beneficial_effects_to_allies=mpf("0"), harmful_effects_to_enemies=mpf("0"),
+                 beneficial_effects_to_allies=None, harmful_effects_to_enemies=None,
                  allies_attack_gauge_up=mpf("0"), enemies_attack_gauge_down=mpf("0"), heal_amount_to_allies=mpf("0")):
         # type: (mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, mpf, list, list, mpf, mpf, mpf) -> None
+        if beneficial_effects_to_allies is None:
+            beneficial_effects_to_allies = []
+        if harmful_effects_to_enemies is None:
+            harmful_effects_to_enemies = []
         self.max_hp_percentage_up: mpf = max_hp_percentage_up
         self.max_magic_points_percentage_up: mpf = max_magic_points_percentage_up
         self.attack_power_percentage_up: mpf = attack_power_percentage_up
@@ -3943,17 +5531,7 @@ class PassiveSkillEffect:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def get_beneficial_effects_to_allies(self):
         # type: () -> list
@@ -4001,17 +5579,7 @@ class LeaderSkillEffect:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def clone(self):
         # type: () -> LeaderSkillEffect
@@ -4047,60 +5615,69 @@ class DamageMultiplier:
 
     def calculate_raw_damage_without_enemy_defense_invincibility_shield(self, user, target):
         # type: (LegendaryCreature, LegendaryCreature) -> mpf
+        multiplier_to_self_max_hp: mpf = to_numeric(self.multiplier_to_self_max_hp)
+        multiplier_to_enemy_max_hp: mpf = to_numeric(self.multiplier_to_enemy_max_hp)
+        multiplier_to_self_attack_speed: mpf = to_numeric(self.multiplier_to_self_attack_speed)
+        multiplier_to_self_attack_power: mpf = to_numeric(self.multiplier_to_self_attack_power)
+        multiplier_to_enemy_attack_speed: mpf = to_numeric(self.multiplier_to_enemy_attack_speed)
+        multiplier_to_enemy_attack_power: mpf = to_numeric(self.multiplier_to_enemy_attack_power)
+        multiplier_to_self_defense: mpf = to_numeric(self.multiplier_to_self_defense)
+        multiplier_to_enemy_defense: mpf = to_numeric(self.multiplier_to_enemy_defense)
+        multiplier_to_self_max_magic_points: mpf = to_numeric(self.multiplier_to_self_max_magic_points)
+        multiplier_to_enemy_max_magic_points: mpf = to_numeric(self.multiplier_to_enemy_max_magic_points)
+        multiplier_to_self_current_hp_percentage: mpf = to_numeric(self.multiplier_to_self_current_hp_percentage)
+        multiplier_to_self_hp_percentage_loss: mpf = to_numeric(self.multiplier_to_self_hp_percentage_loss)
+        multiplier_to_enemy_current_hp_percentage: mpf = to_numeric(self.multiplier_to_enemy_current_hp_percentage)
         self_current_hp_percentage: mpf = (user.curr_hp / user.max_hp) * 100
         self_hp_percentage_loss: mpf = 100 - self_current_hp_percentage
         target_current_hp_percentage: mpf = (target.curr_hp / target.max_hp) * 100
-        return (user.max_hp * (1 + user.max_hp_percentage_up / 100) * self.multiplier_to_self_max_hp +
-                target.max_hp * self.multiplier_to_enemy_max_hp * (1 + target.max_hp_percentage_up / 100) +
+        return (user.max_hp * (1 + user.max_hp_percentage_up / 100) * multiplier_to_self_max_hp +
+                target.max_hp * multiplier_to_enemy_max_hp * (1 + target.max_hp_percentage_up / 100) +
                 user.attack_power * (1 + user.attack_power_percentage_up / 100 -
                                      user.attack_power_percentage_down / 100) *
-                (self.multiplier_to_self_attack_speed * user.attack_speed * (1 + user.attack_speed_percentage_up / 100 -
+                (multiplier_to_self_attack_speed * user.attack_speed * (1 + user.attack_speed_percentage_up / 100 -
                                                                              user.attack_speed_percentage_down / 100))
-                * self.multiplier_to_self_attack_power + target.attack_power * (
+                * multiplier_to_self_attack_power + target.attack_power * (
                         1 + target.attack_power_percentage_up / 100
                         - target.attack_power_percentage_down / 100) + target.attack_power * (1 +
                                                                                               target.attack_power_percentage_up / 100 - target.attack_power_percentage_down / 100) *
-                (self.multiplier_to_enemy_attack_speed * target.attack_speed * (1 + target.attack_speed_percentage_up /
-                                                                                100 - target.attack_speed_percentage_down / 100)) * self.multiplier_to_enemy_attack_power
+                (multiplier_to_enemy_attack_speed * target.attack_speed * (1 + target.attack_speed_percentage_up /
+                                                                                100 - target.attack_speed_percentage_down / 100)) * multiplier_to_enemy_attack_power
                 + user.defense * (1 + user.defense_percentage_up / 100 -
-                                  user.defense_percentage_down / 100) * self.multiplier_to_self_defense +
+                                  user.defense_percentage_down / 100) * multiplier_to_self_defense +
                 target.defense * (1 + target.defense_percentage_up / 100 - target.defense_percentage_down / 100) *
-                self.multiplier_to_enemy_defense + user.max_magic_points * (1 + user.max_magic_points_percentage_up
+                multiplier_to_enemy_defense + user.max_magic_points * (1 + user.max_magic_points_percentage_up
                                                                             / 100) *
-                self.multiplier_to_self_max_magic_points + target.max_magic_points * (1 +
+                multiplier_to_self_max_magic_points + target.max_magic_points * (1 +
                                                                                       target.max_magic_points_percentage_up / 100) *
-                self.multiplier_to_enemy_max_magic_points) * (1 + self_current_hp_percentage *
-                                                              self.multiplier_to_self_current_hp_percentage) * (
+                multiplier_to_enemy_max_magic_points) * (1 + self_current_hp_percentage *
+                                                              multiplier_to_self_current_hp_percentage) * (
                        1 + self_hp_percentage_loss *
-                       self.multiplier_to_self_hp_percentage_loss) * (1 + target_current_hp_percentage *
-                                                                      self.multiplier_to_enemy_current_hp_percentage) * (
+                       multiplier_to_self_hp_percentage_loss) * (1 + target_current_hp_percentage *
+                                                                      multiplier_to_enemy_current_hp_percentage) * (
                        1 + target.damage_received_percentage_up / 100)
 
     def calculate_raw_damage(self, user, target, does_ignore_defense=False, does_ignore_shield=False,
-                             does_ignore_invincibility=False):
-        # type: (LegendaryCreature, LegendaryCreature, bool, bool, bool) -> mpf
-        damage_reduction_factor: mpf = mpf("1") if does_ignore_defense else mpf("1e8") / (mpf("1e8") +
-                                                                                          3.5 * target.defense)
+                             does_ignore_invincibility=False, rng=None):
+        # type: (LegendaryCreature, LegendaryCreature, bool, bool, bool, random.Random or None) -> mpf
+        damage_reduction_factor: mpf = to_numeric(1) if does_ignore_defense else 1e8 / (1e8 + 3.5 * target.defense)
         raw_damage: mpf = self.calculate_raw_damage_without_enemy_defense_invincibility_shield(user, target)
         if not does_ignore_shield and target.shield_percentage > 0:
             raw_damage *= (1 - target.shield_percentage / 100)
 
         if not (does_ignore_invincibility or target.can_receive_damage):
-            return mpf("0")
+            return to_numeric(0)
 
         # Checking for damage multiplier by element
-        damage_multiplier_by_element: mpf = mpf("0")  # initial value
-        for element in user.get_elements():
-            curr_multiplier: mpf = get_elemental_damage_multiplier(element, target.get_elements()[0])
-            if curr_multiplier > damage_multiplier_by_element:
-                damage_multiplier_by_element = curr_multiplier
+        damage_multiplier_by_element: float = \
+            user.get_best_elemental_damage_multipliers()[target.get_element_ids()[0]]
 
         # Checking for critical hits
         crit_chance: mpf = user.crit_rate + user.crit_rate_up - target.crit_resist - target.crit_resist_up
         if crit_chance < LegendaryCreature.MIN_CRIT_RATE:
             crit_chance = LegendaryCreature.MIN_CRIT_RATE
 
-        is_crit: bool = random.random() < crit_chance
+        is_crit: bool = get_random_number_generator(rng).random() < crit_chance
         return raw_damage * damage_reduction_factor if not is_crit else raw_damage * (user.crit_damage +
                                                                                       user.crit_damage_up) * \
                                                                         damage_reduction_factor * \
@@ -4112,17 +5689,7 @@ class DamageMultiplier:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
 
 class BeneficialEffect:
@@ -4130,6 +5697,11 @@ class BeneficialEffect:
     This class contains attributes of a beneficial effect a legendary creature has.
     """
 
+    __slots__ = ("name", "number_of_turns", "attack_power_percentage_up", "attack_speed_percentage_up",
+                 "defense_percentage_up", "crit_rate_up", "prevents_damage", "blocks_debuffs", "prevents_death",
+                 "heal_percentage_per_turn", "counterattack_chance_up", "reflected_damage_percentage_up",
+                 "life_drain_percentage_up", "crit_resist_up", "shield_percentage_up", "can_be_stacked")
+
     POSSIBLE_NAMES: list = ["INCREASE_ATK", "INCREASE_DEF", "INCREASE_SPD", "INCREASE_CRIT_RATE", "IMMUNITY",
                             "INVINCIBILITY", "HEAL_OVER_TIME", "COUNTER", "REFLECT", "VAMPIRE",
                             "INCREASE_CRIT_RESIST", "SHIELD", "ENDURE"]
@@ -4153,19 +5725,17 @@ class BeneficialEffect:
         self.shield_percentage_up: mpf = mpf("15") if self.name == "SHIELD" else mpf("0")
         self.can_be_stacked: bool = self.name == "HEAL_OVER_TIME"
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+    def __getstate__(self):
+        # type: () -> dict
+        return get_object_state(self)
 
-            index += 1
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        set_object_state(self, state)
 
-        return res + ")"
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, get_object_state(self))
 
     def clone(self):
         # type: () -> BeneficialEffect
@@ -4177,6 +5747,11 @@ class HarmfulEffect:
     This class contains attributes of a harmful effect a legendary creature has.
     """
 
+    __slots__ = ("name", "number_of_turns", "attack_power_percentage_down", "attack_speed_percentage_down",
+                 "defense_percentage_down", "blocks_beneficial_effects", "damage_received_percentage_up", "blocks_heal",
+                 "blocks_passive_skills", "blocks_skills_with_cooltime", "damage_percentage_per_turn", "prevents_moves",
+                 "can_be_stacked")
+
     POSSIBLE_NAMES: list = ["DECREASE_ATK", "DECREASE_DEF", "DECREASE_SPD", "BLOCK_BENEFICIAL_EFFECTS",
                             "BRAND", "UNRECOVERABLE", "OBLIVION", "SILENCE", "DAMAGE_OVER_TIME", "STUN"]
 
@@ -4196,19 +5771,17 @@ class HarmfulEffect:
         self.prevents_moves: bool = self.name == "STUN"
         self.can_be_stacked: bool = self.name == "DAMAGE_OVER_TIME"
 
-    def __str__(self):
-        # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
+    def __getstate__(self):
+        # type: () -> dict
+        return get_object_state(self)
 
-            index += 1
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        set_object_state(self, state)
 
-        return res + ")"
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, get_object_state(self))
 
     def clone(self):
         # type: () -> HarmfulEffect
@@ -4234,17 +5807,7 @@ class Building:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def level_up(self):
         # type: () -> None
@@ -4596,9 +6159,7 @@ class Habitat(Building):
     This class contains attributes of a habitat where legendary creatures live.
     """
 
-    POTENTIAL_ELEMENTS: list = ["TERRA", "FLAME", "SEA", "NATURE", "ELECTRIC", "ICE", "METAL", "DARK", "LIGHT", "WAR",
-                                "PURE", "LEGEND", "PRIMAL", "WIND", "BEAUTY", "MAGIC", "CHAOS", "HAPPY", "DREAM",
-                                "SOUL"]
+    POTENTIAL_ELEMENTS: list = ELEMENTS.copy()
     MAX_LEGENDARY_CREATURES: int = 10
 
     def __init__(self, gold_cost, gem_cost, element, player_gold_per_second_increase):
@@ -4642,11 +6203,12 @@ class Obstacle(Building):
     This class contains attributes of an obstacle to be removed by the player.
     """
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, rng=None):
+        # type: (random.Random or None) -> None
         Building.__init__(self, "OBSTACLE", "A removable obstacle.", mpf("0"), mpf("0"))
-        self.remove_gold_gain: mpf = mpf("10") ** random.randint(5, 10)
-        self.remove_gem_gain: mpf = mpf("10") ** random.randint(2, 6)
+        rng = get_random_number_generator(rng)
+        self.remove_gold_gain: mpf = mpf("10") ** rng.randint(5, 10)
+        self.remove_gem_gain: mpf = mpf("10") ** rng.randint(2, 6)
 
 
 class TempleOfWishes(Building):
@@ -4655,10 +6217,10 @@ class TempleOfWishes(Building):
     """
 
     def __init__(self, gold_cost, gem_cost, obtainable_objects):
-        # type: (mpf, mpf, list) -> None
+        # type: (mpf, mpf, list or CatalogueView) -> None
         Building.__init__(self, "TEMPLE OF WISHES", "A building where the player can make wishes to get random rewards",
                           gold_cost, gem_cost)
-        self.__obtainable_objects: list = obtainable_objects
+        self.__obtainable_objects: list or CatalogueView = obtainable_objects
         self.wishes_left: int = 3  # The number of wishes a player can make in a day.
         self.already_reset: bool = False
         self.upgrade_gold_cost = mpf("0")
@@ -4678,21 +6240,211 @@ class TempleOfWishes(Building):
         self.already_reset = False
 
     def get_obtainable_objects(self):
-        # type: () -> list
+        # type: () -> list or CatalogueView
         return self.__obtainable_objects
 
 
-class FusionCenter(Building):
-    """
-    This class contains attributes of a building used to fuse legendary creatures.
-    """
+class FusionCenter(Building):
+    """
+    This class contains attributes of a building used to fuse legendary creatures.
+    """
+
+    def __init__(self, gold_cost, gem_cost):
+        # type: (mpf, mpf) -> None
+        Building.__init__(self, "FUSION CENTER", "A building used to fuse legendary creatures into a stronger one.",
+                          gold_cost, gem_cost)
+        self.upgrade_gold_cost = mpf("0")
+        self.upgrade_gem_cost = mpf("0")
+
+
+def create_rune_for_sale(rating, slot_number, set_name, main_stat):
+    # type: (int, int, str, str) -> Rune
+    name: str = str(rating) + "-STAR " + str(set_name).upper() + " RUNE - SLOT " + str(slot_number)
+    description: str = str(set_name).upper() + " rune of rating " + str(rating) + " at slot " + str(slot_number)
+    gold_cost: mpf = mpf("10") ** (6 + 5 * (rating - 1))
+    gem_cost: mpf = 0 if rating == 1 else 10 * triangular(rating)
+    return Rune(name, description, gold_cost, gem_cost, rating, slot_number, set_name, main_stat)
+
+
+class RuneCatalogue:
+    """
+    This class contains attributes of the catalogue of runes sold in the item shop. A rune is only created when it
+    is looked up by its index, in the order rating, slot number, set name and main stat.
+    """
+
+    NUM_SLOTS: int = Rune.MAX_SLOT_NUMBER - Rune.MIN_SLOT_NUMBER + 1
+    NUM_RUNES_PER_RATING: int = NUM_SLOTS * len(Rune.POTENTIAL_SET_NAMES) * len(Rune.POTENTIAL_MAIN_STATS)
+
+    def get_rune_attributes(self, index):
+        # type: (int) -> tuple
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError("rune catalogue index out of range")
+
+        index, main_stat_index = divmod(index, len(Rune.POTENTIAL_MAIN_STATS))
+        index, set_name_index = divmod(index, len(Rune.POTENTIAL_SET_NAMES))
+        rating_index, slot_index = divmod(index, self.NUM_SLOTS)
+        return Rune.MIN_RATING + rating_index, Rune.MIN_SLOT_NUMBER + slot_index, \
+            Rune.POTENTIAL_SET_NAMES[set_name_index], Rune.POTENTIAL_MAIN_STATS[main_stat_index]
+
+    def __len__(self):
+        # type: () -> int
+        return (Rune.MAX_RATING - Rune.MIN_RATING + 1) * self.NUM_RUNES_PER_RATING
+
+    def __getitem__(self, index):
+        # type: (int or slice) -> Rune or list
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return create_rune_for_sale(*self.get_rune_attributes(index))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __str__(self):
+        # type: () -> str
+        return str(type(self).__name__) + "(number_of_runes=" + str(len(self)) + ")"
+
+    def clone(self):
+        # type: () -> RuneCatalogue
+        return copy.deepcopy(self)
+
+
+class CatalogueView:
+    """
+    This class contains attributes of a read-only view joining several catalogues into one index-addressable list
+    without creating the objects in them.
+    """
+
+    def __init__(self, catalogues):
+        # type: (list) -> None
+        self.__catalogues: list = catalogues
+
+    def __len__(self):
+        # type: () -> int
+        return sum(len(catalogue) for catalogue in self.__catalogues)
+
+    def __getitem__(self, index):
+        # type: (int or slice) -> object
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if index >= 0:
+            for catalogue in self.__catalogues:
+                if index < len(catalogue):
+                    return catalogue[index]
+
+                index -= len(catalogue)
+
+        raise IndexError("catalogue index out of range")
+
+    def __iter__(self):
+        for catalogue in self.__catalogues:
+            yield from catalogue
+
+    def __str__(self):
+        # type: () -> str
+        return str(type(self).__name__) + "(number_of_objects=" + str(len(self)) + ")"
+
+    def get_catalogues(self):
+        # type: () -> list
+        return self.__catalogues
+
+    def clone(self):
+        # type: () -> CatalogueView
+        return copy.deepcopy(self)
+
+
+class CatalogueTemplate:
+    """
+    This class contains attributes of the immutable definition of an object sold in a catalogue (e.g., an egg in the
+    item shop or a building in the building shop). A template is shared rather than copied and the object is created
+    from it whenever it is needed.
+    """
+
+    __slots__ = ("object_class", "arguments")
+
+    def __init__(self, object_class, *arguments):
+        # type: (type, object) -> None
+        object.__setattr__(self, "object_class", object_class)
+        object.__setattr__(self, "arguments", arguments)
+
+    def __setattr__(self, name, value):
+        # type: (str, object) -> None
+        raise AttributeError("Cannot change the attribute '" + str(name) + "' of a catalogue template!")
+
+    def __delattr__(self, name):
+        # type: (str) -> None
+        raise AttributeError("Cannot delete the attribute '" + str(name) + "' of a catalogue template!")
+
+    def __reduce__(self):
+        return CatalogueTemplate, (self.object_class,) + self.arguments
+
+    def __copy__(self):
+        # type: () -> CatalogueTemplate
+        return self
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> CatalogueTemplate
+        return self
+
+    def __str__(self):
+        # type: () -> str
+        return str(type(self).__name__) + "(object_class=" + str(self.object_class.__name__) + ", arguments=" + \
+            str([str(argument) for argument in self.arguments]) + ")"
+
+    def create(self):
+        # type: () -> object
+        return self.object_class(*self.arguments)
+
+    def clone(self):
+        # type: () -> CatalogueTemplate
+        return self
+
+
+class TemplateCatalogue:
+    """
+    This class contains attributes of a catalogue of objects created from their templates when they are looked up by
+    their indices, so an object bought from the catalogue never shares its state with the catalogue or with another
+    object bought from it.
+    """
+
+    def __init__(self, templates):
+        # type: (list) -> None
+        self.__templates: list = templates
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.__templates)
+
+    def __getitem__(self, index):
+        # type: (int or slice) -> object
+        if isinstance(index, slice):
+            return [template.create() for template in self.__templates[index]]
+
+        return self.__templates[index].create()
+
+    def __iter__(self):
+        for template in self.__templates:
+            yield template.create()
+
+    def __str__(self):
+        # type: () -> str
+        return str(type(self).__name__) + "(number_of_templates=" + str(len(self)) + ")"
+
+    def get_templates(self):
+        # type: () -> list
+        return self.__templates
 
-    def __init__(self, gold_cost, gem_cost):
-        # type: (mpf, mpf) -> None
-        Building.__init__(self, "FUSION CENTER", "A building used to fuse legendary creatures into a stronger one.",
-                          gold_cost, gem_cost)
-        self.upgrade_gold_cost = mpf("0")
-        self.upgrade_gem_cost = mpf("0")
+    def clone(self):
+        # type: () -> TemplateCatalogue
+        return copy.deepcopy(self)
 
 
 class ItemShop:
@@ -4701,26 +6453,16 @@ class ItemShop:
     """
 
     def __init__(self, items_sold):
-        # type: (list) -> None
+        # type: (list or CatalogueView) -> None
         self.name: str = "ITEM SHOP"
-        self.__items_sold: list = items_sold
+        self.__items_sold: list or CatalogueView = items_sold
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def get_items_sold(self):
-        # type: () -> list
+        # type: () -> list or CatalogueView
         return self.__items_sold
 
     def clone(self):
@@ -4728,32 +6470,159 @@ class ItemShop:
         return copy.deepcopy(self)
 
 
+class Listing:
+    """
+    This class contains attributes of a view of a list of objects (e.g. items sold in the item shop), which shows the
+    objects page by page and can filter them.
+    """
+
+    PAGE_SIZE: int = 10
+    # The attributes of objects which objects can be filtered by
+    FILTERS: dict = {
+        "SET": "set_name",
+        "SLOT": "slot_number",
+        "RATING": "rating",
+        "MAIN STAT": "main_stat",
+        "ELEMENT": "element",
+        "TYPE": "__class__"
+    }
+    COMMANDS_HELP: str = "Enter 'NEXT' or 'PREVIOUS' to see another page, 'PAGE' followed by a page number to go to " \
+                         "that page, 'FILTER' followed by one of " + ", ".join(FILTERS.keys()) + " and a value to " \
+                         "only show matching objects, or 'CLEAR FILTERS' to show all objects again."
+
+    def __init__(self, objects, object_name, page_size=PAGE_SIZE):
+        # type: (list or CatalogueView, str, int) -> None
+        self.__objects: list or CatalogueView = objects
+        self.object_name: str = object_name
+        self.page_size: int = page_size
+        self.page_number: int = 1
+        self.__filters: dict = {}  # initial value
+        # The indices of the objects matching the filters, which is None if there are no filters
+        self.__matching_indices: list or None = None
+
+    @staticmethod
+    def get_filter_values(obj, filter_name):
+        # type: (object, str) -> list
+        if filter_name == "ELEMENT" and isinstance(obj, LegendaryCreature):
+            return obj.get_elements()
+        elif filter_name == "TYPE":
+            return [type(obj).__name__]
+
+        return [getattr(obj, Listing.FILTERS[filter_name])] if hasattr(obj, Listing.FILTERS[filter_name]) else []
+
+    def add_filter(self, filter_name, value):
+        # type: (str, object) -> bool
+        if filter_name not in self.FILTERS.keys():
+            return False
+
+        self.__filters[filter_name] = str(value).upper()
+        self.__matching_indices = [index for index in range(len(self.__objects)) if
+                                   self.__matches(self.__objects[index])]
+        self.page_number = 1
+        return True
+
+    def clear_filters(self):
+        # type: () -> None
+        self.__filters = {}
+        self.__matching_indices = None
+        self.page_number = 1
+
+    def __matches(self, obj):
+        # type: (object) -> bool
+        for filter_name, value in self.__filters.items():
+            if value not in [str(curr_value).upper() for curr_value in self.get_filter_values(obj, filter_name)]:
+                return False
+        return True
+
+    def get_number_of_objects(self):
+        # type: () -> int
+        return len(self.__objects)
+
+    def get_number_of_matches(self):
+        # type: () -> int
+        return len(self.__objects) if self.__matching_indices is None else len(self.__matching_indices)
+
+    def get_number_of_pages(self):
+        # type: () -> int
+        return max(1, -(-self.get_number_of_matches() // self.page_size))
+
+    def set_page_number(self, page_number):
+        # type: (int) -> bool
+        if 1 <= page_number <= self.get_number_of_pages():
+            self.page_number = page_number
+            return True
+        return False
+
+    def get_page(self):
+        # type: () -> list
+        """
+        Getting the objects on the current page without looking at the objects on any other page unless there are
+        filters.
+        :return: a list of tuples of the indices of the objects (starting from 1) and the objects
+        """
+
+        start: int = (self.page_number - 1) * self.page_size
+        stop: int = min(start + self.page_size, self.get_number_of_matches())
+        indices: range or list = range(start, stop) if self.__matching_indices is None else \
+            self.__matching_indices[start:stop]
+        return [(index + 1, self.__objects[index]) for index in indices]
+
+    def render_page(self):
+        # type: () -> str
+        res: str = ""  # initial value
+        for index, obj in self.get_page():
+            res += str(self.object_name) + " #" + str(index) + "\n" + str(obj) + "\n\n"
+
+        filters: str = "" if len(self.__filters) == 0 else ", filtered by " + ", ".join(
+            str(filter_name) + " " + str(value) for filter_name, value in self.__filters.items())
+        return res + "Page " + str(self.page_number) + " of " + str(self.get_number_of_pages()) + " (" + \
+            str(self.get_number_of_matches()) + " of " + str(self.get_number_of_objects()) + " " + \
+            str(self.object_name).lower() + "s" + filters + ")"
+
+    def run_command(self, command):
+        # type: (object) -> bool
+        """
+        Running a command entered by the player to change the page shown or the filters.
+        :return: True if the command is a valid command, False otherwise
+        """
+
+        command = str(command).strip().upper()
+        if command == "NEXT":
+            return self.set_page_number(self.page_number + 1)
+        elif command == "PREVIOUS":
+            return self.set_page_number(self.page_number - 1)
+        elif command.startswith("PAGE ") and command[5:].strip().isdigit():
+            return self.set_page_number(int(command[5:]))
+        elif command == "CLEAR FILTERS":
+            self.clear_filters()
+            return True
+        elif command.startswith("FILTER "):
+            for filter_name in self.FILTERS.keys():
+                if command[7:].startswith(filter_name + " "):
+                    return self.add_filter(filter_name, command[8 + len(filter_name):].strip())
+        return False
+
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, vars(self))
+
+
 class BuildingShop:
     """
     This class contains attributes of a shop selling buildings.
     """
 
     def __init__(self, buildings_sold):
-        # type: (list) -> None
+        # type: (list or TemplateCatalogue) -> None
         self.name: str = "BUILDING SHOP"
-        self.__buildings_sold: list = buildings_sold
+        self.__buildings_sold: list or TemplateCatalogue = buildings_sold
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def get_buildings_sold(self):
-        # type: () -> list
+        # type: () -> list or TemplateCatalogue
         return self.__buildings_sold
 
     def clone(self):
@@ -4780,17 +6649,7 @@ class Reward:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
-
-            if index < len(vars(self).items()) - 1:
-                res += ", "
-
-            index += 1
-
-        return res + ")"
+        return render_object(self, vars(self))
 
     def get_player_reward_items(self):
         # type: () -> list
@@ -4820,135 +6679,585 @@ class Game:
 
     def __str__(self):
         # type: () -> str
-        res: str = str(type(self).__name__) + "("  # initial value
-        index: int = 0  # initial value
-        for item in vars(self).items():
-            res += str(item[0]) + "=" + str(item[1])
+        return render_object(self, vars(self))
+
+    def clone(self):
+        # type: () -> Game
+        return copy.deepcopy(self)
 
-            if index < len(vars(self).items()) - 1:
-                res += ", "
 
-            index += 1
+class GameDataPickler(pickle.Pickler):
+    """
+    This class contains attributes of a pickler writing saved game data, which writes the catalogues created by the
+    game (e.g., the item shop and the building shop) as references to them rather than writing their contents.
+    """
 
-        return res + ")"
+    def __init__(self, file, catalogues):
+        # type: (object, dict) -> None
+        pickle.Pickler.__init__(self, file, pickle.HIGHEST_PROTOCOL)
+        self.__catalogue_ids: dict = {id(catalogue): catalogue_id for catalogue_id, catalogue in catalogues.items()}
 
-    def clone(self):
+    def persistent_id(self, obj):
+        # type: (object) -> str or None
+        return self.__catalogue_ids.get(id(obj))
+
+
+class GameDataUnpickler(pickle.Unpickler):
+    """
+    This class contains attributes of an unpickler reading saved game data, which replaces references to catalogues
+    with the catalogues created by the game.
+    """
+
+    def __init__(self, file, catalogues):
+        # type: (object, dict) -> None
+        pickle.Unpickler.__init__(self, file)
+        self.__catalogues: dict = catalogues
+
+    def persistent_load(self, pid):
+        # type: (str) -> object
+        if pid not in self.__catalogues:
+            raise pickle.UnpicklingError("Unknown catalogue in saved game data: " + str(pid))
+
+        return self.__catalogues[pid]
+
+
+class GameJournal:
+    """
+    This class contains attributes of the autosave journal of a game. Changes made by the player are appended to the
+    journal as they happen and the journal is compacted into saved game data of the whole game from time to time.
+    """
+
+    # The resources of the player change over time between changes, so they are written with every change.
+    RESOURCE_ATTRIBUTES: list = ["level", "exp", "required_exp", "exp_per_second", "gold", "gold_per_second", "gems",
+                                 "gems_per_second", "gold_remainder", "gems_remainder", "food", "food_per_second",
+                                 "seconds_passed", "last_seen"]
+
+    def __init__(self, file_name, max_changes=100, compaction_interval=timedelta(minutes=5), profile_store=None,
+                 profile_name=None):
+        # type: (str, int, timedelta, ProfileStore or None, str or None) -> None
+        self.file_name: str = file_name
+        # The saved game data is kept in the profile store rather than in the file if a profile store is given
+        self.profile_store: ProfileStore or None = profile_store
+        self.profile_name: str or None = profile_name
+        self.journal_file_name: str = get_hidden_file_name(file_name, ".journal")
+        self.max_changes: int = max_changes
+        self.compaction_interval: timedelta = compaction_interval
+        self.number_of_changes: int = 0
+        self.last_compaction_time: datetime = datetime.now()
+        self.__saved_game_data_checksum: int = 0
+
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, vars(self))
+
+    def load(self):
         # type: () -> Game
+        """
+        Loading the saved game data and replaying the changes in the journal which were made after it was saved.
+        :return: the loaded game
+        """
+
+        data: bytes
+        if self.profile_store is not None:
+            data = self.profile_store.read_saved_game_data(self.profile_name)
+            if data is None:
+                raise FileNotFoundError("No saved game data for " + str(self.profile_name) + " in the profile store!")
+        else:
+            with open(self.file_name, "rb") as save_file:
+                data = save_file.read()
+
+        game_data: Game = deserialise_game_data(data)
+        self.__saved_game_data_checksum = zlib.crc32(data)
+        self.replay(game_data)
+        self.compact(game_data)
+        return game_data
+
+    def replay(self, game_data):
+        # type: (Game) -> int
+        """
+        Applying the changes in the journal to the game. Replaying stops at an incomplete change (e.g., one being
+        written when the game crashed) or at a change which no longer applies to the game.
+        :return: the number of changes applied
+        """
+
+        try:
+            with open(self.journal_file_name, "rb") as journal_file:
+                data: bytes = journal_file.read()
+        except FileNotFoundError:
+            return 0
+
+        # The journal starts with the checksum of the saved game data it was written after. A journal written after
+        # older saved game data has already been compacted into the saved game data.
+        if len(data) < 4 or int.from_bytes(data[:4], "big") != self.__saved_game_data_checksum:
+            return 0
+
+        number_of_changes: int = 0  # initial value
+        position: int = 4  # initial value
+        while position + 8 <= len(data):
+            size: int = int.from_bytes(data[position:position + 4], "big")
+            change: bytes = data[position + 8:position + 8 + size]
+            if len(change) < size or zlib.crc32(change) != int.from_bytes(data[position + 4:position + 8], "big"):
+                break
+
+            operation, arguments, resources = GameDataUnpickler(io.BytesIO(change), get_game_catalogues()).load()
+            for attribute, value in resources.items():
+                setattr(game_data.player_data, attribute, value)
+
+            if not self.__apply_change(game_data.player_data, operation, arguments):
+                break
+
+            number_of_changes += 1
+            position += 8 + size
+
+        return number_of_changes
+
+    def compact(self, game_data):
+        # type: (Game) -> None
+        data: bytes = serialise_game_data(game_data)
+        if self.profile_store is not None:
+            self.profile_store.write_saved_game_data(self.profile_name, game_data, data)
+        else:
+            write_file_atomically(self.file_name, data)
+
+        self.__saved_game_data_checksum = zlib.crc32(data)
+        if os.path.exists(self.journal_file_name):
+            os.remove(self.journal_file_name)
+
+        self.number_of_changes = 0
+        self.last_compaction_time = datetime.now()
+
+    def compact_if_due(self, game_data):
+        # type: (Game) -> bool
+        if self.number_of_changes >= self.max_changes or \
+                datetime.now() - self.last_compaction_time >= self.compaction_interval:
+            self.compact(game_data)
+            return True
+        return False
+
+    def purchase_item(self, game_data, item):
+        # type: (Game, Item) -> bool
+        return self.__make_change(game_data, "PURCHASE ITEM", (item,), (item,))
+
+    def build_at_section_tile(self, game_data, section_index, tile_x, tile_y, building):
+        # type: (Game, int, int, int, Building) -> bool
+        return self.__make_change(game_data, "BUILD AT SECTION TILE", (section_index, tile_x, tile_y, building),
+                                  (section_index, tile_x, tile_y, building))
+
+    def claim_reward(self, game_data, reward):
+        # type: (Game, Reward) -> bool
+        return self.__make_change(game_data, "CLAIM REWARD", (reward,), (reward,))
+
+    def sell_item(self, game_data, item):
+        # type: (Game, Item) -> bool
+        return self.__make_change(game_data, "SELL ITEM", (item,), (self.__serialise_item(item),))
+
+    def place_rune_on_legendary_creature(self, game_data, legendary_creature, rune):
+        # type: (Game, LegendaryCreature, Rune) -> bool
+        return self.__make_change(game_data, "PLACE RUNE", (legendary_creature, rune),
+                                  (legendary_creature.legendary_creature_id, self.__serialise_item(rune)))
+
+    def remove_rune_from_legendary_creature(self, game_data, legendary_creature, slot_number):
+        # type: (Game, LegendaryCreature, int) -> bool
+        return self.__make_change(game_data, "REMOVE RUNE", (legendary_creature, slot_number),
+                                  (legendary_creature.legendary_creature_id, slot_number))
+
+    @staticmethod
+    def __serialise_item(item):
+        # type: (Item) -> bytes
+        # Items in the item inventory are written as their contents, and the item changed when the change is replayed
+        # is an item in the item inventory with the same contents. Positions in the item inventory are not used as
+        # they change with changes which are not written to the journal (e.g., hatching eggs).
+        buffer: io.BytesIO = io.BytesIO()
+        GameDataPickler(buffer, get_game_catalogues()).dump(item)
+        return buffer.getvalue()
+
+    @staticmethod
+    def __find_item(player_data, item_data):
+        # type: (Player, bytes) -> Item or None
+        for item in player_data.item_inventory.get_items():
+            if GameJournal.__serialise_item(item) == item_data:
+                return item
+        return None
+
+    def __make_change(self, game_data, operation, arguments, saved_arguments):
+        # type: (Game, str, tuple, tuple) -> bool
+        # The change is written before it is made as making it changes the resources of the player.
+        buffer: io.BytesIO = io.BytesIO()
+        GameDataPickler(buffer, get_game_catalogues()).dump((operation, saved_arguments, {
+            attribute: getattr(game_data.player_data, attribute) for attribute in self.RESOURCE_ATTRIBUTES
+        }))
+        if not self.__apply_change(game_data.player_data, operation, arguments):
+            return False
+
+        change: bytes = buffer.getvalue()
+        with open(self.journal_file_name, "ab" if self.number_of_changes > 0 else "wb") as journal_file:
+            if self.number_of_changes == 0:
+                journal_file.write(self.__saved_game_data_checksum.to_bytes(4, "big"))
+
+            journal_file.write(len(change).to_bytes(4, "big") + zlib.crc32(change).to_bytes(4, "big") + change)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+        self.number_of_changes += 1
+        self.compact_if_due(game_data)
+        return True
+
+    @staticmethod
+    def __apply_change(player_data, operation, arguments):
+        # type: (Player, str, tuple) -> bool
+        if operation == "PURCHASE ITEM":
+            return player_data.purchase_item(*arguments)
+        elif operation == "BUILD AT SECTION TILE":
+            return player_data.build_at_section_tile(*arguments)
+        elif operation == "CLAIM REWARD":
+            player_data.claim_reward(*arguments)
+            return True
+        elif operation == "SELL ITEM":
+            item: Item or None = arguments[0]
+            if isinstance(item, bytes):
+                # Replaying a change written with the contents of the item
+                item = GameJournal.__find_item(player_data, item)
+
+            return item is not None and player_data.sell_item(item)
+        elif operation in ["PLACE RUNE", "REMOVE RUNE"]:
+            legendary_creature, argument = arguments
+            if not isinstance(legendary_creature, LegendaryCreature):
+                # Replaying a change written with the ID of the legendary creature
+                legendary_creature = player_data.legendary_creature_inventory.get_legendary_creature(legendary_creature)
+                if legendary_creature is None:
+                    return False
+
+                if operation == "PLACE RUNE":
+                    argument = GameJournal.__find_item(player_data, argument)
+                    if not isinstance(argument, Rune):
+                        return False
+
+            if operation == "PLACE RUNE":
+                return player_data.place_rune_on_legendary_creature(legendary_creature, argument)
+            return player_data.remove_rune_from_legendary_creature(legendary_creature, argument)
+        return False
+
+
+class PlayerSummary:
+    """
+    This class contains attributes of the stats of a player read from a profile store without loading the rest of
+    the saved game data.
+    """
+
+    def __init__(self, profile_name, player_id, name, level, gold, gems, arena_points, arena_wins, arena_losses):
+        # type: (str, str, str, int, BigValue, BigValue, int, int, int) -> None
+        self.profile_name: str = profile_name
+        self.player_id: str = player_id
+        self.name: str = name
+        self.level: int = level
+        self.gold: BigValue = gold
+        self.gems: BigValue = gems
+        self.arena_points: int = arena_points
+        self.arena_wins: int = arena_wins
+        self.arena_losses: int = arena_losses
+
+    def __str__(self):
+        # type: () -> str
+        return render_object(self, vars(self))
+
+    def clone(self):
+        # type: () -> PlayerSummary
         return copy.deepcopy(self)
 
 
-# Initialising global variables for the saved game data
-# 1. The item shop
-runes: list = []  # initial value
-for rating in range(Rune.MIN_RATING, Rune.MAX_RATING + 1):
-    for slot_number in range(Rune.MIN_SLOT_NUMBER, Rune.MAX_SLOT_NUMBER + 1):
-        for set_name in Rune.POTENTIAL_SET_NAMES:
-            for main_stat in Rune.POTENTIAL_MAIN_STATS:
-                name: str = str(rating) + "-STAR " + str(set_name).upper() + " RUNE - SLOT " + str(slot_number)
-                description: str = str(set_name).upper() + " rune of rating " + str(rating) + " at slot " + \
-                                   str(slot_number)
-                gold_cost: mpf = mpf("10") ** (6 + 5 * (rating - 1))
-                gem_cost: mpf = 0 if rating == 1 else 10 * triangular(rating)
-                new_rune: Rune = Rune(name, description, gold_cost, gem_cost, rating, slot_number, set_name,
-                                      main_stat)
-                runes.append(new_rune)
-
-eggs: list = []  # initial value
-for element in Egg.POTENTIAL_ELEMENTS:
-    new_egg: Egg = Egg(mpf("8e5"), mpf("8"), element)
-    eggs.append(new_egg)
-
-awaken_shards: list = []  # initial value
-for element in Egg.POTENTIAL_ELEMENTS:
-    new_awaken_shard: AwakenShard = AwakenShard(mpf("1e6"), mpf("10"), element)
-    awaken_shards.append(new_awaken_shard)
-
-items: list = [rune for rune in runes] + [egg for egg in eggs] + \
-              [awaken_shard for awaken_shard in awaken_shards]
-items = items + [EXPShard(mpf("1e6"), mpf("10"), mpf("1e5")),
-                 LevelUpShard(mpf("1e6"), mpf("10")),
-                 SkillLevelUpShard(mpf("1e6"), mpf("10"))]
-item_shop: ItemShop = ItemShop(items)
+class ProfileStore:
+    """
+    This class contains attributes of a store keeping the saved game data of many players in a single SQLite
+    database. The stats of every player are stored next to the saved game data so that they can be read without
+    loading the rest of it, and the database is in WAL mode so that many processes can read it at the same time.
+    """
 
-# 2. The building shop
-habitats: list = []  # initial value
-for element in Egg.POTENTIAL_ELEMENTS:
-    new_habitat: Habitat = Habitat(mpf("1e5"), mpf("1"), element, mpf("1e3"))
-    habitats.append(new_habitat)
-
-building_shop: BuildingShop = BuildingShop([
-                                               Hatchery(mpf("1e5"), mpf("1")),
-                                               TrainingArea(mpf("1e8"), mpf("1000")),
-                                               Tree(mpf("1e4"), mpf("0")),
-                                               Guardstone(mpf("1e7"), mpf("100")),
-                                               LegendaryCreatureSanctuary(mpf("1e7"), mpf("100")),
-                                               SurvivalAltar(mpf("1e7"), mpf("100")),
-                                               MagicAltar(mpf("1e7"), mpf("100")),
-                                               BoosterTower(mpf("1e7"), mpf("100")),
-                                               PlayerEXPTower(mpf("1e7"), mpf("100")),
-                                               FoodFarm(mpf("1e6"), mpf("10")),
-                                               GoldMine(mpf("1e6"), mpf("10")),
-                                               GemMine(mpf("1e6"), mpf("10")),
-                                               PowerUpCircle(mpf("1e5"), mpf("1")),
-                                               FusionCenter(mpf("1e8"), mpf("1000")),
-                                               TempleOfWishes(mpf("1e5"), mpf("1"),
-                                                              [Reward(player_reward_exp=mpf("1e6")),
-                                                               Reward(player_reward_exp=mpf("5e6")),
-                                                               Reward(player_reward_gold=mpf("1e5")),
-                                                               Reward(player_reward_gold=mpf("5e5")),
-                                                               Reward(player_reward_gems=mpf("10")),
-                                                               Reward(player_reward_gems=mpf("50")),
-                                                               Reward(legendary_creature_reward_exp=mpf("1e6")),
-                                                               Reward(legendary_creature_reward_exp=mpf("5e6"))
-                                                               ] + [item for item in items])
-                                           ] + [habitat for habitat in habitats])
-
-# 3. Initialising potential CPU players the player can face
-potential_cpu_players: list = [
-    CPU("CPU #1"),
-    CPU("CPU #2"),
-    CPU("CPU #3"),
-    CPU("CPU #4"),
-    CPU("CPU #5"),
-    CPU("CPU #6"),
-    CPU("CPU #7"),
-    CPU("CPU #8"),
-    CPU("CPU #9"),
-    CPU("CPU #10")
-]
+    # Columns the stats of players can be ordered by, with the best players first
+    ORDERS: dict = {
+        "LEVEL": "level DESC",
+        "ARENA POINTS": "arena_points DESC",
+        "GOLD": "gold_exponent DESC, gold_mantissa DESC",
+        "GEMS": "gems_exponent DESC, gems_mantissa DESC"
+    }
 
-index: int = 1  # initial value
-for cpu_player in potential_cpu_players:
-    assert isinstance(cpu_player, CPU), "Invalid argument in list 'potential_cpu_players'!"
-    cpu_player.battle_team = Team([generate_random_legendary_creature(
-        Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
-    ),
-        generate_random_legendary_creature(
-            Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
-        ),
-        generate_random_legendary_creature(
-            Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
-        ),
-        generate_random_legendary_creature(
-            Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
-        ),
-        generate_random_legendary_creature(
-            Egg.POTENTIAL_ELEMENTS[random.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)]
-        )])
-    level_ups: int = 5 * index
-    for legendary_creature in cpu_player.battle_team.get_legendary_creatures():
-        for k in range(level_ups):
-            legendary_creature.exp = legendary_creature.required_exp
-            legendary_creature.level_up()
-            if legendary_creature.level == legendary_creature.max_level:
-                legendary_creature.evolve()
+    def __init__(self, file_name):
+        # type: (str) -> None
+        self.file_name: str = file_name
+        self.__connection: sqlite3.Connection = sqlite3.connect(file_name, timeout=30)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("""CREATE TABLE IF NOT EXISTS profiles (
+            profile_name TEXT PRIMARY KEY,
+            player_id TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            gold_mantissa REAL NOT NULL,
+            gold_exponent INTEGER NOT NULL,
+            gems_mantissa REAL NOT NULL,
+            gems_exponent INTEGER NOT NULL,
+            arena_points INTEGER NOT NULL,
+            arena_wins INTEGER NOT NULL,
+            arena_losses INTEGER NOT NULL,
+            saved_game_data BLOB NOT NULL
+        )""")
+        self.__connection.commit()
+
+    def close(self):
+        # type: () -> None
+        self.__connection.close()
+
+    def write_saved_game_data(self, profile_name, game_data, data):
+        # type: (str, Game, bytes) -> None
+        player_data: Player = game_data.player_data
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO profiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (profile_name, player_data.player_id, player_data.name, player_data.level,
+                 player_data.gold.mantissa, player_data.gold.exponent, player_data.gems.mantissa,
+                 player_data.gems.exponent, player_data.arena_points, player_data.arena_wins,
+                 player_data.arena_losses, data))
+
+    def read_saved_game_data(self, profile_name):
+        # type: (str) -> bytes or None
+        row: tuple or None = self.__connection.execute("SELECT saved_game_data FROM profiles WHERE profile_name = ?",
+                                                       (profile_name,)).fetchone()
+        return None if row is None else row[0]
+
+    def save_game_data(self, profile_name, game_data):
+        # type: (str, Game) -> None
+        self.write_saved_game_data(profile_name, game_data, serialise_game_data(game_data))
+
+    def load_game_data(self, profile_name):
+        # type: (str) -> Game or None
+        data: bytes or None = self.read_saved_game_data(profile_name)
+        return None if data is None else deserialise_game_data(data)
+
+    def load_game_data_by_player_id(self, player_id):
+        # type: (str) -> Game or None
+        row: tuple or None = self.__connection.execute("SELECT saved_game_data FROM profiles WHERE player_id = ?",
+                                                       (player_id,)).fetchone()
+        return None if row is None else deserialise_game_data(row[0])
+
+    def remove_profile(self, profile_name):
+        # type: (str) -> bool
+        with self.__connection:
+            return self.__connection.execute("DELETE FROM profiles WHERE profile_name = ?",
+                                             (profile_name,)).rowcount > 0
+
+    def get_profile_names(self):
+        # type: () -> list
+        return [row[0] for row in self.__connection.execute("SELECT profile_name FROM profiles ORDER BY profile_name")]
+
+    def get_player_summaries(self, order="LEVEL", limit=-1):
+        # type: (str, int) -> list
+        """
+        Getting the stats of the players in the profile store without loading their saved game data, e.g., for a
+        leaderboard.
+        :return: a list of player summaries with the best players first
+        """
+
+        if order not in self.ORDERS.keys():
+            raise ValueError("Cannot order players by " + str(order) + "!")
+
+        return [PlayerSummary(profile_name, player_id, name, level, BigValue(gold_mantissa, gold_exponent),
+                              BigValue(gems_mantissa, gems_exponent), arena_points, arena_wins, arena_losses)
+                for profile_name, player_id, name, level, gold_mantissa, gold_exponent, gems_mantissa,
+                gems_exponent, arena_points, arena_wins, arena_losses in self.__connection.execute(
+                    "SELECT profile_name, player_id, name, level, gold_mantissa, gold_exponent, gems_mantissa, "
+                    "gems_exponent, arena_points, arena_wins, arena_losses FROM profiles ORDER BY " +
+                    self.ORDERS[order] + ", profile_name LIMIT ?", (limit,))]
+
+
+# The file name of the profile store keeping the saved game data of all players. Saved game data is kept in a separate
+# file for every player if it is not set. The environment variable below can be set to change it when the game is
+# started.
+PROFILE_STORE_FILE_NAME: str or None = None
+PROFILE_STORE_FILE_NAME_VARIABLE: str = "LEGENDARY_CREATURE_CITY_BUILDER_PROFILE_STORE"
+
+
+# The seed used to generate the CPU players in the battle arena and the directory where the generated players are
+# cached. The cache is only used if both of them are set. By default, the roster is cached next to the saved game data
+# and the environment variables below can be set to change them when the game is started (an empty value turns the
+# cache off). The cache version is part of the name of the cache file and has to be increased whenever the generated
+# roster or the pickled classes change.
+ARENA_ROSTER_SEED: int or None = 0
+ARENA_ROSTER_CACHE_DIRECTORY: str or None = os.curdir
+ARENA_ROSTER_SEED_VARIABLE: str = "LEGENDARY_CREATURE_CITY_BUILDER_ARENA_ROSTER_SEED"
+ARENA_ROSTER_CACHE_DIRECTORY_VARIABLE: str = "LEGENDARY_CREATURE_CITY_BUILDER_ARENA_ROSTER_CACHE_DIRECTORY"
+ARENA_ROSTER_CACHE_VERSION: int = 1
+ARENA_ROSTER_SIZE: int = 10
+
+
+# The seed of the random number generator from which the random number generators of the players, battles and
+# minigames are derived when the game is started. A random seed is used if the environment variable is not set.
+RANDOM_SEED_VARIABLE: str = "LEGENDARY_CREATURE_CITY_BUILDER_RANDOM_SEED"
+
+
+def generate_potential_cpu_players(seed=None):
+    # type: (int or None) -> list
+    # The roster is generated with its own random number generator rather than the global one, which is seeded by the
+    # seed if it is given
+    rng: random.Random = random.Random(seed)
+    potential_cpu_players: list = []  # initial value
+    for index in range(1, ARENA_ROSTER_SIZE + 1):
+        cpu_player: CPU = CPU("CPU #" + str(index), rng)
+        cpu_player.battle_team = Team([generate_random_legendary_creature(
+            Egg.POTENTIAL_ELEMENTS[rng.randint(0, len(Egg.POTENTIAL_ELEMENTS) - 1)], rng
+        ) for k in range(Team.MAX_LEGENDARY_CREATURES)])
+        for legendary_creature in cpu_player.battle_team.get_legendary_creatures():
+            legendary_creature.advance_levels(5 * index)
+
+        potential_cpu_players.append(cpu_player)
+
+    return potential_cpu_players
+
+
+def load_potential_cpu_players(seed=None, cache_directory=None):
+    # type: (int or None, str or None) -> list
+    if seed is None or cache_directory is None:
+        return generate_potential_cpu_players(seed)
+
+    cache_file_name: str = os.path.join(cache_directory, "CPU ARENA ROSTER - VERSION " +
+                                        str(ARENA_ROSTER_CACHE_VERSION) + " - SEED " + str(seed))
+    try:
+        with open(cache_file_name, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError,
+            ValueError):
+        # A missing, partially written or outdated cache is replaced with a newly generated roster
+        potential_cpu_players: list = generate_potential_cpu_players(seed)
+        os.makedirs(cache_directory, exist_ok=True)
+        write_file_atomically(cache_file_name, pickle.dumps(potential_cpu_players))
+        return potential_cpu_players
+
+
+def get_environment_setting(variable_name, default):
+    # type: (str, str or None) -> str or None
+    value: str or None = os.environ.get(variable_name, default)
+    return value if value != "" else None
+
+
+def create_battle_arena():
+    # type: () -> Arena
+    # The settings of the roster are read from the environment when the game is started rather than when it is imported
+    roster_seed: str or None = get_environment_setting(ARENA_ROSTER_SEED_VARIABLE, None if ARENA_ROSTER_SEED is None
+                                                       else str(ARENA_ROSTER_SEED))
+    return Arena(roster_seed=int(roster_seed) if roster_seed is not None else None,
+                 roster_cache_directory=get_environment_setting(ARENA_ROSTER_CACHE_DIRECTORY_VARIABLE,
+                                                                ARENA_ROSTER_CACHE_DIRECTORY))
+
+
+# The teams and policies used by the current battle simulation process. They are unpickled once per process rather
+# than once per battle.
+BATTLE_SIMULATION_DATA: tuple or None = None
+
+
+def initialise_battle_simulation_process(battle_simulation_data, numeric_mode):
+    # type: (bytes, str) -> None
+    global BATTLE_SIMULATION_DATA
+    BATTLE_SIMULATION_DATA = pickle.loads(battle_simulation_data)
+    set_numeric_mode(numeric_mode)
+
+
+def simulate_battle_shard(seeds):
+    # type: (list) -> BattleStatistics
+    team1, team2, policy1, policy2 = BATTLE_SIMULATION_DATA
+    battle_statistics: BattleStatistics = BattleStatistics()
+    battle_engine: BattleEngine = BattleEngine()
+    for seed in seeds:
+        # Every battle starts with fresh copies of the teams so that its result only depends on its seed
+        battle_statistics.add_battle_result(battle_engine.run(team1.clone(), team2.clone(), policy1, policy2, seed))
+
+    return battle_statistics
+
+
+def simulate_battles(team1, team2, number_of_battles, seed=0, processes=None, policy1=None, policy2=None):
+    # type: (Team, Team, int, int, int or None, BattlePolicy or None, BattlePolicy or None) -> BattleStatistics
+    """
+    Simulating battles between two teams with the seeds 'seed', 'seed + 1', ..., 'seed + number_of_battles - 1'
+    across several processes.
+    :return: the aggregated results of the battles from the perspective of team 1
+    """
 
-    index += 1
+    policy1 = RandomBattlePolicy() if policy1 is None else policy1
+    policy2 = RandomBattlePolicy() if policy2 is None else policy2
+    processes = (os.cpu_count() or 1) if processes is None else processes
+    battle_simulation_data: bytes = pickle.dumps((team1, team2, policy1, policy2))
+    seeds: list = list(range(seed, seed + number_of_battles))
+    battle_statistics: BattleStatistics = BattleStatistics()
+    if processes <= 1 or number_of_battles <= 1:
+        initialise_battle_simulation_process(battle_simulation_data, NUMERIC_MODE)
+        battle_statistics.merge(simulate_battle_shard(seeds))
+        return battle_statistics
 
-# 4. The battle arena
-battle_arena: Arena = Arena(potential_cpu_players)
+    # Splitting the seeds into a few shards per process so that processes finishing early get more work
+    number_of_shards: int = min(number_of_battles, processes * 4)
+    shards: list = [seeds[i::number_of_shards] for i in range(number_of_shards)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes,
+                                                initializer=initialise_battle_simulation_process,
+                                                initargs=(battle_simulation_data, NUMERIC_MODE)) as executor:
+        for shard_statistics in executor.map(simulate_battle_shard, shards):
+            battle_statistics.merge(shard_statistics)
 
-# 5. Minigames the player can play in
+    return battle_statistics
+
+
+def estimate_arena_win_rates(team, arena, number_of_battles, seed=0, processes=None):
+    # type: (Team, Arena, int, int, int or None) -> list
+    return [(cpu, simulate_battles(team, cpu.battle_team, number_of_battles, seed, processes))
+            for cpu in arena.get_potential_opponents()]
+
+
+def estimate_level_win_rates(team, level, number_of_battles, seed=0, processes=None):
+    # type: (Team, Level, int, int, int or None) -> list
+    return [(stage, simulate_battles(team, Team(stage.get_enemies_list()), number_of_battles, seed, processes))
+            for stage in level.get_stages()]
+
+
+# Initialising global variables for the saved game data
+# 1. The item shop
+eggs: TemplateCatalogue = TemplateCatalogue([CatalogueTemplate(Egg, mpf("8e5"), mpf("8"), element)
+                                             for element in Egg.POTENTIAL_ELEMENTS])
+awaken_shards: TemplateCatalogue = TemplateCatalogue([CatalogueTemplate(AwakenShard, mpf("1e6"), mpf("10"), element)
+                                                      for element in Egg.POTENTIAL_ELEMENTS])
+
+# Runes are created on demand by the rune catalogue rather than all at once when the game starts, and the other items
+# are created from their templates, so every item looked up in the item shop is a new item.
+items: CatalogueView = CatalogueView([RuneCatalogue(), eggs, awaken_shards,
+                                      TemplateCatalogue([CatalogueTemplate(EXPShard, mpf("1e6"), mpf("10"), mpf("1e5")),
+                                                         CatalogueTemplate(LevelUpShard, mpf("1e6"), mpf("10")),
+                                                         CatalogueTemplate(SkillLevelUpShard, mpf("1e6"), mpf("10"))])])
+item_shop: ItemShop = ItemShop(items)
+
+# 2. The building shop, whose buildings are created from their templates whenever they are looked up
+building_shop: BuildingShop = BuildingShop(TemplateCatalogue([
+                                               CatalogueTemplate(Hatchery, mpf("1e5"), mpf("1")),
+                                               CatalogueTemplate(TrainingArea, mpf("1e8"), mpf("1000")),
+                                               CatalogueTemplate(Tree, mpf("1e4"), mpf("0")),
+                                               CatalogueTemplate(Guardstone, mpf("1e7"), mpf("100")),
+                                               CatalogueTemplate(LegendaryCreatureSanctuary, mpf("1e7"), mpf("100")),
+                                               CatalogueTemplate(SurvivalAltar, mpf("1e7"), mpf("100")),
+                                               CatalogueTemplate(MagicAltar, mpf("1e7"), mpf("100")),
+                                               CatalogueTemplate(BoosterTower, mpf("1e7"), mpf("100")),
+                                               CatalogueTemplate(PlayerEXPTower, mpf("1e7"), mpf("100")),
+                                               CatalogueTemplate(FoodFarm, mpf("1e6"), mpf("10")),
+                                               CatalogueTemplate(GoldMine, mpf("1e6"), mpf("10")),
+                                               CatalogueTemplate(GemMine, mpf("1e6"), mpf("10")),
+                                               CatalogueTemplate(PowerUpCircle, mpf("1e5"), mpf("1")),
+                                               CatalogueTemplate(FusionCenter, mpf("1e8"), mpf("1000")),
+                                               CatalogueTemplate(TempleOfWishes, mpf("1e5"), mpf("1"), CatalogueView([
+                                                   [Reward(player_reward_exp=mpf("1e6")),
+                                                    Reward(player_reward_exp=mpf("5e6")),
+                                                    Reward(player_reward_gold=mpf("1e5")),
+                                                    Reward(player_reward_gold=mpf("5e5")),
+                                                    Reward(player_reward_gems=mpf("10")),
+                                                    Reward(player_reward_gems=mpf("50")),
+                                                    Reward(legendary_creature_reward_exp=mpf("1e6")),
+                                                    Reward(legendary_creature_reward_exp=mpf("5e6"))],
+                                                   items]))
+                                           ] + [CatalogueTemplate(Habitat, mpf("1e5"), mpf("1"), element, mpf("1e3"))
+                                                for element in Egg.POTENTIAL_ELEMENTS]))
+
+# 3. Minigames the player can play in
 minigames: list = [
     Minigame("BOX EATS PLANTS"), Minigame("MATCH WORD PUZZLE"), Minigame("MATCH-3 GAME"), Minigame("DAILY BONUS")
 ]
@@ -4975,30 +7284,44 @@ def main() -> int:
     for i in range(0, len(ancient_world_elements)):
         print(str(i + 1) + ". " + str(ancient_world_elements[i]))
 
+    # All random numbers in the game are drawn from random number generators derived from one random number generator,
+    # which is seeded by the environment variable below if it is set so that the game can be reproduced
+    random_seed: str or None = get_environment_setting(RANDOM_SEED_VARIABLE, None)
+    rng: random.Random = random.Random(int(random_seed) if random_seed is not None else None)
+
     # Initialising variable for the saved game data
     # Asking the user to enter his/her name to check whether saved game data exists or not
     player_name: str = input("Please enter your name: ")
     file_name: str = "SAVED LEGENDARY CREATURE CITY BUILDER GAME DATA - " + str(player_name).upper()
 
+    # Changes made by the player are written to the autosave journal of the saved game data as they happen
+    profile_store_file_name: str or None = get_environment_setting(PROFILE_STORE_FILE_NAME_VARIABLE,
+                                                                   PROFILE_STORE_FILE_NAME)
+    profile_store: ProfileStore or None = ProfileStore(profile_store_file_name) if profile_store_file_name is not None \
+        else None
+    journal: GameJournal = GameJournal(file_name, profile_store=profile_store, profile_name=str(player_name).upper())
     new_game: Game
     try:
-        new_game = load_game_data(file_name)
+        new_game = journal.load()
 
         # Clearing up the command line window
         clear()
 
         print("Current game progress:\n", str(new_game))
+        if new_game.player_data.rng is None:
+            # Players saved by older versions of this game do not have their own random number generator
+            new_game.player_data.rng = derive_random_number_generator(rng)
     except FileNotFoundError:
         # Clearing up the command line window
         clear()
 
         print("Sorry! No saved game data with player name '" + str(player_name) + "' is available!")
         name: str = input("Please enter your name: ")
-        player_data: Player = Player(name)
-        new_game = Game(player_data, item_shop, building_shop, battle_arena, minigames)
+        player_data: Player = Player(name, derive_random_number_generator(rng))
+        # The CPU players in the battle arena are only generated once the player enters it
+        new_game = Game(player_data, item_shop, building_shop, create_battle_arena(), minigames)
+        journal.compact(new_game)
 
-    # Getting the current date and time
-    old_now: datetime = datetime.now()
     print("Enter 'Y' for yes.")
     print("Enter anything else for no.")
     continue_playing: str = input("Do you want to continue playing 'Legendary Creature City Builder'? ")
@@ -5006,39 +7329,24 @@ def main() -> int:
         # Clearing up the command line window
         clear()
 
-        # Updating the old time
+        # Increase player's EXP, gold, and gems gained since the player was last seen, even in an earlier session,
+        # and hatch all eggs in hatcheries which are ready. Legendary creatures gaining EXP get it when they are next
+        # used.
+        old_now: datetime = new_game.player_data.last_seen
         new_now: datetime = datetime.now()
-        time_difference = new_now - old_now
-        seconds: int = time_difference.seconds
-        old_now = new_now
+        new_game.player_data.catch_up(new_now)
 
         # Resetting all temple of wishes and minigames if possible
-        if new_now.day != old_now.day:
-            for section in new_game.player_data.player_city.get_sections():
-                for x in range(section.SECTION_WIDTH):
-                    for y in range(section.SECTION_HEIGHT):
-                        curr_tile: CityTile = section.get_tile_at(x, y)
-                        if isinstance(curr_tile.building, TempleOfWishes):
-                            temple_of_wishes: TempleOfWishes = curr_tile.building
-                            temple_of_wishes.restore()
-                            temple_of_wishes.reset_wishes_left()
+        if new_now.date() != old_now.date():
+            for temple_of_wishes in new_game.player_data.player_city.get_buildings(TempleOfWishes):
+                temple_of_wishes.restore()
+                temple_of_wishes.reset_wishes_left()
 
             for minigame in minigames:
                 minigame.reset()
 
-        # Increase player's EXP, gold, and gems
-        new_game.player_data.exp += new_game.player_data.exp_per_second * seconds
-        new_game.player_data.level_up()
-        new_game.player_data.gold += new_game.player_data.gold_per_second * seconds
-        new_game.player_data.gems += new_game.player_data.gems_per_second * seconds
-
-        # Increase the exp of all legendary creatures owned by the player
-        for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-            legendary_creature.exp += legendary_creature.exp_per_second * seconds
-            legendary_creature.level_up()
-
-        # Hatching all eggs in hatcheries
-        new_game.player_data.hatch_eggs_in_hatcheries()
+        # Saving changes which are not written to the autosave journal from time to time
+        journal.compact_if_due(new_game)
 
         # Asking the player what he/she wants to do in the game.
         allowed: list = ["PLAY ADVENTURE MODE", "MANAGE PLAYER CITY", "MANAGE BATTLE TEAM",
@@ -5070,36 +7378,38 @@ def main() -> int:
         action: str = input("What do you want to do? ")
         if action not in allowed:
             # Saving game data and quitting the game
-            save_game_data(new_game, file_name)
+            journal.compact(new_game)
             sys.exit()
         else:
+            # Adding the EXP gained by legendary creatures in training areas before they are used
+            if action not in ["MANAGE ITEM INVENTORY", "PLAY MINIGAME", "BUY ITEM"]:
+                new_game.player_data.settle_legendary_creature_exp()
+
             if action == "VIEW STATS":
                 # Clearing the command line window
                 clear()
 
-                # Display player's stats
-                print(new_game.player_data)
+                # Display a summary of player's stats
+                print(summarise(new_game.player_data))
+                print("Enter 'Y' for yes.")
+                print("Enter anything else for no.")
+                view_full_stats: str = input("Do you want to view your full stats? ")
+                if view_full_stats == "Y":
+                    # Display player's stats in full
+                    print(new_game.player_data)
             elif action == "BUY ITEM":
                 # Clearing the command line window
                 clear()
 
                 # Show a list of items which the player can buy
                 item_list: list = new_game.item_shop.get_items_sold()
+                item_listing: Listing = Listing(item_list, "ITEM")
                 print("Below is a list of items you can buy.\n")
-                curr_item_index: int = 1  # initial value
-                for item in item_list:
-                    print("ITEM #" + str(curr_item_index))
-                    print(str(item) + "\n")
-                    curr_item_index += 1
-
-                item_index: int = int(input("Please enter the index of the item you want to buy (1 - " +
-                                            str(len(item_list)) + "): "))
-                while item_index < 1 or item_index > len(item_list):
-                    item_index: int = int(input("Sorry, invalid input! Please enter the index of the item you want "
-                                                "to buy (1 - " + str(len(item_list)) + "): "))
-
+                print(item_listing.render_page())
+                item_index: int = choose_from_listing(item_listing, "Please enter the index of the item you want to "
+                                                                    "buy")
                 item_to_buy: Item = item_list[item_index - 1]
-                if new_game.player_data.purchase_item(item_to_buy):
+                if journal.purchase_item(new_game, item_to_buy):
                     print("You have successfully bought " + str(item_to_buy.name))
                 else:
                     print("Sorry, you have insufficient gold and/or gems!")
@@ -5134,321 +7444,13 @@ def main() -> int:
 
                 print("--------------------" + str(new_game.player_data.name) + " VS. " + str(chosen_cpu.name) +
                       "--------------------")
-                curr_battle: Battle = Battle(new_game.player_data.battle_team, chosen_cpu.battle_team)
-                while curr_battle.winner is None:
-                    # Printing out the stats of legendary creatures in both teams
-                    print("Below are the stats of all legendary creatures in player's team.\n")
-                    for legendary_creature in curr_battle.team1.get_legendary_creatures():
-                        print(str(legendary_creature) + "\n")
-
-                    print("Below are the stats of all legendary creatures in enemy's team.\n")
-                    for legendary_creature in curr_battle.team2.get_legendary_creatures():
-                        print(str(legendary_creature) + "\n")
-
-                    # Make a legendary creature move
-                    curr_battle.get_someone_to_move()
-                    assert isinstance(curr_battle.whose_turn, LegendaryCreature), "Cannot proceed with battle!"
-
-                    if not curr_battle.whose_turn.can_move:
-                        # Skip turn
-                        curr_battle.whose_turn.have_turn(curr_battle.whose_turn, None, "NORMAL HEAL")
-
-                        # Make another legendary creature move
-                        curr_battle.get_someone_to_move()
-                        assert isinstance(curr_battle.whose_turn, LegendaryCreature), \
-                            "Cannot proceed with battle!"
-
-                    # Checking which legendary creature moves
-                    if curr_battle.whose_turn in curr_battle.team1.get_legendary_creatures():
-                        moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                        # Asking the player what he/she wants to do
-                        print("Enter 'NORMAL ATTACK' for normal attack.")
-                        print("Enter 'NORMAL HEAL' for normal heal.")
-                        print("Enter anything else to use a skill (only applicable if you have usable skills).")
-                        usable_skills: list = [skill for skill in curr_battle.whose_turn.get_skills()
-                                               if curr_battle.whose_turn.curr_magic_points >=
-                                               skill.magic_points_cost and isinstance(skill, ActiveSkill)]
-                        possible_actions: list = ["NORMAL ATTACK", "NORMAL HEAL"]
-                        trainer_battle_action: str = input("What do you want to do? ")
-                        while len(usable_skills) == 0 and trainer_battle_action not in possible_actions:
-                            print("Enter 'NORMAL ATTACK' for normal attack.")
-                            print("Enter 'NORMAL HEAL' for normal heal.")
-                            trainer_battle_action = input("Sorry, invalid input! What do you want to do? ")
-
-                        if trainer_battle_action not in possible_actions:
-                            # Use skill
-                            trainer_battle_action = "USE SKILL"
-
-                            # Show a list of skills the player can use
-                            print("Below is a list of skills you can use.\n")
-                            curr_skill_index: int = 1  # initial value
-                            for skill in usable_skills:
-                                print("SKILL #" + str(curr_skill_index))
-                                print(str(skill) + "\n")
-                                curr_skill_index += 1
-
-                            skill_index: int = int(input("Please enter the index of the skill "
-                                                         "you want to use (1 - " +
-                                                         str(len(usable_skills)) + "): "))
-                            while skill_index < 1 or skill_index > len(usable_skills):
-                                skill_index = int(input("Sorry, invalid input! Please enter the "
-                                                        "index of the skill "
-                                                        "you want to use (1 - " +
-                                                        str(len(usable_skills)) + "): "))
-
-                            skill_to_use: ActiveSkill = usable_skills[skill_index - 1]
-                            if skill_to_use.active_skill_type == "ATTACK":
-                                # Asking the user to select a target
-                                print("Below is a list of enemies you can attack.")
-                                enemy_index: int = 1  # initial value
-                                for enemy in curr_battle.team2.get_legendary_creatures():
-                                    print("ENEMY #" + str(enemy_index))
-                                    print(str(enemy) + "\n")
-                                    enemy_index += 1
-
-                                chosen_enemy_index: int = int(input("Please enter the index of the "
-                                                                    "enemy you want to attack (1 - " +
-                                                                    str(len(curr_battle.
-                                                                            team2.get_legendary_creatures())) +
-                                                                    "): "))
-                                while chosen_enemy_index < 1 or chosen_enemy_index > len(curr_battle.
-                                                                                                 team2.get_legendary_creatures()):
-                                    chosen_enemy_index = int(input("Sorry, invalid input! "
-                                                                   "Please enter the index of the "
-                                                                   "enemy you want to attack (1 - " +
-                                                                   str(len(curr_battle.
-                                                                           team2.get_legendary_creatures())) +
-                                                                   "): "))
-
-                                chosen_enemy_target: LegendaryCreature = curr_battle.team2. \
-                                    get_legendary_creatures()[chosen_enemy_index - 1]
-                                curr_battle.whose_turn.have_turn(chosen_enemy_target, skill_to_use,
-                                                                 trainer_battle_action)
-                                if random.random() < chosen_enemy_target.counterattack_chance + \
-                                        chosen_enemy_target.counterattack_chance_up:
-                                    chosen_enemy_target.counterattack(curr_battle.whose_turn)
-
-                            elif skill_to_use.active_skill_type == "HEAL":
-                                # Asking the user to select who to heal
-                                print("Below is a list of allies you can heal.")
-                                ally_index: int = 1  # initial value
-                                for ally in curr_battle.team1.get_legendary_creatures():
-                                    print("ALLY #" + str(ally_index))
-                                    print(str(ally) + "\n")
-                                    ally_index += 1
-
-                                chosen_ally_index: int = int(input("Please enter the index of the "
-                                                                   "ally you want to heal (1 - " +
-                                                                   str(len(curr_battle.
-                                                                           team1.get_legendary_creatures())) +
-                                                                   "): "))
-                                while chosen_ally_index < 1 or chosen_ally_index > len(curr_battle.
-                                                                                               team1.get_legendary_creatures()):
-                                    chosen_ally_index = int(input("Sorry, invalid input! "
-                                                                  "Please enter the index of the "
-                                                                  "ally you want to heal (1 - " +
-                                                                  str(len(curr_battle.
-                                                                          team1.get_legendary_creatures())) +
-                                                                  "): "))
-
-                                chosen_ally_target: LegendaryCreature = curr_battle.team1. \
-                                    get_legendary_creatures()[chosen_ally_index - 1]
-                                curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
-                                                                 trainer_battle_action)
-                            elif skill_to_use.active_skill_type == "ALLIES EFFECT":
-                                # Asking the user to select who to apply ally effect on
-                                print("Below is a list of allies you can apply ally effect on.")
-                                ally_index: int = 1  # initial value
-                                for ally in curr_battle.team1.get_legendary_creatures():
-                                    print("ALLY #" + str(ally_index))
-                                    print(str(ally) + "\n")
-                                    ally_index += 1
-
-                                chosen_ally_index: int = int(input("Please enter the index of the "
-                                                                   "ally you want to apply ally effect on (1 - " +
-                                                                   str(len(curr_battle.
-                                                                           team1.get_legendary_creatures())) +
-                                                                   "): "))
-                                while chosen_ally_index < 1 or chosen_ally_index > len(curr_battle.
-                                                                                               team1.get_legendary_creatures()):
-                                    chosen_ally_index = int(input("Sorry, invalid input! "
-                                                                  "Please enter the index of the "
-                                                                  "ally you want to apply ally effect on (1 - " +
-                                                                  str(len(curr_battle.
-                                                                          team1.get_legendary_creatures())) +
-                                                                  "): "))
-
-                                chosen_ally_target: LegendaryCreature = curr_battle.team1. \
-                                    get_legendary_creatures()[chosen_ally_index - 1]
-                                curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
-                                                                 trainer_battle_action)
-                            elif skill_to_use.active_skill_type == "ENEMIES EFFECT":
-                                # Asking the user to select who to apply enemy effect on
-                                print("Below is a list of enemies you can apply enemy effect on.")
-                                enemy_index: int = 1  # initial value
-                                for enemy in curr_battle.team2.get_legendary_creatures():
-                                    print("ENEMY #" + str(enemy_index))
-                                    print(str(enemy) + "\n")
-                                    enemy_index += 1
-
-                                chosen_enemy_index: int = int(input("Please enter the index of the "
-                                                                    "enemy you want to apply enemy effect on"
-                                                                    " (1 - " +
-                                                                    str(len(curr_battle.
-                                                                            team2.get_legendary_creatures())) +
-                                                                    "): "))
-                                while chosen_enemy_index < 1 or chosen_enemy_index > len(curr_battle.
-                                                                                                 team2.get_legendary_creatures()):
-                                    chosen_enemy_index = int(input("Sorry, invalid input! "
-                                                                   "Please enter the index of the "
-                                                                   "enemy you want to apply enemy effect on"
-                                                                   " (1 - " +
-                                                                   str(len(curr_battle.
-                                                                           team2.get_legendary_creatures())) +
-                                                                   "): "))
-
-                                chosen_enemy_target: LegendaryCreature = curr_battle.team2. \
-                                    get_legendary_creatures()[chosen_enemy_index - 1]
-                                curr_battle.whose_turn.have_turn(chosen_enemy_target, skill_to_use,
-                                                                 trainer_battle_action)
-
-                        elif trainer_battle_action == "NORMAL ATTACK":
-                            # Asking the user to select a target
-                            print("Below is a list of enemies you can attack.")
-                            enemy_index: int = 1  # initial value
-                            for enemy in curr_battle.team2.get_legendary_creatures():
-                                print("ENEMY #" + str(enemy_index))
-                                print(str(enemy) + "\n")
-                                enemy_index += 1
-
-                            chosen_enemy_index: int = int(input("Please enter the index of the "
-                                                                "enemy you want to attack (1 - " +
-                                                                str(len(curr_battle.
-                                                                        team2.get_legendary_creatures())) +
-                                                                "): "))
-                            while chosen_enemy_index < 1 or chosen_enemy_index > len(curr_battle.
-                                                                                             team2.get_legendary_creatures()):
-                                chosen_enemy_index = int(input("Sorry, invalid input! "
-                                                               "Please enter the index of the "
-                                                               "enemy you want to attack (1 - " +
-                                                               str(len(curr_battle.
-                                                                       team2.get_legendary_creatures())) +
-                                                               "): "))
-
-                            chosen_enemy_target: LegendaryCreature = curr_battle.team2. \
-                                get_legendary_creatures()[chosen_enemy_index - 1]
-                            curr_battle.whose_turn.have_turn(chosen_enemy_target, None, trainer_battle_action)
-                            if random.random() < chosen_enemy_target.counterattack_chance + \
-                                    chosen_enemy_target.counterattack_chance_up:
-                                chosen_enemy_target.counterattack(curr_battle.whose_turn)
-
-                        elif trainer_battle_action == "NORMAL HEAL":
-                            # Asking the user to select who to heal
-                            print("Below is a list of allies you can heal.")
-                            ally_index: int = 1  # initial value
-                            for ally in curr_battle.team1.get_legendary_creatures():
-                                print("ALLY #" + str(ally_index))
-                                print(str(ally) + "\n")
-                                ally_index += 1
-
-                            chosen_ally_index: int = int(input("Please enter the index of the "
-                                                               "ally you want to heal (1 - " +
-                                                               str(len(curr_battle.
-                                                                       team1.get_legendary_creatures())) +
-                                                               "): "))
-                            while chosen_ally_index < 1 or chosen_ally_index > len(curr_battle.
-                                                                                           team1.get_legendary_creatures()):
-                                chosen_ally_index = int(input("Sorry, invalid input! "
-                                                              "Please enter the index of the "
-                                                              "ally you want to heal (1 - " +
-                                                              str(len(curr_battle.
-                                                                      team1.get_legendary_creatures())) +
-                                                              "): "))
-
-                            chosen_ally_target: LegendaryCreature = curr_battle.team1. \
-                                get_legendary_creatures()[chosen_ally_index - 1]
-                            curr_battle.whose_turn.have_turn(chosen_ally_target, None,
-                                                             trainer_battle_action)
-                        else:
-                            pass
-
-                        # Checking the case where the moving legendary creature gets an extra turn
-                        if random.random() < moving_legendary_creature.extra_turn_chance + \
-                                moving_legendary_creature.extra_turn_chance_up and \
-                                moving_legendary_creature.can_move:
-                            curr_battle.whose_turn = moving_legendary_creature
-
-                            # Recovering magic points
-                            curr_battle.whose_turn.recover_magic_points()
-                        else:
-                            curr_battle.get_someone_to_move()
-
-                    elif curr_battle.whose_turn in curr_battle.team2.get_legendary_creatures():
-                        curr_moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                        chance: float = random.random()
-                        trainer_battle_action: str = "NORMAL ATTACK" if chance <= 1 / 3 else \
-                            "NORMAL HEAL" if 1 / 3 < chance <= 2 / 3 else "USE SKILL"
-                        usable_skills: list = [skill for skill in curr_battle.whose_turn.get_skills()
-                                               if curr_battle.whose_turn.curr_magic_points >=
-                                               skill.magic_points_cost and isinstance(skill, ActiveSkill)]
-
-                        # If there are no usable skills and 'trainer_battle_action' is set to "USE SKILL",
-                        # change the value of 'trainer_battle_action'
-                        if len(usable_skills) == 0:
-                            trainer_battle_action = "NORMAL ATTACK" if random.random() < 0.5 else "NORMAL HEAL"
-
-                        if trainer_battle_action == "NORMAL ATTACK":
-                            # A normal attack occurs
-                            moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                            target: LegendaryCreature = curr_battle.team1.get_legendary_creatures() \
-                                [random.randint(0, len(curr_battle.team1.get_legendary_creatures()) - 1)]
-                            moving_legendary_creature.have_turn(target, None, trainer_battle_action)
-                            if random.random() < target.counterattack_chance + \
-                                    target.counterattack_chance_up:
-                                target.counterattack(moving_legendary_creature)
-                        elif trainer_battle_action == "NORMAL HEAL":
-                            # A normal heal occurs
-                            moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                            target: LegendaryCreature = curr_battle.team2.get_legendary_creatures() \
-                                [random.randint(0, len(curr_battle.team2.get_legendary_creatures()) - 1)]
-                            moving_legendary_creature.have_turn(target, None, trainer_battle_action)
-                        elif trainer_battle_action == "USE SKILL":
-                            # A skill is used
-                            moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                            skill_to_use: ActiveSkill = usable_skills[random.randint(0, len(usable_skills) - 1)]
-                            if skill_to_use.active_skill_type == "ATTACK" or \
-                                    skill_to_use.active_skill_type == "ENEMIES EFFECT":
-                                target: LegendaryCreature = curr_battle.team1.get_legendary_creatures() \
-                                    [random.randint(0, len(curr_battle.team1.get_legendary_creatures()) - 1)]
-                                moving_legendary_creature.have_turn(target, skill_to_use, trainer_battle_action)
-                                if skill_to_use.active_skill_type == "ATTACK":
-                                    if random.random() < target.counterattack_chance + \
-                                            target.counterattack_chance_up:
-                                        target.counterattack(moving_legendary_creature)
-                            else:
-                                target: LegendaryCreature = curr_battle.team2.get_legendary_creatures() \
-                                    [random.randint(0, len(curr_battle.team2.get_legendary_creatures()) - 1)]
-                                moving_legendary_creature.have_turn(target, skill_to_use, trainer_battle_action)
-                        else:
-                            pass
-
-                        # Checking the case where the moving legendary creature gets an extra turn
-                        if random.random() < curr_moving_legendary_creature.extra_turn_chance + \
-                                curr_moving_legendary_creature.extra_turn_chance_up and \
-                                curr_moving_legendary_creature.can_move:
-                            curr_battle.whose_turn = curr_moving_legendary_creature
-
-                            # Recovering magic points
-                            curr_battle.whose_turn.recover_magic_points()
-                        else:
-                            curr_battle.get_someone_to_move()
-
-                    # Recovering magic points
-                    curr_battle.whose_turn.recover_magic_points()
+                curr_battle: Battle = Battle(new_game.player_data.battle_team, chosen_cpu.battle_team,
+                                             derive_random_number_generator(rng))
+                BattleEngine(verbose=True).play(curr_battle, InteractiveBattlePolicy(), RandomBattlePolicy())
 
                 if curr_battle.winner == curr_battle.team1:
                     print("Congratulations! You won the battle!")
-                    new_game.player_data.claim_reward(curr_battle.reward)
+                    journal.claim_reward(new_game, curr_battle.reward)
                     new_game.player_data.arena_wins += 1
                     chosen_cpu.arena_losses += 1
                     chosen_cpu.times_beaten += 1
@@ -5503,7 +7505,7 @@ def main() -> int:
                     # Set up the minigame "Box Eats Plants"
                     score: int = 0  # initial value
                     game_over: bool = False  # initial value
-                    board: BoxEatsPlantsBoard = BoxEatsPlantsBoard()
+                    board: BoxEatsPlantsBoard = BoxEatsPlantsBoard(derive_random_number_generator(rng))
                     box: Box = Box(0, 0)  # initial value
                     rocks: list = []
                     plants: list = []
@@ -5556,7 +7558,7 @@ def main() -> int:
                             box_tile.remove_plant()
                             plants.append(board.spawn_plant())
 
-                        rock_direction: str = allowed[random.randint(0, 3)]
+                        rock_direction: str = allowed[board.rng.randint(0, 3)]
                         if rock_direction == "UP":
                             for rock in rocks:
                                 rock.move_up(board)
@@ -5585,7 +7587,7 @@ def main() -> int:
                                 if isinstance(rock_tile.box, Box):
                                     game_over = True
 
-                        plant_direction: str = allowed[random.randint(0, 3)]
+                        plant_direction: str = allowed[board.rng.randint(0, 3)]
                         if plant_direction == "UP":
                             for plant in plants:
                                 plant.move_up(board)
@@ -5634,7 +7636,7 @@ def main() -> int:
                     reward: Reward = Reward(player_reward_exp=mpf("10") ** score,
                                             player_reward_gold=mpf("10") ** (score - 2),
                                             legendary_creature_reward_exp=mpf("10") ** score)
-                    new_game.player_data.claim_reward(reward)
+                    journal.claim_reward(new_game, reward)
 
                 elif chosen_minigame.name == "MATCH WORD PUZZLE":
                     print("Welcome to 'Match Word Puzzle'.")
@@ -5642,7 +7644,7 @@ def main() -> int:
                     print("as fast as possible.")
                     # Set up the minigame "Match Word Puzzle"
                     start_time: datetime = datetime.now()
-                    board: MatchWordPuzzleBoard = MatchWordPuzzleBoard()
+                    board: MatchWordPuzzleBoard = MatchWordPuzzleBoard(derive_random_number_generator(rng))
                     while not board.all_opened():
                         # Clearing the command line window
                         clear()
@@ -5686,7 +7688,7 @@ def main() -> int:
                     reward: Reward = Reward(player_reward_exp=mpf("1e24") / seconds_elapsed,
                                             player_reward_gold=mpf("1e22") / seconds_elapsed,
                                             legendary_creature_reward_exp=mpf("1e24") / seconds_elapsed)
-                    new_game.player_data.claim_reward(reward)
+                    journal.claim_reward(new_game, reward)
 
                 elif chosen_minigame.name == "MATCH-3 GAME":
                     print("Welcome to 'Match-3 Game'.")
@@ -5696,11 +7698,11 @@ def main() -> int:
                     min_broken_tiles: int = 60
                     curr_broken_tiles: int = 0  # initial value
                     curr_moves: int = 0  # initial value
-                    curr_board: MatchThreeBoard = MatchThreeBoard()
+                    curr_board: MatchThreeBoard = MatchThreeBoard(derive_random_number_generator(rng))
 
                     # Re-initialise the board if there are no possible moves.
                     while curr_board.no_possible_moves():
-                        curr_board = MatchThreeBoard()
+                        curr_board = MatchThreeBoard(derive_random_number_generator(rng))
 
                     while curr_moves < max_moves:
                         # Clearing the command line window
@@ -5754,7 +7756,7 @@ def main() -> int:
 
                         # Re-initialise the board if there are no possible moves.
                         while curr_board.no_possible_moves():
-                            curr_board = MatchThreeBoard()
+                            curr_board = MatchThreeBoard(derive_random_number_generator(rng))
 
                     # Checking whether the number of broken tiles reach the minimum required or not.
                     # If yes, the player gains a reward.
@@ -5767,7 +7769,7 @@ def main() -> int:
                                                 legendary_creature_reward_exp=mpf("10") **
                                                                               (
                                                                                       10 + curr_broken_tiles - min_broken_tiles))
-                        new_game.player_data.claim_reward(reward)
+                        journal.claim_reward(new_game, reward)
                     else:
                         print("You lost! Better luck next time!")
 
@@ -5778,24 +7780,14 @@ def main() -> int:
                 # Allow the player to remove a rune if there are legendary creatures in the legendary creature
                 # inventory.
                 if len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
+                    legendary_creature_listing: Listing = Listing(
+                        new_game.player_data.legendary_creature_inventory.get_legendary_creatures(),
+                        "LEGENDARY CREATURE")
                     print("Below is a list of legendary creatures you have.\n")
-                    curr_legendary_creature_index: int = 1  # initial value
-                    for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-                        print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                        print(str(legendary_creature) + "\n")
-                        curr_legendary_creature_index += 1
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                              "you want to remove a rune from (1 - " +
-                                                              str(len(new_game.player_data.legendary_creature_inventory.
-                                                                      get_legendary_creatures())) + "): "))
-                    while legendary_creature_index < 1 or legendary_creature_index > \
-                            len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                        legendary_creature_index = int(input("Sorry, invalid input! Please enter the index of the "
-                                                             "legendary creature you want to remove a rune from "
-                                                             "(1 - " +
-                                                             str(len(new_game.player_data.legendary_creature_inventory.
-                                                                     get_legendary_creatures())) + "): "))
+                    print(legendary_creature_listing.render_page())
+                    legendary_creature_index: int = choose_from_listing(legendary_creature_listing,
+                                                                        "Please enter the index of the legendary "
+                                                                        "creature you want to remove a rune from")
 
                     chosen_legendary_creature: LegendaryCreature = \
                         new_game.player_data.legendary_creature_inventory.get_legendary_creatures() \
@@ -5811,7 +7803,7 @@ def main() -> int:
                             input("Sorry, invalid input! Please enter the slot number of the rune you want to "
                                   "remove (1 - 6): "))
 
-                    chosen_legendary_creature.remove_rune(slot_number)
+                    journal.remove_rune_from_legendary_creature(new_game, chosen_legendary_creature, slot_number)
 
             elif action == "PLACE RUNE":
                 # Clearing up the command line window
@@ -5820,35 +7812,22 @@ def main() -> int:
                 # Allow the player to place a rune if there are legendary creatures in the legendary creature
                 # inventory.
                 if len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
+                    legendary_creature_listing: Listing = Listing(
+                        new_game.player_data.legendary_creature_inventory.get_legendary_creatures(),
+                        "LEGENDARY CREATURE")
                     print("Below is a list of legendary creatures you have.\n")
-                    curr_legendary_creature_index: int = 1  # initial value
-                    for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-                        print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                        print(str(legendary_creature) + "\n")
-                        curr_legendary_creature_index += 1
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                              "you want to place a rune on (1 - " +
-                                                              str(len(new_game.player_data.legendary_creature_inventory.
-                                                                      get_legendary_creatures())) + "): "))
-                    while legendary_creature_index < 1 or legendary_creature_index > \
-                            len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                        legendary_creature_index = int(input("Sorry, invalid input! Please enter the index of the "
-                                                             "legendary creature you want to place a rune on "
-                                                             "(1 - " +
-                                                             str(len(new_game.player_data.legendary_creature_inventory.
-                                                                     get_legendary_creatures())) + "): "))
+                    print(legendary_creature_listing.render_page())
+                    legendary_creature_index: int = choose_from_listing(legendary_creature_listing,
+                                                                        "Please enter the index of the legendary "
+                                                                        "creature you want to place a rune on")
 
                     chosen_legendary_creature: LegendaryCreature = \
                         new_game.player_data.legendary_creature_inventory.get_legendary_creatures() \
                             [legendary_creature_index - 1]
 
                     # Getting a list of runes which can be placed to the legendary creature
-                    runes: list = []  # initial value
-                    for item in new_game.player_data.item_inventory.get_items():
-                        if isinstance(item, Rune):
-                            if not item.already_placed:
-                                runes.append(item)
+                    runes: list = [rune for rune in new_game.player_data.item_inventory.get_items_by_class(Rune) if
+                                   not rune.already_placed]
 
                     print("Enter 'Y' for yes.")
                     print("Enter anything else for no.")
@@ -5856,35 +7835,22 @@ def main() -> int:
                         "Do you want to place a rune to " + str(chosen_legendary_creature.name) + "? ")
                     if place_rune == "Y":
                         if len(runes) > 0:
+                            rune_listing: Listing = Listing(runes, "RUNE")
                             print("Below is a list of runes you have.\n")
-                            curr_rune_index: int = 1  # initial value
-                            for rune in runes:
-                                print("RUNE #" + str(curr_rune_index))
-                                print(str(rune) + "\n")
-                                curr_rune_index += 1
-
-                            rune_index: int = int(input("Please enter the index of the rune you want to place to "
-                                                        "this legendary creature (1 - " + str(len(runes)) + "): "))
-                            while rune_index < 1 or rune_index > len(runes):
-                                rune_index = int(input(
-                                    "Sorry, invalid input! Please enter the index of the rune you want to place to "
-                                    "this legendary creature (1 - " + str(len(runes)) + "): "))
+                            print(rune_listing.render_page())
+                            rune_index: int = choose_from_listing(rune_listing, "Please enter the index of the rune "
+                                                                                "you want to place to this legendary "
+                                                                                "creature")
 
                             chosen_rune: Rune = runes[rune_index - 1]
-                            chosen_legendary_creature.place_rune(chosen_rune)
+                            journal.place_rune_on_legendary_creature(new_game, chosen_legendary_creature, chosen_rune)
 
             elif action == "MANAGE TRAINING AREA":
                 # Clearing up the command line window
                 clear()
 
                 # Getting a list of training areas in the player's city
-                training_areas: list = []  # initial value
-                for section in new_game.player_data.player_city.get_sections():
-                    for x in range(section.SECTION_WIDTH):
-                        for y in range(section.SECTION_HEIGHT):
-                            curr_tile: CityTile = section.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, TrainingArea):
-                                training_areas.append(curr_tile.building)
+                training_areas: list = new_game.player_data.player_city.get_buildings(TrainingArea)
 
                 # If there are training areas, ask the player which training area he/she wants to manage.
                 if len(training_areas) > 0:
@@ -5984,13 +7950,7 @@ def main() -> int:
                 clear()
 
                 # Getting a list of habitats in the player's city
-                habitats: list = []  # initial value
-                for section in new_game.player_data.player_city.get_sections():
-                    for x in range(section.SECTION_WIDTH):
-                        for y in range(section.SECTION_HEIGHT):
-                            curr_tile: CityTile = section.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, Habitat):
-                                habitats.append(curr_tile.building)
+                habitats: list = new_game.player_data.player_city.get_buildings(Habitat)
 
                 # If there are habitats, ask the player which training area he/she wants to manage.
                 if len(habitats) > 0:
@@ -6091,13 +8051,7 @@ def main() -> int:
                 clear()
 
                 # Getting a list of power-up circles in the player's city
-                power_up_circles: list = []  # initial value
-                for section in new_game.player_data.player_city.get_sections():
-                    for x in range(section.SECTION_WIDTH):
-                        for y in range(section.SECTION_HEIGHT):
-                            curr_tile: CityTile = section.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, PowerUpCircle):
-                                power_up_circles.append(curr_tile.building)
+                power_up_circles: list = new_game.player_data.player_city.get_buildings(PowerUpCircle)
 
                 # If there are power up circles, ask the player which power-up circle he/she wants to use
                 if len(power_up_circles) > 0:
@@ -6161,8 +8115,8 @@ def main() -> int:
                                                                   get_legendary_creatures()))) +
                                                       "_: "))
 
-                        legendary_creature_options: list = new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures()
+                        legendary_creature_options: list = list(new_game.player_data.legendary_creature_inventory.
+                                                                get_legendary_creatures())
                         legendary_creature_options.remove(to_be_evolved)
                         for i in range(num_materials):
                             print("Below is a list of legendary creatures you can choose as a material.\n")
@@ -6199,13 +8153,7 @@ def main() -> int:
                 clear()
 
                 # Getting a list of power-up circles in the player's city
-                power_up_circles: list = []  # initial value
-                for section in new_game.player_data.player_city.get_sections():
-                    for x in range(section.SECTION_WIDTH):
-                        for y in range(section.SECTION_HEIGHT):
-                            curr_tile: CityTile = section.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, PowerUpCircle):
-                                power_up_circles.append(curr_tile.building)
+                power_up_circles: list = new_game.player_data.player_city.get_buildings(PowerUpCircle)
 
                 # If there are power up circles, ask the player which power-up circle he/she wants to use
                 if len(power_up_circles) > 0:
@@ -6272,8 +8220,8 @@ def main() -> int:
                                                                   get_legendary_creatures()))) +
                                                       "_: "))
 
-                        legendary_creature_options: list = new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures()
+                        legendary_creature_options: list = list(new_game.player_data.legendary_creature_inventory.
+                                                                get_legendary_creatures())
                         legendary_creature_options.remove(to_be_powered_up)
                         for i in range(num_materials):
                             print("Below is a list of legendary creatures you can choose as a material.\n")
@@ -6318,41 +8266,21 @@ def main() -> int:
                 # legendary creature.
                 if len(neither_rune_nor_egg_items) > 0 and \
                         len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
+                    item_listing: Listing = Listing(neither_rune_nor_egg_items, "ITEM")
                     print("Below is a list of items which are neither runes nor eggs that you have.\n")
-                    curr_item_index: int = 1  # initial value
-                    for item in neither_rune_nor_egg_items:
-                        print("ITEM #" + str(curr_item_index))
-                        print(str(item) + "\n")
-                        curr_item_index += 1
-
-                    item_index: int = int(input("Please enter the index of the item you want to give (1 - " +
-                                                str(len(neither_rune_nor_egg_items)) + "): "))
-                    while item_index < 1 or item_index > len(neither_rune_nor_egg_items):
-                        item_index = int(input("Sorry, invalid input! Please enter the index of the item you want to "
-                                               "give (1 - " +
-                                               str(len(neither_rune_nor_egg_items)) + "): "))
+                    print(item_listing.render_page())
+                    item_index: int = choose_from_listing(item_listing, "Please enter the index of the item you want "
+                                                                        "to give")
 
                     item_to_give: Item = neither_rune_nor_egg_items[item_index - 1]
+                    legendary_creature_listing: Listing = Listing(
+                        new_game.player_data.legendary_creature_inventory.get_legendary_creatures(),
+                        "LEGENDARY CREATURE")
                     print("Below is a list of legendary creatures you have.\n")
-                    curr_legendary_creature_index: int = 1  # initial value
-                    for legendary_creature in new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures():
-                        print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                        print(str(legendary_creature) + "\n")
-                        curr_legendary_creature_index += 1
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature you "
-                                                              "want to give the item to (1 - " +
-                                                              str(len(new_game.player_data.legendary_creature_inventory.
-                                                                      get_legendary_creatures())) + "): "))
-                    while legendary_creature_index < 1 or legendary_creature_index > len(
-                            new_game.player_data.legendary_creature_inventory.
-                                    get_legendary_creatures()):
-                        legendary_creature_index = int(
-                            input("Sorry, invalid input! Please enter the index of the legendary creature you "
-                                  "want to give the item to (1 - " +
-                                  str(len(new_game.player_data.legendary_creature_inventory.
-                                          get_legendary_creatures())) + "): "))
+                    print(legendary_creature_listing.render_page())
+                    legendary_creature_index: int = choose_from_listing(legendary_creature_listing,
+                                                                        "Please enter the index of the legendary "
+                                                                        "creature you want to give the item to")
 
                     chosen_legendary_creature: LegendaryCreature = new_game.player_data.legendary_creature_inventory. \
                         get_legendary_creatures()[legendary_creature_index - 1]
@@ -6370,24 +8298,13 @@ def main() -> int:
                 clear()
 
                 # Printing a list of legendary creatures the player can feed.
+                legendary_creature_listing: Listing = Listing(
+                    new_game.player_data.legendary_creature_inventory.get_legendary_creatures(), "LEGENDARY CREATURE")
                 print("Below is a list of legendary creatures you can feed.\n")
-                curr_legendary_creature_index: int = 1  # initial value
-                for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
-                    print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                    print(str(legendary_creature) + "\n")
-                    curr_legendary_creature_index += 1
-
-                legendary_creature_index: int = int(input("Please enter the index of the legendary "
-                                                          "creature you want to feed (1 - " +
-                                                          str(len(new_game.player_data.legendary_creature_inventory.
-                                                                  get_legendary_creatures())) + "): "))
-                while legendary_creature_index < 1 or legendary_creature_index > \
-                        len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                    legendary_creature_index = int(
-                        input("Sorry, invalid input! Please enter the index of the legendary "
-                              "creature you want to feed (1 - " +
-                              str(len(new_game.player_data.legendary_creature_inventory.
-                                      get_legendary_creatures())) + "): "))
+                print(legendary_creature_listing.render_page())
+                legendary_creature_index: int = choose_from_listing(legendary_creature_listing,
+                                                                    "Please enter the index of the legendary "
+                                                                    "creature you want to feed")
 
                 chosen_legendary_creature: LegendaryCreature = new_game.player_data.legendary_creature_inventory. \
                     get_legendary_creatures()[legendary_creature_index - 1]
@@ -6407,13 +8324,7 @@ def main() -> int:
                 clear()
 
                 # Getting a list of hatcheries the player has.
-                hatcheries: list = []  # initial value
-                for section in new_game.player_data.player_city.get_sections():
-                    for x in range(section.SECTION_WIDTH):
-                        for y in range(section.SECTION_HEIGHT):
-                            curr_tile: CityTile = section.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, Hatchery):
-                                hatcheries.append(curr_tile.building)
+                hatcheries: list = new_game.player_data.player_city.get_buildings(Hatchery)
 
                 # Getting a list of eggs the player can place.
                 eggs: list = []  # initial value
@@ -6467,13 +8378,7 @@ def main() -> int:
                 clear()
 
                 # Getting a list of fusion centers in the player's city
-                fusion_centers: list = []  # initial value
-                for section in new_game.player_data.player_city.get_sections():
-                    for x in range(section.SECTION_WIDTH):
-                        for y in range(section.SECTION_HEIGHT):
-                            curr_tile: CityTile = section.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, FusionCenter):
-                                fusion_centers.append(curr_tile.building)
+                fusion_centers: list = new_game.player_data.player_city.get_buildings(FusionCenter)
 
                 potential_material_legendary_creatures: list = [legendary_creature for legendary_creature in
                                                                 new_game.player_data.legendary_creature_inventory.
@@ -6532,13 +8437,7 @@ def main() -> int:
                 clear()
 
                 # Getting a list of temples of wishes in the player's city
-                temples_of_wishes: list = []  # initial value
-                for section in new_game.player_data.player_city.get_sections():
-                    for x in range(section.SECTION_WIDTH):
-                        for y in range(section.SECTION_HEIGHT):
-                            curr_tile: CityTile = section.get_tile_at(x, y)
-                            if isinstance(curr_tile.building, TempleOfWishes):
-                                temples_of_wishes.append(curr_tile.building)
+                temples_of_wishes: list = new_game.player_data.player_city.get_buildings(TempleOfWishes)
 
                 # If there are temples of wishes, ask the player to choose which temple of wishes he/she wants to use
                 if len(temples_of_wishes) > 0:
@@ -6565,55 +8464,35 @@ def main() -> int:
                 # Clearing up the command line window
                 clear()
                 if len(new_game.player_data.item_inventory.get_items()) > 0:
+                    item_listing: Listing = Listing(new_game.player_data.item_inventory.get_items(), "ITEM")
                     print("Below is a list of items in your item inventory.\n")
-                    curr_item_index: int = 1
-                    for item in new_game.player_data.item_inventory.get_items():
-                        print("ITEM #" + str(curr_item_index))
-                        print(str(item) + "\n")
-                        curr_item_index += 1
-
+                    print(item_listing.render_page())
                     print("Enter 'Y' for yes.")
                     print("Enter anything else for no.")
                     sell_item: str = input("Do you want to sell an item? ")
                     if sell_item == "Y":
-                        item_index: int = int(input("Please enter the index of the item you want to sell (1 - " +
-                                                    str(len(new_game.player_data.item_inventory.get_items())) + "): "))
-                        while item_index < 1 or item_index > len(new_game.player_data.item_inventory.get_items()):
-                            item_index = int(input("Sorry, invalid input! Please enter the index of the item you "
-                                                   "want to sell (1 - " +
-                                                   str(len(new_game.player_data.item_inventory.get_items())) + "): "))
-
+                        item_index: int = choose_from_listing(item_listing, "Please enter the index of the item you "
+                                                                            "want to sell")
                         to_be_sold: Item = new_game.player_data.item_inventory.get_items()[item_index - 1]
-                        if new_game.player_data.sell_item(to_be_sold):
+                        if journal.sell_item(new_game, to_be_sold):
                             print("Congratulations! You have earned " + str(to_be_sold.sell_gold_gain) + " gold and " +
                                   str(to_be_sold.sell_gem_gain) + " gems for selling " + str(to_be_sold.name) + "!")
                         else:
                             print("Sorry! " + str(to_be_sold.name) + " cannot be sold!")
 
-                    runes: list = []  # initial value
-                    for item in new_game.player_data.item_inventory.get_items():
-                        if isinstance(item, Rune):
-                            runes.append(item)
+                    runes: list = new_game.player_data.item_inventory.get_items_by_class(Rune)
 
                     # Ask the player which rune to level up if there are runes in the item inventory
                     if len(runes) > 0:
+                        rune_listing: Listing = Listing(runes, "RUNE")
                         print("Below is a list of runes you have.\n")
-                        curr_rune_index: int = 1  # initial value
-                        for rune in runes:
-                            print("RUNE #" + str(curr_rune_index))
-                            print(str(rune) + "\n")
-                            curr_rune_index += 1
-
+                        print(rune_listing.render_page())
                         print("Enter 'Y' for yes.")
                         print("Enter anything else for no.")
                         level_up_rune: str = input("Do you want to level up a rune? ")
                         if level_up_rune == "Y":
-                            rune_index: int = int(input("Please enter the index of the rune you want to level "
-                                                        "up (1 - " + str(len(runes)) + "): "))
-                            while rune_index < 1 or rune_index > len(runes):
-                                rune_index = int(input("Sorry, invalid input! Please enter the index of the rune you "
-                                                       "want to level "
-                                                       "up (1 - " + str(len(runes)) + "): "))
+                            rune_index: int = choose_from_listing(rune_listing, "Please enter the index of the rune "
+                                                                                "you want to level up")
 
                             chosen_rune: Rune = runes[rune_index - 1]
                             new_game.player_data.level_up_rune(chosen_rune)
@@ -6622,27 +8501,14 @@ def main() -> int:
                 # Clearing up the command line window
                 clear()
                 if len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()) > 0:
+                    legendary_creature_listing: Listing = Listing(
+                        new_game.player_data.legendary_creature_inventory.get_legendary_creatures(),
+                        "LEGENDARY CREATURE")
                     print("Below is a list of legendary creatures in your legendary creature inventory.\n")
-                    curr_legendary_creature_index: int = 1  # initial value
-                    for legendary_creature in new_game.player_data.legendary_creature_inventory. \
-                            get_legendary_creatures():
-                        print("LEGENDARY CREATURE #" + str(curr_legendary_creature_index))
-                        print(str(legendary_creature) + "\n")
-                        curr_legendary_creature_index += 1
-
-                    legendary_creature_index: int = int(input("Please enter the index of the legendary creature "
-                                                              "you want to remove (1 - " +
-                                                              str(len(new_game.player_data.
-                                                                      legendary_creature_inventory.
-                                                                      get_legendary_creatures())) + "): "))
-                    while legendary_creature_index < 1 or legendary_creature_index > \
-                            len(new_game.player_data.legendary_creature_inventory.get_legendary_creatures()):
-                        legendary_creature_index = int(input("Sorry, invalid input! Please enter the "
-                                                             "index of the legendary creature "
-                                                             "you want to remove (1 - " +
-                                                             str(len(new_game.player_data.
-                                                                     legendary_creature_inventory.
-                                                                     get_legendary_creatures())) + "): "))
+                    print(legendary_creature_listing.render_page())
+                    legendary_creature_index: int = choose_from_listing(legendary_creature_listing,
+                                                                        "Please enter the index of the legendary "
+                                                                        "creature you want to remove")
 
                     to_be_removed: LegendaryCreature = \
                         new_game.player_data.legendary_creature_inventory.get_legendary_creatures() \
@@ -6714,8 +8580,7 @@ def main() -> int:
                     for legendary_creature in new_game.player_data.legendary_creature_inventory.get_legendary_creatures():
                         if not legendary_creature.placed_in_habitat and \
                                 not legendary_creature.placed_in_training_area and \
-                                legendary_creature.legendary_creature_id not in [creature.id for creature in
-                                                        new_game.player_data.battle_team.get_legendary_creatures()]:
+                                legendary_creature not in new_game.player_data.battle_team.get_legendary_creatures():
                             print("LEGENDARY CREATURE #" + str(current_legendary_creature_index))
                             print(str(legendary_creature) + "\n")
                             current_legendary_creature_index += 1
@@ -6819,8 +8684,8 @@ def main() -> int:
                                                                str(len(building_shop.get_buildings_sold())) + "): "))
 
                                 to_build: Building = building_shop.get_buildings_sold()[building_index - 1]
-                                if new_game.player_data.build_at_section_tile(chosen_section_index - 1, tile_x, tile_y,
-                                                                              to_build):
+                                if journal.build_at_section_tile(new_game, chosen_section_index - 1, tile_x, tile_y,
+                                                                 to_build):
                                     print("You have successfully built " + str(to_build.name) + "!")
                                 else:
                                     print("Sorry, you cannot build " + str(to_build.name) + "!")
@@ -6870,326 +8735,18 @@ def main() -> int:
                     # Show the current stage
                     print("--------------------STAGE #" + str(curr_stage_number + 1) + "--------------------")
                     curr_battle: Battle = Battle(new_game.player_data.battle_team,
-                                                 Team(current_stage.get_enemies_list()))
-                    while curr_battle.winner is None:
-                        # Printing out the stats of legendary creatures in both teams
-                        print("Below are the stats of all legendary creatures in player's team.\n")
-                        for legendary_creature in curr_battle.team1.get_legendary_creatures():
-                            print(str(legendary_creature) + "\n")
-
-                        print("Below are the stats of all legendary creatures in enemy's team.\n")
-                        for legendary_creature in curr_battle.team2.get_legendary_creatures():
-                            print(str(legendary_creature) + "\n")
-
-                        # Make a legendary creature move
-                        curr_battle.get_someone_to_move()
-                        assert isinstance(curr_battle.whose_turn, LegendaryCreature), "Cannot proceed with battle!"
-
-                        if not curr_battle.whose_turn.can_move:
-                            # Skip turn
-                            curr_battle.whose_turn.have_turn(curr_battle.whose_turn, None, "NORMAL HEAL")
-
-                            # Make another legendary creature move
-                            curr_battle.get_someone_to_move()
-                            assert isinstance(curr_battle.whose_turn, LegendaryCreature), \
-                                "Cannot proceed with battle!"
-
-                        # Checking which legendary creature moves
-                        if curr_battle.whose_turn in curr_battle.team1.get_legendary_creatures():
-                            moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                            # Asking the player what he/she wants to do
-                            print("Enter 'NORMAL ATTACK' for normal attack.")
-                            print("Enter 'NORMAL HEAL' for normal heal.")
-                            print("Enter anything else to use a skill (only applicable if you have usable skills).")
-                            usable_skills: list = [skill for skill in curr_battle.whose_turn.get_skills()
-                                                   if curr_battle.whose_turn.curr_magic_points >=
-                                                   skill.magic_points_cost and isinstance(skill, ActiveSkill)]
-                            possible_actions: list = ["NORMAL ATTACK", "NORMAL HEAL"]
-                            trainer_battle_action: str = input("What do you want to do? ")
-                            while len(usable_skills) == 0 and trainer_battle_action not in possible_actions:
-                                print("Enter 'NORMAL ATTACK' for normal attack.")
-                                print("Enter 'NORMAL HEAL' for normal heal.")
-                                trainer_battle_action = input("Sorry, invalid input! What do you want to do? ")
-
-                            if trainer_battle_action not in possible_actions:
-                                # Use skill
-                                trainer_battle_action = "USE SKILL"
-
-                                # Show a list of skills the player can use
-                                print("Below is a list of skills you can use.\n")
-                                curr_skill_index: int = 1  # initial value
-                                for skill in usable_skills:
-                                    print("SKILL #" + str(curr_skill_index))
-                                    print(str(skill) + "\n")
-                                    curr_skill_index += 1
-
-                                skill_index: int = int(input("Please enter the index of the skill "
-                                                             "you want to use (1 - " +
-                                                             str(len(usable_skills)) + "): "))
-                                while skill_index < 1 or skill_index > len(usable_skills):
-                                    skill_index = int(input("Sorry, invalid input! Please enter the "
-                                                            "index of the skill "
-                                                            "you want to use (1 - " +
-                                                            str(len(usable_skills)) + "): "))
-
-                                skill_to_use: ActiveSkill = usable_skills[skill_index - 1]
-                                if skill_to_use.active_skill_type == "ATTACK":
-                                    # Asking the user to select a target
-                                    print("Below is a list of enemies you can attack.")
-                                    enemy_index: int = 1  # initial value
-                                    for enemy in curr_battle.team2.get_legendary_creatures():
-                                        print("ENEMY #" + str(enemy_index))
-                                        print(str(enemy) + "\n")
-                                        enemy_index += 1
-
-                                    chosen_enemy_index: int = int(input("Please enter the index of the "
-                                                                        "enemy you want to attack (1 - " +
-                                                                        str(len(curr_battle.
-                                                                                team2.get_legendary_creatures())) +
-                                                                        "): "))
-                                    while chosen_enemy_index < 1 or chosen_enemy_index > len(curr_battle.
-                                                                                                     team2.get_legendary_creatures()):
-                                        chosen_enemy_index = int(input("Sorry, invalid input! "
-                                                                       "Please enter the index of the "
-                                                                       "enemy you want to attack (1 - " +
-                                                                       str(len(curr_battle.
-                                                                               team2.get_legendary_creatures())) +
-                                                                       "): "))
-
-                                    chosen_enemy_target: LegendaryCreature = curr_battle.team2. \
-                                        get_legendary_creatures()[chosen_enemy_index - 1]
-                                    curr_battle.whose_turn.have_turn(chosen_enemy_target, skill_to_use,
-                                                                     trainer_battle_action)
-                                    if random.random() < chosen_enemy_target.counterattack_chance + \
-                                            chosen_enemy_target.counterattack_chance_up:
-                                        chosen_enemy_target.counterattack(curr_battle.whose_turn)
-
-                                elif skill_to_use.active_skill_type == "HEAL":
-                                    # Asking the user to select who to heal
-                                    print("Below is a list of allies you can heal.")
-                                    ally_index: int = 1  # initial value
-                                    for ally in curr_battle.team1.get_legendary_creatures():
-                                        print("ALLY #" + str(ally_index))
-                                        print(str(ally) + "\n")
-                                        ally_index += 1
-
-                                    chosen_ally_index: int = int(input("Please enter the index of the "
-                                                                       "ally you want to heal (1 - " +
-                                                                       str(len(curr_battle.
-                                                                               team1.get_legendary_creatures())) +
-                                                                       "): "))
-                                    while chosen_ally_index < 1 or chosen_ally_index > len(curr_battle.
-                                                                                                   team1.get_legendary_creatures()):
-                                        chosen_ally_index = int(input("Sorry, invalid input! "
-                                                                      "Please enter the index of the "
-                                                                      "ally you want to heal (1 - " +
-                                                                      str(len(curr_battle.
-                                                                              team1.get_legendary_creatures())) +
-                                                                      "): "))
-
-                                    chosen_ally_target: LegendaryCreature = curr_battle.team1. \
-                                        get_legendary_creatures()[chosen_ally_index - 1]
-                                    curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
-                                                                     trainer_battle_action)
-                                elif skill_to_use.active_skill_type == "ALLIES EFFECT":
-                                    # Asking the user to select who to apply ally effect on
-                                    print("Below is a list of allies you can apply ally effect on.")
-                                    ally_index: int = 1  # initial value
-                                    for ally in curr_battle.team1.get_legendary_creatures():
-                                        print("ALLY #" + str(ally_index))
-                                        print(str(ally) + "\n")
-                                        ally_index += 1
-
-                                    chosen_ally_index: int = int(input("Please enter the index of the "
-                                                                       "ally you want to apply ally effect on (1 - " +
-                                                                       str(len(curr_battle.
-                                                                               team1.get_legendary_creatures())) +
-                                                                       "): "))
-                                    while chosen_ally_index < 1 or chosen_ally_index > len(curr_battle.
-                                                                                                   team1.get_legendary_creatures()):
-                                        chosen_ally_index = int(input("Sorry, invalid input! "
-                                                                      "Please enter the index of the "
-                                                                      "ally you want to apply ally effect on (1 - " +
-                                                                      str(len(curr_battle.
-                                                                              team1.get_legendary_creatures())) +
-                                                                      "): "))
-
-                                    chosen_ally_target: LegendaryCreature = curr_battle.team1. \
-                                        get_legendary_creatures()[chosen_ally_index - 1]
-                                    curr_battle.whose_turn.have_turn(chosen_ally_target, skill_to_use,
-                                                                     trainer_battle_action)
-                                elif skill_to_use.active_skill_type == "ENEMIES EFFECT":
-                                    # Asking the user to select who to apply enemy effect on
-                                    print("Below is a list of enemies you can apply enemy effect on.")
-                                    enemy_index: int = 1  # initial value
-                                    for enemy in curr_battle.team2.get_legendary_creatures():
-                                        print("ENEMY #" + str(enemy_index))
-                                        print(str(enemy) + "\n")
-                                        enemy_index += 1
-
-                                    chosen_enemy_index: int = int(input("Please enter the index of the "
-                                                                        "enemy you want to apply enemy effect on"
-                                                                        " (1 - " +
-                                                                        str(len(curr_battle.
-                                                                                team2.get_legendary_creatures())) +
-                                                                        "): "))
-                                    while chosen_enemy_index < 1 or chosen_enemy_index > len(curr_battle.
-                                                                                                     team2.get_legendary_creatures()):
-                                        chosen_enemy_index = int(input("Sorry, invalid input! "
-                                                                       "Please enter the index of the "
-                                                                       "enemy you want to apply enemy effect on"
-                                                                       " (1 - " +
-                                                                       str(len(curr_battle.
-                                                                               team2.get_legendary_creatures())) +
-                                                                       "): "))
-
-                                    chosen_enemy_target: LegendaryCreature = curr_battle.team2. \
-                                        get_legendary_creatures()[chosen_enemy_index - 1]
-                                    curr_battle.whose_turn.have_turn(chosen_enemy_target, skill_to_use,
-                                                                     trainer_battle_action)
-
-                            elif trainer_battle_action == "NORMAL ATTACK":
-                                # Asking the user to select a target
-                                print("Below is a list of enemies you can attack.")
-                                enemy_index: int = 1  # initial value
-                                for enemy in curr_battle.team2.get_legendary_creatures():
-                                    print("ENEMY #" + str(enemy_index))
-                                    print(str(enemy) + "\n")
-                                    enemy_index += 1
-
-                                chosen_enemy_index: int = int(input("Please enter the index of the "
-                                                                    "enemy you want to attack (1 - " +
-                                                                    str(len(curr_battle.
-                                                                            team2.get_legendary_creatures())) +
-                                                                    "): "))
-                                while chosen_enemy_index < 1 or chosen_enemy_index > len(curr_battle.
-                                                                                                 team2.get_legendary_creatures()):
-                                    chosen_enemy_index = int(input("Sorry, invalid input! "
-                                                                   "Please enter the index of the "
-                                                                   "enemy you want to attack (1 - " +
-                                                                   str(len(curr_battle.
-                                                                           team2.get_legendary_creatures())) +
-                                                                   "): "))
-
-                                chosen_enemy_target: LegendaryCreature = curr_battle.team2. \
-                                    get_legendary_creatures()[chosen_enemy_index - 1]
-                                curr_battle.whose_turn.have_turn(chosen_enemy_target, None, trainer_battle_action)
-                                if random.random() < chosen_enemy_target.counterattack_chance + \
-                                        chosen_enemy_target.counterattack_chance_up:
-                                    chosen_enemy_target.counterattack(curr_battle.whose_turn)
-
-                            elif trainer_battle_action == "NORMAL HEAL":
-                                # Asking the user to select who to heal
-                                print("Below is a list of allies you can heal.")
-                                ally_index: int = 1  # initial value
-                                for ally in curr_battle.team1.get_legendary_creatures():
-                                    print("ALLY #" + str(ally_index))
-                                    print(str(ally) + "\n")
-                                    ally_index += 1
-
-                                chosen_ally_index: int = int(input("Please enter the index of the "
-                                                                   "ally you want to heal (1 - " +
-                                                                   str(len(curr_battle.
-                                                                           team1.get_legendary_creatures())) +
-                                                                   "): "))
-                                while chosen_ally_index < 1 or chosen_ally_index > len(curr_battle.
-                                                                                               team1.get_legendary_creatures()):
-                                    chosen_ally_index = int(input("Sorry, invalid input! "
-                                                                  "Please enter the index of the "
-                                                                  "ally you want to heal (1 - " +
-                                                                  str(len(curr_battle.
-                                                                          team1.get_legendary_creatures())) +
-                                                                  "): "))
-
-                                chosen_ally_target: LegendaryCreature = curr_battle.team1. \
-                                    get_legendary_creatures()[chosen_ally_index - 1]
-                                curr_battle.whose_turn.have_turn(chosen_ally_target, None,
-                                                                 trainer_battle_action)
-                            else:
-                                pass
-
-                            # Checking the case where the moving legendary creature gets an extra turn
-                            if random.random() < moving_legendary_creature.extra_turn_chance + \
-                                    moving_legendary_creature.extra_turn_chance_up and \
-                                    moving_legendary_creature.can_move:
-                                curr_battle.whose_turn = moving_legendary_creature
-
-                                # Recovering magic points
-                                curr_battle.whose_turn.recover_magic_points()
-                            else:
-                                curr_battle.get_someone_to_move()
-
-                        elif curr_battle.whose_turn in curr_battle.team2.get_legendary_creatures():
-                            curr_moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                            chance: float = random.random()
-                            trainer_battle_action: str = "NORMAL ATTACK" if chance <= 1 / 3 else \
-                                "NORMAL HEAL" if 1 / 3 < chance <= 2 / 3 else "USE SKILL"
-                            usable_skills: list = [skill for skill in curr_battle.whose_turn.get_skills()
-                                                   if curr_battle.whose_turn.curr_magic_points >=
-                                                   skill.magic_points_cost and isinstance(skill, ActiveSkill)]
-
-                            # If there are no usable skills and 'trainer_battle_action' is set to "USE SKILL",
-                            # change the value of 'trainer_battle_action'
-                            if len(usable_skills) == 0:
-                                trainer_battle_action = "NORMAL ATTACK" if random.random() < 0.5 else "NORMAL HEAL"
-
-                            if trainer_battle_action == "NORMAL ATTACK":
-                                # A normal attack occurs
-                                moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                                target: LegendaryCreature = curr_battle.team1.get_legendary_creatures() \
-                                    [random.randint(0, len(curr_battle.team1.get_legendary_creatures()) - 1)]
-                                moving_legendary_creature.have_turn(target, None, trainer_battle_action)
-                                if random.random() < target.counterattack_chance + \
-                                        target.counterattack_chance_up:
-                                    target.counterattack(moving_legendary_creature)
-                            elif trainer_battle_action == "NORMAL HEAL":
-                                # A normal heal occurs
-                                moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                                target: LegendaryCreature = curr_battle.team2.get_legendary_creatures() \
-                                    [random.randint(0, len(curr_battle.team2.get_legendary_creatures()) - 1)]
-                                moving_legendary_creature.have_turn(target, None, trainer_battle_action)
-                            elif trainer_battle_action == "USE SKILL":
-                                # A skill is used
-                                moving_legendary_creature: LegendaryCreature = curr_battle.whose_turn
-                                skill_to_use: ActiveSkill = usable_skills[random.randint(0, len(usable_skills) - 1)]
-                                if skill_to_use.active_skill_type == "ATTACK" or \
-                                        skill_to_use.active_skill_type == "ENEMIES EFFECT":
-                                    target: LegendaryCreature = curr_battle.team1.get_legendary_creatures() \
-                                        [random.randint(0, len(curr_battle.team1.get_legendary_creatures()) - 1)]
-                                    moving_legendary_creature.have_turn(target, skill_to_use, trainer_battle_action)
-                                    if skill_to_use.active_skill_type == "ATTACK":
-                                        if random.random() < target.counterattack_chance + \
-                                                target.counterattack_chance_up:
-                                            target.counterattack(moving_legendary_creature)
-                                else:
-                                    target: LegendaryCreature = curr_battle.team2.get_legendary_creatures() \
-                                        [random.randint(0, len(curr_battle.team2.get_legendary_creatures()) - 1)]
-                                    moving_legendary_creature.have_turn(target, skill_to_use, trainer_battle_action)
-                            else:
-                                pass
-
-                            # Checking the case where the moving legendary creature gets an extra turn
-                            if random.random() < curr_moving_legendary_creature.extra_turn_chance + \
-                                    curr_moving_legendary_creature.extra_turn_chance_up and \
-                                    curr_moving_legendary_creature.can_move:
-                                curr_battle.whose_turn = curr_moving_legendary_creature
-
-                                # Recovering magic points
-                                curr_battle.whose_turn.recover_magic_points()
-                            else:
-                                curr_battle.get_someone_to_move()
-
-                        # Recovering magic points
-                        curr_battle.whose_turn.recover_magic_points()
+                                                 Team(current_stage.get_enemies_list()),
+                                                 derive_random_number_generator(rng))
+                    BattleEngine(verbose=True).play(curr_battle, InteractiveBattlePolicy(), RandomBattlePolicy())
 
                     if curr_battle.winner == curr_battle.team1:
                         print("Congratulations! You won the battle!")
-                        new_game.player_data.claim_reward(curr_battle.reward)
+                        journal.claim_reward(new_game, curr_battle.reward)
                         current_stage.is_cleared = True
 
                         # Checking whether the next stage is None or not. If yes, the player has cleared the level
                         if chosen_level.next_stage(curr_stage_number) is None:
-                            new_game.player_data.claim_reward(chosen_level.clear_reward)
+                            journal.claim_reward(new_game, chosen_level.clear_reward)
                             chosen_level.is_cleared = True
                             new_game.player_data.add_unlocked_level()
                         else:
@@ -7203,12 +8760,61 @@ def main() -> int:
                     curr_battle.team1.recover_all()
                     curr_battle.team2.recover_all()
 
+                    if curr_battle.winner != curr_battle.team1:
+                        # The player has to choose a level again after failing to clear a stage
+                        break
+
         print("Enter 'Y' for yes.")
         print("Enter anything else for no.")
         continue_playing = input("Do you want to continue playing 'Legendary Creature City Builder'? ")
 
     # Saving game data and quitting the game.
-    save_game_data(new_game, file_name)
+    journal.compact(new_game)
+    if profile_store is not None:
+        profile_store.close()
+
+    return 0
+
+
+def simulate_battles_main(argv=None):
+    # type: (list or None) -> int
+    """
+    This main method is used to estimate the win rates of the battle team of a player with saved game data against
+    the CPU players in the battle arena and the stages of the unlocked levels.
+    :return: an integer
+    """
+
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Estimate the win rates of the battle team of a player in 'Legendary Creature City Builder'.")
+    argument_parser.add_argument("player_name", help="the name of the player with saved game data")
+    argument_parser.add_argument("--battles", type=int, default=1000, help="the number of battles per matchup")
+    argument_parser.add_argument("--seed", type=int, default=0, help="the seed of the first battle")
+    argument_parser.add_argument("--processes", type=int, default=None, help="the number of processes to use")
+    arguments: argparse.Namespace = argument_parser.parse_args(argv)
+
+    file_name: str = "SAVED LEGENDARY CREATURE CITY BUILDER GAME DATA - " + str(arguments.player_name).upper()
+    try:
+        saved_game: Game = load_game_data(file_name)
+    except FileNotFoundError:
+        print("Sorry! No saved game data found for " + str(arguments.player_name) + "!")
+        return 1
+
+    team: Team = saved_game.player_data.battle_team
+    table: list = []  # initial value
+    for cpu, battle_statistics in estimate_arena_win_rates(team, saved_game.battle_arena, arguments.battles,
+                                                           arguments.seed, arguments.processes):
+        table.append([str(cpu.name), battle_statistics.get_win_rate(),
+                      battle_statistics.get_average_number_of_turns()])
+
+    for level in saved_game.player_data.get_unlocked_levels():
+        stage_number: int = 1  # initial value
+        for stage, battle_statistics in estimate_level_win_rates(team, level, arguments.battles, arguments.seed,
+                                                                 arguments.processes):
+            table.append([str(level.name) + " STAGE #" + str(stage_number), battle_statistics.get_win_rate(),
+                          battle_statistics.get_average_number_of_turns()])
+            stage_number += 1
+
+    print(tabulate(table, headers=["OPPONENT", "WIN RATE", "AVERAGE NUMBER OF TURNS"], tablefmt="fancy_grid"))
     return 0
 
 
@@ -0,0 +1,187 @@
+"""
+This file contains benchmarks of performance sensitive parts of the game "Legendary Creature City Builder".
+Run it with "python legendary_creature_city_builder_benchmarks.py".
+"""
+
+
+import timeit
+import tracemalloc
+from legendary_creature_city_builder import *
+
+
+def create_runed_legendary_creature(rating):
+    # type: (int) -> LegendaryCreature
+    legendary_creature: LegendaryCreature = generate_random_legendary_creature("FLAME")
+    legendary_creature.rating = rating
+    legendary_creature.max_level = 10 * triangular(rating) if rating < LegendaryCreature.MAX_RATING else \
+        float('inf')
+    for slot_number in range(Rune.MIN_SLOT_NUMBER, Rune.MAX_SLOT_NUMBER + 1):
+        legendary_creature.place_rune(create_rune_for_sale(6, slot_number, Rune.POTENTIAL_SET_NAMES[slot_number],
+                                                           "HP%"))
+
+    return legendary_creature
+
+
+def level_up_one_level_at_a_time(legendary_creature, levels):
+    # type: (LegendaryCreature, int) -> None
+    # Every call to level_up() only has enough EXP for one level, so the stats are rescaled and the legendary
+    # creature is restored once per level.
+    for i in range(levels):
+        legendary_creature.exp = legendary_creature.required_exp
+        legendary_creature.level_up()
+
+
+def level_up_all_levels_at_once(legendary_creature, levels):
+    # type: (LegendaryCreature, int) -> None
+    required_exp: mpf = legendary_creature.required_exp
+    for level in range(legendary_creature.level + 1, legendary_creature.level + levels):
+        required_exp *= mpf("10") ** level
+
+    legendary_creature.exp = required_exp
+    legendary_creature.level_up()
+
+
+def benchmark_level_up(levels=60, repeats=20):
+    # type: (int, int) -> None
+    print("Levelling up a legendary creature with six runes by " + str(levels) + " levels (" + str(repeats) +
+          " repeats)")
+    for level_up_function in [level_up_one_level_at_a_time, level_up_all_levels_at_once]:
+        legendary_creatures: list = [create_runed_legendary_creature(5) for i in range(repeats)]
+        seconds: float = timeit.timeit(lambda: level_up_function(legendary_creatures.pop(), levels), number=repeats)
+        print("    " + str(level_up_function.__name__) + ": " + str(round(seconds / repeats * 1000, 3)) +
+              " ms per legendary creature")
+
+
+def tick_and_attack(battle, ticks):
+    # type: (Battle, int) -> None
+    user: LegendaryCreature = battle.team1.get_legendary_creatures()[0]
+    target: LegendaryCreature = battle.team2.get_legendary_creatures()[0]
+    damage_multiplier: DamageMultiplier = DamageMultiplier(multiplier_to_self_attack_power=mpf("3.5"))
+    for i in range(ticks):
+        battle.tick()
+        damage_multiplier.calculate_raw_damage(user, target)
+
+
+def benchmark_numeric_modes(ticks=2000):
+    # type: (int) -> None
+    print("Ticking a battle and calculating damage " + str(ticks) + " times")
+    for mode in NUMERIC_MODES:
+        set_numeric_mode(mode)
+        team1: Team = Team([generate_random_legendary_creature("FLAME") for i in range(5)])
+        team2: Team = Team([generate_random_legendary_creature("SEA") for i in range(5)])
+        team1.recover_all()
+        team2.recover_all()
+        seconds: float = timeit.timeit(lambda: tick_and_attack(Battle(team1, team2), ticks), number=1)
+        print("    " + str(mode) + ": " + str(round(seconds * 1000, 3)) + " ms")
+
+    set_numeric_mode("mpf")
+
+
+def benchmark_economy_update(updates=20000):
+    # type: (int) -> None
+    print("Adding gold earned over a second to the gold of a player " + str(updates) + " times")
+    for gold, gold_per_second in [(mpf("5e6"), mpf("1e250")), (BigValue(5e6), BigValue(1e250))]:
+        def update_gold():
+            # type: () -> None
+            total_gold: mpf or BigValue = gold
+            for i in range(updates):
+                total_gold += gold_per_second * 1
+
+        seconds: float = timeit.timeit(update_gold, number=1)
+        print("    " + str(type(gold).__name__) + ": " + str(round(seconds * 1000, 3)) + " ms")
+
+
+def benchmark_battle_engine(battles=50):
+    # type: (int) -> None
+    print("Playing " + str(battles) + " battles between teams of three legendary creatures")
+    for mode in NUMERIC_MODES:
+        set_numeric_mode(mode)
+        teams: list = [(Team([generate_random_legendary_creature(element) for element in ["FLAME", "SEA", "NATURE"]]),
+                        Team([generate_random_legendary_creature(element) for element in ["TERRA", "ICE", "DARK"]]))
+                       for i in range(battles)]
+        seconds: float = timeit.timeit(lambda: [BattleEngine().run(team1, team2, RandomBattlePolicy(),
+                                                                   RandomBattlePolicy(), seed)
+                                                for seed, (team1, team2) in enumerate(teams)], number=1)
+        print("    " + str(mode) + ": " + str(round(battles / seconds, 3)) + " battles per second")
+
+    set_numeric_mode("mpf")
+
+
+def benchmark_vectorised_battles(battles=100000):
+    # type: (int) -> None
+    if np is None:
+        print("Skipping vectorised battles as NumPy is not installed")
+        return
+
+    print("Playing " + str(battles) + " vectorised battles between teams of three legendary creatures")
+    team1: Team = Team([generate_random_legendary_creature(element) for element in ["FLAME", "SEA", "NATURE"]])
+    team2: Team = Team([generate_random_legendary_creature(element) for element in ["TERRA", "ICE", "DARK"]])
+    seconds: float = timeit.timeit(lambda: VectorisedBattles.from_matchup(team1, team2, battles).run(seed=0),
+                                   number=1)
+    print("    " + str(round(battles / seconds * 60, 3)) + " battles per minute")
+
+
+def benchmark_save_game_data(repeats=5):
+    # type: (int) -> None
+    print("Saving and loading the game data of a new player with a generated battle arena (" + str(repeats) +
+          " repeats)")
+    game_data: Game = Game(Player("BENCHMARK"), item_shop, building_shop, Arena(generate_potential_cpu_players(0)),
+                           minigames)
+    for name, save, load in [("pickle", pickle.dumps, pickle.loads),
+                             ("saved game data", serialise_game_data, deserialise_game_data)]:
+        data: bytes = save(game_data)
+        save_seconds: float = timeit.timeit(lambda: save(game_data), number=repeats) / repeats
+        load_seconds: float = timeit.timeit(lambda: load(data), number=repeats) / repeats
+        print("    " + str(name) + ": " + str(len(data)) + " bytes, saved in " + str(round(save_seconds * 1000, 3)) +
+              " ms, loaded in " + str(round(load_seconds * 1000, 3)) + " ms")
+
+
+def benchmark_memory(objects=1000):
+    # type: (int) -> None
+    print("Measuring the memory used by " + str(objects) + " legendary creatures and runes")
+    for name, create_object in [("legendary creature", lambda: generate_random_legendary_creature("FLAME")),
+                                ("rune", lambda: create_rune_for_sale(6, 1, "ENERGY", "HP%"))]:
+        tracemalloc.start()
+        created_objects: list = [create_object() for i in range(objects)]
+        memory_used: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        # The dictionary of attributes each object would have without slots
+        dictionary_size: int = sys.getsizeof(get_object_state(created_objects[0]))
+        print("    " + str(name) + ": " + str(round(memory_used / objects)) + " bytes per object in total, " +
+              str(sys.getsizeof(created_objects[0])) + " bytes for its slots rather than " + str(dictionary_size) +
+              " bytes for a dictionary of attributes")
+
+
+def benchmark_rendering(objects=200, repeats=5):
+    # type: (int, int) -> None
+    print("Rendering " + str(objects) + " legendary creatures and runes and a summary of a player owning them (" +
+          str(repeats) + " repeats)")
+    player: Player = Player("BENCHMARK")
+    for i in range(objects):
+        player.add_legendary_creature(generate_random_legendary_creature("FLAME"))
+        player.add_item_to_inventory(create_rune_for_sale(6, 1, "ENERGY", "HP%"))
+
+    legendary_creatures: list = player.legendary_creature_inventory.get_legendary_creatures()
+    for name, render in [("legendary creatures", lambda: [str(legendary_creature) for legendary_creature in
+                                                          legendary_creatures]),
+                         ("runes", lambda: [str(rune) for rune in player.item_inventory.get_items()]),
+                         ("player summary", lambda: summarise(player))]:
+        seconds: float = timeit.timeit(render, number=repeats) / repeats
+        print("    " + str(name) + ": " + str(round(seconds * 1000, 3)) + " ms")
+
+
+def main():
+    # type: () -> int
+    benchmark_level_up()
+    benchmark_numeric_modes()
+    benchmark_economy_update()
+    benchmark_battle_engine()
+    benchmark_vectorised_battles()
+    benchmark_save_game_data()
+    benchmark_memory()
+    benchmark_rendering()
+    return 0
+
+
+if __name__ == '__main__':
+    main()
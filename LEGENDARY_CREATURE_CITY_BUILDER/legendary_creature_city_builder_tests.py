@@ -1,4 +1,5 @@
 import glob
+import tempfile
 import unittest
 from unittest.mock import patch
 from legendary_creature_city_builder import *
@@ -18,7 +19,7 @@ class MyTestCase(unittest.TestCase):
 
     @patch("legendary_creature_city_builder.input")
     def test_input_main_03(self, mocked_input):
-        mocked_input.side_effect = ["player 3", "player 3", "Y", "VIEW STATS", "N"]
+        mocked_input.side_effect = ["player 3", "player 3", "Y", "VIEW STATS", "Y", "N"]
         self.assertEquals(main(), 0)
 
     @patch("legendary_creature_city_builder.input")
@@ -108,6 +109,921 @@ class MyTestCase(unittest.TestCase):
         self.assertEquals(user7.level, 1)
         self.assertEquals(len(user7.item_inventory.get_items()), 5)
 
+    ################################################################################################################
+    # Checking whether the item shop catalogue creates the correct items on demand
+    def test_item_shop_catalogue(self):
+        items_sold: CatalogueView = item_shop.get_items_sold()
+        self.assertEqual(len(items_sold), 7063)
+        self.assertEqual(items_sold[0].name, "1-STAR ENERGY RUNE - SLOT 1")
+        self.assertEqual(items_sold[0].main_stat, "HP")
+        self.assertEqual(items_sold[7019].name, "6-STAR " + Rune.POTENTIAL_SET_NAMES[-1] + " RUNE - SLOT 6")
+        self.assertEqual(items_sold[7019].gold_cost, mpf("1e31"))
+        self.assertTrue(isinstance(items_sold[7020], Egg))
+        self.assertTrue(isinstance(items_sold[-1], SkillLevelUpShard))
+        self.assertEqual(len(list(items_sold)), len(items_sold))
+        self.assertEqual([rune.slot_number for rune in items_sold[0:1170:195]], [1, 2, 3, 4, 5, 6])
+
+    def test_catalogue_templates(self):
+        # Every item or building looked up in a shop is a new object created from a shared template
+        player_data: Player = Player("TEMPLATES")
+        egg: Egg = item_shop.get_items_sold()[7020]
+        self.assertTrue(player_data.purchase_item(egg))
+        egg.already_placed = True
+        self.assertFalse(item_shop.get_items_sold()[7020].already_placed)
+        self.assertFalse(building_shop.get_buildings_sold()[0] is building_shop.get_buildings_sold()[0])
+        self.assertEqual(building_shop.get_buildings_sold()[-1].element, Egg.POTENTIAL_ELEMENTS[-1])
+
+        template: CatalogueTemplate = building_shop.get_buildings_sold().get_templates()[0]
+        with self.assertRaises(AttributeError):
+            template.arguments = ()
+        self.assertTrue(copy.deepcopy(template) is template)
+        self.assertTrue(isinstance(pickle.loads(pickle.dumps(template)).create(), Hatchery))
+
+        # Runes in the same set share their set effect
+        self.assertTrue(item_shop.get_items_sold()[0].set_effect is item_shop.get_items_sold()[1].set_effect)
+
+    ################################################################################################################
+    # Checking whether the CPU players in the battle arena are generated lazily and cached by their seed
+    def test_arena_roster_cache(self):
+        with tempfile.TemporaryDirectory() as cache_directory:
+            arena: Arena = Arena(roster_seed=42, roster_cache_directory=cache_directory)
+            self.assertFalse(arena.roster_is_generated())
+            cpu_players: list = arena.get_potential_opponents()
+            self.assertTrue(arena.roster_is_generated())
+            self.assertEqual(len(cpu_players), ARENA_ROSTER_SIZE)
+            self.assertEqual(os.listdir(cache_directory),
+                             ["CPU ARENA ROSTER - VERSION " + str(ARENA_ROSTER_CACHE_VERSION) + " - SEED 42"])
+            cached_cpu_players: list = load_potential_cpu_players(42, cache_directory)
+            self.assertEqual([[legendary_creature.name for legendary_creature in
+                               cpu_player.battle_team.get_legendary_creatures()] for cpu_player in cpu_players],
+                             [[legendary_creature.name for legendary_creature in
+                               cpu_player.battle_team.get_legendary_creatures()] for cpu_player in
+                              cached_cpu_players])
+
+    def test_arena_roster_cache_from_environment(self):
+        with tempfile.TemporaryDirectory() as cache_directory:
+            with patch.dict(os.environ, {ARENA_ROSTER_SEED_VARIABLE: "7",
+                                         ARENA_ROSTER_CACHE_DIRECTORY_VARIABLE: cache_directory}):
+                cpu_players: list = create_battle_arena().get_potential_opponents()
+                cache_file_name: str = os.path.join(cache_directory, "CPU ARENA ROSTER - VERSION " +
+                                                    str(ARENA_ROSTER_CACHE_VERSION) + " - SEED 7")
+                self.assertTrue(os.path.isfile(cache_file_name))
+                with patch("legendary_creature_city_builder.generate_potential_cpu_players") as generate:
+                    self.assertEqual(len(create_battle_arena().get_potential_opponents()), len(cpu_players))
+                    generate.assert_not_called()
+
+                # A partially written cache is replaced rather than stopping the game from starting
+                with open(cache_file_name, "wb") as cache_file:
+                    cache_file.write(pickle.dumps(cpu_players)[:100])
+
+                self.assertEqual(len(create_battle_arena().get_potential_opponents()), len(cpu_players))
+                with open(cache_file_name, "rb") as cache_file:
+                    self.assertEqual(len(pickle.load(cache_file)), len(cpu_players))
+
+            with patch.dict(os.environ, {ARENA_ROSTER_CACHE_DIRECTORY_VARIABLE: ""}):
+                self.assertIsNone(create_battle_arena().roster_cache_directory)
+
+    ################################################################################################################
+    # Checking whether advancing the levels of a legendary creature at once matches levelling it up one at a time
+    def test_advance_levels(self):
+        legendary_creature: LegendaryCreature = generate_random_legendary_creature("FLAME")
+        legendary_creature.rating = 4
+        legendary_creature.max_level = 10 * triangular(legendary_creature.rating)
+        expected: LegendaryCreature = legendary_creature.clone()
+        for i in range(150):
+            expected.exp = expected.required_exp
+            expected.level_up()
+            if expected.level == expected.max_level:
+                expected.evolve()
+
+        self.assertEqual(legendary_creature.advance_levels(150), 149)
+        self.assertEqual((legendary_creature.rating, legendary_creature.level), (expected.rating, expected.level))
+        for attribute in ["max_hp", "max_magic_points", "attack_power", "defense", "attack_speed", "exp",
+                          "required_exp", "player_gold_per_second"]:
+            self.assertAlmostEqual(getattr(legendary_creature, attribute) / getattr(expected, attribute), 1)
+
+    def test_level_up_many_levels_with_runes(self):
+        legendary_creature: LegendaryCreature = generate_random_legendary_creature("ICE")
+        legendary_creature.rating = 5
+        legendary_creature.max_level = 10 * triangular(legendary_creature.rating)
+        for slot_number in range(Rune.MIN_SLOT_NUMBER, Rune.MAX_SLOT_NUMBER + 1):
+            legendary_creature.place_rune(create_rune_for_sale(6, slot_number, Rune.POTENTIAL_SET_NAMES[slot_number],
+                                                               "HP%"))
+
+        expected: LegendaryCreature = legendary_creature.clone()
+        for i in range(60):
+            expected.exp = expected.required_exp
+            expected.level_up()
+
+        legendary_creature.exp = expected.exp
+        legendary_creature.level_up()
+        self.assertEqual(legendary_creature.level, 61)
+        self.assertEqual(len(legendary_creature.get_runes()), 6)
+        for attribute in ["max_hp", "max_magic_points", "attack_power", "defense", "attack_speed", "curr_hp",
+                          "required_exp"]:
+            self.assertAlmostEqual(getattr(legendary_creature, attribute) / getattr(expected, attribute), 1)
+
+    def test_effective_stats_after_swapping_runes(self):
+        legendary_creature: LegendaryCreature = generate_random_legendary_creature("LIGHT")
+        base_max_hp: mpf = legendary_creature.max_hp
+        base_attack_power: mpf = legendary_creature.attack_power
+        runes: list = [create_rune_for_sale(6, slot_number, "ENERGY", "ATK%") for slot_number in
+                       range(Rune.MIN_SLOT_NUMBER, Rune.MAX_SLOT_NUMBER + 1)]
+        for i in range(50):
+            for rune in runes:
+                legendary_creature.place_rune(rune)
+
+            for rune in runes:
+                legendary_creature.remove_rune(rune.slot_number)
+
+        self.assertEqual(legendary_creature.max_hp, base_max_hp)
+        self.assertEqual(legendary_creature.attack_power, base_attack_power)
+        legendary_creature.place_rune(runes[0])
+        self.assertEqual(legendary_creature.max_hp, base_max_hp)
+        self.assertFalse(runes[0].set_effect_is_active)
+        legendary_creature.place_rune(runes[1])
+        self.assertEqual(legendary_creature.max_hp, base_max_hp * mpf("1.15"))
+        self.assertEqual(legendary_creature.attack_power, base_attack_power * mpf("1.24"))
+        self.assertTrue(runes[0].set_effect_is_active and runes[1].set_effect_is_active)
+        for rune in runes[2:5]:
+            legendary_creature.place_rune(rune)
+
+        self.assertEqual(legendary_creature.max_hp, base_max_hp * mpf("1.3"))
+        self.assertFalse(runes[4].set_effect_is_active)
+        replaced_rune: Rune = runes[1]
+        self.assertTrue(legendary_creature.place_rune(create_rune_for_sale(6, replaced_rune.slot_number, "FATAL",
+                                                                           "HP%")))
+        self.assertFalse(replaced_rune.already_placed or replaced_rune.set_effect_is_active)
+
+    def test_load_legendary_creature_with_old_stats(self):
+        legendary_creature: LegendaryCreature = generate_random_legendary_creature("DARK")
+        legendary_creature.place_rune(create_rune_for_sale(3, 1, "FATAL", "HP%"))
+        old_state: dict = {name: value for name, value in legendary_creature.__getstate__().items()
+                           if name[0:5] != "base_"}
+        for stat_name in ["max_hp", "max_magic_points", "attack_power", "defense", "attack_speed", "crit_rate",
+                          "crit_damage", "resistance", "accuracy", "extra_turn_chance", "counterattack_chance",
+                          "reflected_damage_percentage", "life_drain_percentage", "crit_resist", "stun_rate"]:
+            old_state[stat_name] = getattr(legendary_creature, stat_name)
+
+        loaded: LegendaryCreature = LegendaryCreature.__new__(LegendaryCreature)
+        loaded.__setstate__(old_state)
+        self.assertAlmostEqual(loaded.base_max_hp / legendary_creature.base_max_hp, 1)
+        self.assertAlmostEqual(loaded.max_hp / legendary_creature.max_hp, 1)
+        self.assertEqual(loaded.attack_speed, legendary_creature.attack_speed)
+
+    def test_slotted_objects(self):
+        legendary_creature: LegendaryCreature = generate_random_legendary_creature("DARK")
+        rune: Rune = create_rune_for_sale(3, 1, "FATAL", "HP%")
+        legendary_creature.place_rune(rune)
+        for obj in [legendary_creature, rune, rune.stat_increase, rune.set_effect, CityTile(), BoxEatsPlantsTile(),
+                    MatchThreeTile("AND"), BeneficialEffect("INCREASE_ATK", 2), HarmfulEffect("DECREASE_ATK", 2),
+                    Egg(mpf("8e5"), mpf("8"), "FLAME")]:
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+        self.assertTrue("_Rune__sub_stats=[]" in str(rune))
+        loaded: LegendaryCreature = pickle.loads(pickle.dumps(legendary_creature))
+        self.assertEqual(loaded.get_runes()[1].name, rune.name)
+        self.assertEqual(loaded.max_hp, legendary_creature.max_hp)
+        self.assertEqual(copy.deepcopy(rune).get_sub_stats(), rune.get_sub_stats())
+
+        # Objects saved before they had slots have a dictionary of attributes
+        old_rune: Rune = Rune.__new__(Rune)
+        old_rune.__setstate__(dict(rune.__getstate__()))
+        self.assertEqual(old_rune.stat_increase.max_hp_percentage_up, rune.stat_increase.max_hp_percentage_up)
+
+    def test_player_city_building_index(self):
+        player: Player = Player("CITY")
+        player.gold = mpf("1e10")
+        player.gems = mpf("1e10")
+        hatchery: Hatchery = Hatchery(mpf("1e5"), mpf("0"))
+        fusion_center: FusionCenter = FusionCenter(mpf("1e5"), mpf("0"))
+        self.assertFalse(player.player_city.has_building(hatchery))
+        self.assertTrue(player.build_at_section_tile(0, 0, 1, hatchery))
+        self.assertTrue(player.build_at_section_tile(0, 0, 0, fusion_center))
+        self.assertFalse(player.build_at_section_tile(0, 0, 1, Hatchery(mpf("1e5"), mpf("0"))))
+        self.assertTrue(player.player_city.has_building(hatchery))
+        self.assertEqual(player.player_city.get_buildings(Hatchery), [hatchery])
+        self.assertEqual(player.player_city.get_buildings(Building)[:2], [fusion_center, hatchery])
+        obstacles: list = player.player_city.get_buildings(Obstacle)
+        self.assertEqual(len(obstacles), sum(1 for column in player.player_city.get_sections()[0].get_tiles()
+                                             for tile in column if isinstance(tile.building, Obstacle)))
+
+        # The index is not saved but is created again from the sections when it is needed
+        loaded: PlayerCity = pickle.loads(pickle.dumps(player.player_city))
+        self.assertEqual(len(loaded.get_buildings(Hatchery)), 1)
+        self.assertFalse("building_locations" in str(loaded))
+
+        self.assertTrue(player.remove_building_from_section_tile(0, 0, 1))
+        self.assertFalse(player.player_city.has_building(hatchery))
+        self.assertEqual(player.player_city.get_buildings(Hatchery), [])
+        player.player_city.add_section()
+        self.assertEqual(len(player.player_city.get_buildings(Obstacle)),
+                         sum(1 for section in player.player_city.get_sections() for column in section.get_tiles()
+                             for tile in column if isinstance(tile.building, Obstacle)))
+
+    def test_legendary_creature_exp_settled_lazily(self):
+        player: Player = Player("TRAINER")
+        player.gold = mpf("1e10")
+        training_area: TrainingArea = TrainingArea(mpf("1e5"), mpf("0"))
+        self.assertTrue(player.build_at_section_tile(0, 0, 0, training_area))
+        legendary_creature: LegendaryCreature = generate_random_legendary_creature("ICE")
+        idle_legendary_creature: LegendaryCreature = generate_random_legendary_creature("ICE")
+        player.add_legendary_creature(legendary_creature)
+        player.add_legendary_creature(idle_legendary_creature)
+        self.assertTrue(player.add_legendary_creature_to_training_area(legendary_creature, training_area))
+        self.assertEqual(player.get_legendary_creatures_gaining_exp(), [legendary_creature])
+
+        # Gaining resources does not touch the legendary creatures until their EXP is settled
+        gold: BigValue = player.gold
+        player.gain_resources(30)
+        self.assertEqual(legendary_creature.exp, mpf("0"))
+        self.assertEqual(player.gold, gold + BigValue(player.gold_per_second) * 30)
+        loaded: Player = pickle.loads(pickle.dumps(player))
+        player.settle_legendary_creature_exp()
+        self.assertEqual(legendary_creature.exp, training_area.legendary_creature_exp_per_second * 30)
+        self.assertEqual(idle_legendary_creature.exp, mpf("0"))
+        loaded.settle_legendary_creature_exp()
+        self.assertEqual(loaded.get_legendary_creatures_gaining_exp()[0].exp, legendary_creature.exp)
+
+        player.gain_resources(10)
+        self.assertTrue(player.remove_legendary_creature_from_training_area(legendary_creature, training_area))
+        self.assertEqual(legendary_creature.exp, training_area.legendary_creature_exp_per_second * 40)
+        self.assertEqual(player.get_legendary_creatures_gaining_exp(), [])
+
+    def test_catch_up_after_long_absence(self):
+        player: Player = Player("AWAY")
+        player.gold_per_second = mpf("2")
+        player.gold = BigValue(0.0)
+        player.gems = mpf("1e10")
+        hatchery: Hatchery = Hatchery(mpf("0"), mpf("0"))
+        self.assertTrue(player.build_at_section_tile(0, 0, 0, hatchery))
+        egg: Egg = Egg(mpf("8e5"), mpf("8"), "FLAME")
+        player.add_item_to_inventory(egg)
+        self.assertTrue(player.place_egg_in_hatchery(egg, hatchery))
+
+        # The whole days of the absence are counted as well
+        absence: timedelta = timedelta(days=366, seconds=5)
+        self.assertEqual(player.catch_up(player.last_seen + absence), int(absence.total_seconds()))
+        self.assertEqual(player.gold, BigValue(2.0 * absence.total_seconds()))
+        self.assertEqual(player.seconds_passed, int(absence.total_seconds()))
+        self.assertEqual(len(player.legendary_creature_inventory.get_legendary_creatures()), 1)
+        self.assertFalse(egg in player.item_inventory.get_items())
+        self.assertEqual(player.catch_up(player.last_seen - timedelta(seconds=30)), 0)
+
+        # Fractions of seconds between catch-ups add up
+        gold: BigValue = player.gold
+        now: datetime = player.last_seen
+        for i in range(10):
+            now += timedelta(seconds=0.9)
+            player.catch_up(now)
+
+        self.assertEqual(player.seconds_passed, int(absence.total_seconds()) + 9)
+        self.assertEqual(player.gold, gold + BigValue(player.gold_per_second) * 9)
+
+        # Gold gained a second at a time still adds up when it is too small to change a large amount of gold
+        player.gold = BigValue(2.0) ** 62
+        player.gold_per_second = mpf("100")
+        self.assertEqual(player.gold + player.gold_per_second, player.gold)
+        for i in range(3600):
+            player.gain_resources(1)
+
+        self.assertEqual(int(player.gold) + int(player.gold_remainder), 2 ** 62 + 360000)
+        self.assertTrue(abs(player.gold_remainder) < 1024)
+
+    def test_egg_hatch_queue(self):
+        player: Player = Player("HATCHER")
+        hatchery: Hatchery = Hatchery(mpf("0"), mpf("0"))
+        self.assertTrue(player.build_at_section_tile(0, 0, 0, hatchery))
+        eggs: list = [Egg(mpf("8e5"), mpf("8"), element) for element in ["FLAME", "SEA", "NATURE"]]
+        for egg in eggs:
+            player.add_item_to_inventory(egg)
+            self.assertTrue(player.place_egg_in_hatchery(egg, hatchery))
+
+        self.assertEqual(player.get_eggs_hatching(), eggs)
+
+        # Only the eggs which are due hatch
+        player.hatch_eggs_in_hatcheries(eggs[0].hatch_time - timedelta(minutes=1))
+        self.assertEqual(len(player.legendary_creature_inventory.get_legendary_creatures()), 0)
+        loaded: Player = pickle.loads(pickle.dumps(player))
+        player.hatch_eggs_in_hatcheries(eggs[1].hatch_time)
+        self.assertEqual(hatchery.get_eggs_placed(), [egg for egg in eggs if egg.hatch_time > eggs[1].hatch_time])
+        player.hatch_eggs_in_hatcheries(eggs[2].hatch_time)
+        self.assertEqual(player.get_eggs_hatching(), [])
+        self.assertEqual(hatchery.get_eggs_placed(), [])
+        self.assertEqual(len(player.legendary_creature_inventory.get_legendary_creatures()), 3)
+        self.assertEqual(len(loaded.get_eggs_hatching()), 3)
+
+        # Players saved before the queue existed have it created from their hatcheries
+        state: dict = loaded.__dict__.copy()
+        del state["_Player__egg_hatch_queue"]
+        del state["_Player__eggs_placed"]
+        old_player: Player = Player.__new__(Player)
+        old_player.__setstate__(state)
+        self.assertEqual(len(old_player.get_eggs_hatching()), 3)
+
+    def test_indexed_inventories(self):
+        legendary_creature_inventory: LegendaryCreatureInventory = LegendaryCreatureInventory()
+        legendary_creatures: list = [generate_random_legendary_creature(element) for element in
+                                     ["FLAME", "SEA", "FLAME"]]
+        for legendary_creature in legendary_creatures:
+            legendary_creature_inventory.add_legendary_creature(legendary_creature)
+
+        self.assertEqual(legendary_creature_inventory.get_legendary_creatures(), legendary_creatures)
+        self.assertIs(legendary_creature_inventory.get_legendary_creatures(),
+                      legendary_creature_inventory.get_legendary_creatures())
+        self.assertEqual(legendary_creature_inventory.get_legendary_creatures_by_element("FLAME"),
+                         [legendary_creatures[0], legendary_creatures[2]])
+        self.assertTrue(legendary_creature_inventory.remove_legendary_creature(legendary_creatures[0]))
+        self.assertFalse(legendary_creature_inventory.has_legendary_creature(legendary_creatures[0]))
+        self.assertFalse(legendary_creature_inventory.has_legendary_creature(legendary_creatures[1].clone()))
+        self.assertIs(legendary_creature_inventory.get_legendary_creature(legendary_creatures[1].legendary_creature_id),
+                      legendary_creatures[1])
+        rating: int = legendary_creatures[2].rating
+        legendary_creatures[2].rating += 1
+        legendary_creature_inventory.update_legendary_creature(legendary_creatures[2])
+        self.assertTrue(legendary_creatures[2] in
+                        legendary_creature_inventory.get_legendary_creatures_by_rating(rating + 1))
+        self.assertFalse(legendary_creatures[2] in
+                         legendary_creature_inventory.get_legendary_creatures_by_rating(rating))
+
+        item_inventory: ItemInventory = ItemInventory()
+        rune: Rune = create_rune_for_sale(1, 1, "ENERGY", "HP%")
+        egg: Egg = Egg(mpf("8e5"), mpf("8"), "FLAME")
+        for item in [egg, rune]:
+            item_inventory.add_item(item)
+
+        self.assertEqual(item_inventory.get_items_by_class(Rune), [rune])
+        self.assertEqual(item_inventory.get_items_by_class(Item), [egg, rune])
+
+        # The inventories are saved in the same way as in older versions of this game
+        loaded: ItemInventory = pickle.loads(pickle.dumps(item_inventory))
+        self.assertEqual(len(loaded.get_items_by_class(Egg)), 1)
+        self.assertTrue(loaded.has_item(loaded.get_items()[1]))
+        self.assertEqual(list(item_inventory.__getstate__().keys()), ["_ItemInventory__items"])
+
+        # The list of items is only made again after the inventory changes, so lists returned earlier stay the same
+        items: list = item_inventory.get_items()
+        self.assertIs(item_inventory.get_items(), items)
+        self.assertTrue(item_inventory.remove_item(egg))
+        self.assertFalse(item_inventory.remove_item(egg))
+        self.assertEqual(item_inventory.get_items(), [rune])
+        self.assertEqual(items, [egg, rune])
+
+    @patch("legendary_creature_city_builder.input")
+    def test_listing(self, mocked_input):
+        listing: Listing = Listing(item_shop.get_items_sold(), "ITEM")
+        self.assertEqual([index for index, item in listing.get_page()], list(range(1, Listing.PAGE_SIZE + 1)))
+        self.assertTrue(listing.run_command("PAGE 3"))
+        self.assertEqual(listing.get_page()[0][0], 2 * Listing.PAGE_SIZE + 1)
+        self.assertFalse(listing.run_command("PAGE " + str(listing.get_number_of_pages() + 1)))
+        self.assertTrue(listing.run_command("filter set energy"))
+        self.assertTrue(listing.run_command("FILTER MAIN STAT HP%"))
+        self.assertFalse(listing.run_command("FILTER COLOUR RED"))
+        for index, rune in listing.get_page():
+            self.assertEqual((rune.set_name, rune.main_stat), ("ENERGY", "HP%"))
+            self.assertEqual(item_shop.get_items_sold()[index - 1].name, rune.name)
+
+        self.assertTrue("ENERGY" in listing.render_page())
+        self.assertTrue(listing.run_command("CLEAR FILTERS"))
+        self.assertEqual(listing.get_number_of_matches(), len(item_shop.get_items_sold()))
+
+        # Players can still choose objects which are not on the page shown
+        mocked_input.side_effect = ["NEXT", "FILTER ELEMENT ICE", "abc", 0, 7021]
+        self.assertEqual(choose_from_listing(listing, "Please enter the index of the item you want to buy"), 7021)
+        self.assertEqual(listing.get_page()[0][1].element, "ICE")
+
+    def test_rendering(self):
+        rune: Rune = create_rune_for_sale(6, 1, "ENERGY", "HP%")
+        self.assertTrue(str(rune).startswith("Rune(name=6-STAR ENERGY RUNE - SLOT 1, description="))
+        self.assertTrue("stat_increase=StatIncrease(max_hp_up=0.0, max_hp_percentage_up=12.0" in str(rune))
+
+        # The stored string representation of the stat increase changes with the stat increase
+        rune.stat_increase.max_hp_up += mpf("5")
+        self.assertTrue("StatIncrease(max_hp_up=5.0," in str(rune))
+        self.assertFalse("__string" in str(rune.stat_increase))
+        self.assertEqual(str(pickle.loads(pickle.dumps(rune))), str(rune))
+
+        player: Player = Player("SUMMARY")
+        player.add_legendary_creature(generate_random_legendary_creature("SEA"))
+        self.assertTrue(summarise(player).startswith("Player(player_id=" + str(player.player_id) + ", name=SUMMARY"))
+        self.assertTrue("battle_team=Team," in summarise(player))
+        self.assertEqual(summarise(rune.stat_increase), str(rune.stat_increase))
+
+    def test_strengthen_many_times_beaten(self):
+        cpu: CPU = CPU("CPU")
+        cpu.battle_team = Team([generate_random_legendary_creature("SEA") for i in range(5)])
+        cpu.battle_team.get_legendary_creatures()[0].rating = LegendaryCreature.MAX_RATING
+        cpu.battle_team.get_legendary_creatures()[0].max_level = float('inf')
+        cpu.times_beaten = 40
+        cpu.strengthen()
+        self.assertEqual(cpu.battle_team.get_legendary_creatures()[0].level, 2 ** 40 + 1)
+        self.assertEqual(cpu.battle_team.get_legendary_creatures()[1].level, 1)
+
+    ################################################################################################################
+    # Checking whether battles have the same winners in both numeric modes
+    def test_numeric_modes_battle_winners(self):
+        def run_seeded_battle(seed):
+            # type: (int) -> tuple
+            random.seed(seed)
+            team1: Team = Team([generate_random_legendary_creature(element) for element in ["FLAME", "SEA", "NATURE"]])
+            team2: Team = Team([generate_random_legendary_creature(element) for element in ["TERRA", "ICE", "DARK"]])
+            team1.recover_all()
+            team2.recover_all()
+            battle: Battle = Battle(team1, team2)
+            turns: int = 0
+            while not team1.all_died() and not team2.all_died() and turns < 300:
+                battle.get_someone_to_move()
+                user: LegendaryCreature = battle.whose_turn
+                user.attack_gauge = to_numeric(user.MIN_ATTACK_GAUGE)
+                if not user.get_is_alive():
+                    continue
+
+                enemies: Team = team2 if user in team1.get_legendary_creatures() else team1
+                target: LegendaryCreature = random.choice([legendary_creature for legendary_creature in
+                                                           enemies.get_legendary_creatures() if
+                                                           legendary_creature.get_is_alive()])
+                attacking_skills: list = [skill for skill in user.get_skills() if isinstance(skill, ActiveSkill)
+                                          and skill.active_skill_type == "ATTACK"]
+                if random.random() < 0.5 and len(attacking_skills) > 0:
+                    user.use_skill(target, attacking_skills[0])
+                else:
+                    user.normal_attack(target)
+
+                turns += 1
+
+            return team1.all_died(), team2.all_died(), turns
+
+        try:
+            for seed in range(5):
+                self.assertTrue(set_numeric_mode("mpf"))
+                mpf_result: tuple = run_seeded_battle(seed)
+                self.assertTrue(set_numeric_mode("float"))
+                float_result: tuple = run_seeded_battle(seed)
+                self.assertEqual(mpf_result, float_result)
+        finally:
+            set_numeric_mode("mpf")
+
+        self.assertFalse(set_numeric_mode("decimal"))
+        self.assertEqual(NUMERIC_MODE, "mpf")
+
+    def test_to_numeric(self):
+        try:
+            set_numeric_mode("float")
+            self.assertIsInstance(to_numeric(mpf("1.5")), float)
+            self.assertIsInstance(to_numeric(mpf("1e400")), mpf)
+            self.assertEqual(to_numeric(10 ** 400), mpf(10) ** 400)
+            set_numeric_mode("mpf")
+            self.assertIsInstance(to_numeric(1.5), mpf)
+        finally:
+            set_numeric_mode("mpf")
+
+    ################################################################################################################
+    # Checking whether big values give the same results as mpf objects
+    def test_big_value_arithmetic(self):
+        a: BigValue = BigValue(mpf("1.5e300"))
+        b: BigValue = BigValue(7)
+        self.assertEqual((a * a).to_mpf(), mpf("1.5e300") * mpf("1.5e300"))
+        self.assertEqual((a / b).to_mpf(), mpf("1.5e300") / 7)
+        self.assertEqual((b + mpf("0.25") - 3).to_mpf(), mpf("4.25"))
+        self.assertEqual(a + b, a)
+        self.assertEqual(BigValue(10.0) ** 1000 / BigValue(10.0) ** 999, 10)
+        self.assertTrue(BigValue(10.0) ** 400 > mpf("1e399") > BigValue(10.0) ** 398)
+        self.assertTrue(mpf("-2") < BigValue(-1.0) < 0 < b)
+        self.assertEqual(int(BigValue(2.0) ** 1100), 2 ** 1100)
+        self.assertEqual(int(BigValue(10.0) ** 15), 10 ** 15)
+        self.assertEqual(str(BigValue(5e6)), str(mpf("5e6")))
+        self.assertEqual(pickle.loads(pickle.dumps(a * a)), a * a)
+        self.assertLess(len(pickle.dumps([a * i for i in range(100)])),
+                        len(pickle.dumps([mpf("1.5e300") * i for i in range(100)])))
+
+    def test_load_player_with_mpf_gold(self):
+        player: Player = Player("player")
+        old_state: dict = player.__dict__.copy()
+        old_state["gold"] = mpf("5e6")
+        old_state["exp"] = mpf("1e500")
+        loaded: Player = Player.__new__(Player)
+        loaded.__setstate__(old_state)
+        self.assertIsInstance(loaded.gold, BigValue)
+        self.assertEqual(loaded.gold, mpf("5e6"))
+        loaded.level_up()
+        self.assertEqual(loaded.level, 31)
+
+    ################################################################################################################
+    # Checking whether the element matchup matrix agrees with the element chart shown to the player
+    def test_element_matchup_matrix(self):
+        self.assertEqual(len(ELEMENT_MATCHUP_MATRIX), len(LegendaryCreature.POTENTIAL_ELEMENTS))
+        for attacking_element in LegendaryCreature.POTENTIAL_ELEMENTS:
+            double_damage: list = []  # initial value
+            half_damage: list = []  # initial value
+            if attacking_element in ELEMENT_CHART[0]:
+                column: int = ELEMENT_CHART[0].index(attacking_element)
+                double_damage = ELEMENT_CHART[1][column].split("\n")
+                half_damage = ELEMENT_CHART[2][column].split("\n")
+
+            for defending_element in LegendaryCreature.POTENTIAL_ELEMENTS:
+                expected: float = 2.0 if defending_element in double_damage else 0.5 if defending_element in \
+                    half_damage else 1.0
+                self.assertEqual(get_elemental_damage_multiplier(attacking_element, defending_element), expected)
+
+        self.assertEqual(get_elemental_damage_multiplier("TERRA", "DARK"), 2.0)
+        self.assertFalse(LegendaryCreature.POTENTIAL_ELEMENTS is Egg.POTENTIAL_ELEMENTS or
+                         Egg.POTENTIAL_ELEMENTS is Habitat.POTENTIAL_ELEMENTS)
+
+    def test_elemental_damage_multipliers_against_team(self):
+        attacker: LegendaryCreature = generate_random_legendary_creature("FLAME")
+        attacker.add_element("TERRA")
+        self.assertEqual(attacker.get_element_ids(), [ELEMENT_IDS["FLAME"], ELEMENT_IDS["TERRA"]])
+        team: Team = Team([generate_random_legendary_creature(element) for element in ["ICE", "DARK", "SEA",
+                                                                                         "BEAUTY"]])
+        self.assertEqual(get_elemental_damage_multipliers_against_team(attacker, team), [2.0, 2.0, 1.0, 1.0])
+
+    ################################################################################################################
+    # Checking whether the turn scheduler picks the same legendary creatures as ticking the clock one tick at a time
+    def test_get_someone_to_move(self):
+        random.seed(9)
+        for i in range(20):
+            battle: Battle = Battle(Team([generate_random_legendary_creature("FLAME") for j in range(3)]),
+                                    Team([generate_random_legendary_creature("SEA") for j in range(3)]))
+            legendary_creatures: list = battle.team1.get_legendary_creatures() + \
+                                        battle.team2.get_legendary_creatures()
+            for legendary_creature in legendary_creatures:
+                legendary_creature.base_attack_speed = mpf(0.1 + random.random())
+                legendary_creature.invalidate_effective_stats()
+                legendary_creature.attack_gauge = mpf(random.random())
+
+            expected: Battle = battle.clone()
+            full_attack_gauge_list: list = []  # initial value
+            while len(full_attack_gauge_list) == 0:
+                full_attack_gauge_list = [legendary_creature for legendary_creature in
+                                          expected.team1.get_legendary_creatures() +
+                                          expected.team2.get_legendary_creatures() if
+                                          legendary_creature.attack_gauge >= legendary_creature.FULL_ATTACK_GAUGE]
+                expected.tick()
+
+            max_attack_gauge: mpf = max(legendary_creature.attack_gauge for legendary_creature in
+                                        full_attack_gauge_list)
+            expected.whose_turn = [legendary_creature for legendary_creature in full_attack_gauge_list if
+                                   legendary_creature.attack_gauge == max_attack_gauge][-1]
+            battle.get_someone_to_move()
+            self.assertEqual(battle.whose_turn.legendary_creature_id, expected.whose_turn.legendary_creature_id)
+            for legendary_creature, expected_legendary_creature in \
+                    zip(legendary_creatures, expected.team1.get_legendary_creatures() +
+                                             expected.team2.get_legendary_creatures()):
+                self.assertAlmostEqual(legendary_creature.attack_gauge, expected_legendary_creature.attack_gauge)
+
+    def test_get_someone_to_move_slow_legendary_creatures(self):
+        slow_legendary_creature: LegendaryCreature = generate_random_legendary_creature("ICE")
+        slow_legendary_creature.base_attack_speed = mpf("1e-9")
+        slow_legendary_creature.invalidate_effective_stats()
+        battle: Battle = Battle(Team([slow_legendary_creature]), Team([]))
+        battle.get_someone_to_move()
+        self.assertEqual(battle.whose_turn, slow_legendary_creature)
+        self.assertTrue(slow_legendary_creature.attack_gauge >= slow_legendary_creature.FULL_ATTACK_GAUGE)
+        slow_legendary_creature.attack_gauge = slow_legendary_creature.MIN_ATTACK_GAUGE
+        slow_legendary_creature.base_attack_speed = mpf("0")
+        slow_legendary_creature.invalidate_effective_stats()
+        battle.get_someone_to_move()
+        self.assertIsNone(battle.whose_turn)
+
+    ################################################################################################################
+    # Checking whether battles are played by a battle engine without the command line window
+    def test_battle_engine_run(self):
+        def run_seeded_battle(seed):
+            # type: (int) -> BattleResult
+            random.seed(seed)
+            team1: Team = Team([generate_random_legendary_creature(element) for element in ["FLAME", "SEA", "NATURE"]])
+            team2: Team = Team([generate_random_legendary_creature(element) for element in ["TERRA", "ICE", "DARK"]])
+            return BattleEngine().run(team1, team2, RandomBattlePolicy(), FocusFireBattlePolicy(), seed)
+
+        with patch("builtins.print") as mocked_print:
+            results: list = [run_seeded_battle(seed) for seed in range(5)]
+            mocked_print.assert_not_called()
+
+        for seed in range(5):
+            self.assertEqual(str(results[seed]), str(run_seeded_battle(seed)))
+            self.assertTrue(results[seed].winner in [1, 2])
+            self.assertTrue(results[seed].number_of_turns > 0)
+            self.assertEqual(results[seed].team1_survivors == 0, results[seed].winner == 2)
+            self.assertEqual(results[seed].team2_survivors == 0, results[seed].winner == 1)
+
+        self.assertTrue(BATTLE_MESSAGES_ENABLED)
+
+    def test_battle_engine_play_sets_winner(self):
+        team1: Team = Team([generate_random_legendary_creature("LIGHT")])
+        team2: Team = Team([generate_random_legendary_creature("DARK")])
+        battle: Battle = Battle(team1, team2)
+        result: BattleResult = BattleEngine().play(battle, FocusFireBattlePolicy(), FocusFireBattlePolicy())
+        self.assertTrue(battle.winner in [team1, team2])
+        self.assertEqual(result.winner, 1 if battle.winner == team1 else 2)
+        self.assertTrue(battle.winner.get_legendary_creatures()[0].get_is_alive())
+
+    def test_battle_policy_is_abstract(self):
+        self.assertRaises(TypeError, BattlePolicy)
+
+    ################################################################################################################
+    # Checking whether simulated battles have the same results regardless of the number of processes used
+    def test_simulate_battles(self):
+        random.seed(1)
+        team1: Team = Team([generate_random_legendary_creature(element) for element in ["FLAME", "SEA", "NATURE"]])
+        team2: Team = Team([generate_random_legendary_creature(element) for element in ["TERRA", "ICE", "DARK"]])
+        battle_statistics: BattleStatistics = simulate_battles(team1, team2, 12, seed=3, processes=1)
+        self.assertEqual(battle_statistics.get_number_of_battles(), 12)
+        self.assertEqual(sum(battle_statistics.turn_counts.values()), 12)
+        multiprocess_battle_statistics: BattleStatistics = simulate_battles(team1, team2, 12, seed=3, processes=2)
+        self.assertEqual(multiprocess_battle_statistics.wins, battle_statistics.wins)
+        self.assertEqual(multiprocess_battle_statistics.losses, battle_statistics.losses)
+        self.assertEqual(multiprocess_battle_statistics.turn_counts, battle_statistics.turn_counts)
+
+        first_half: BattleStatistics = simulate_battles(team1, team2, 6, seed=3, processes=1)
+        first_half.merge(simulate_battles(team1, team2, 6, seed=9, processes=1))
+        self.assertEqual(first_half.wins, battle_statistics.wins)
+        self.assertEqual(first_half.turn_counts, battle_statistics.turn_counts)
+        self.assertEqual(simulate_battles_main(["NOBODY WITH SAVED GAME DATA"]), 1)
+
+    ################################################################################################################
+    # Checking whether vectorised battles deal the same damage as actions executed by legendary creatures
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_vectorised_battles_damage(self):
+        for seed in range(5):
+            random.seed(seed)
+            team1: Team = Team([generate_random_legendary_creature(element) for element in ["FLAME", "SEA"]])
+            team2: Team = Team([generate_random_legendary_creature(element) for element in ["TERRA", "ICE", "DARK"]])
+            vectorised_battles: VectorisedBattles = VectorisedBattles([(team1, team2)])
+            user: LegendaryCreature = team1.get_legendary_creatures()[seed % 2]
+            skill_to_use: ActiveSkill = [skill for skill in user.get_skills() if isinstance(skill, ActiveSkill)
+                                         and skill.active_skill_type == "ATTACK"][0]
+            for crit_roll in [0.0, 0.999999]:
+                normal_attack_damage, skill_damage = vectorised_battles.calculate_damage(
+                    np.array([seed % 2]), np.full((1, 6), crit_roll))
+                for position in range(3):
+                    target: LegendaryCreature = team2.get_legendary_creatures()[position].clone()
+                    target.curr_hp = target.max_hp
+                    Action("NORMAL ATTACK").execute(user, target)
+                    self.assertAlmostEqual(float(target.max_hp - target.curr_hp) /
+                                           normal_attack_damage[0, 3 + position], 1.0)
+                    target.curr_hp = target.max_hp
+                    with patch("random.random", return_value=crit_roll), patch("builtins.print"):
+                        Action("USE SKILL").execute(user.clone(), target, skill_to_use)
+
+                    self.assertAlmostEqual(float(target.max_hp - target.curr_hp) / skill_damage[0, 3 + position], 1.0)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_vectorised_battles_run(self):
+        random.seed(2)
+        team1: Team = Team([generate_random_legendary_creature(element) for element in ["FLAME", "SEA", "NATURE"]])
+        team2: Team = Team([generate_random_legendary_creature("DARK")])
+        battle_statistics: BattleStatistics = VectorisedBattles.from_matchup(team1, team2, 200).run(seed=4)
+        self.assertEqual(battle_statistics.get_number_of_battles(), 200)
+        self.assertEqual(str(battle_statistics),
+                         str(VectorisedBattles.from_matchup(team1, team2, 200).run(seed=4)))
+        vectorised_battles: VectorisedBattles = VectorisedBattles([(team1, team2), (team2, Team([]))])
+        vectorised_battles.run(seed=4)
+        self.assertTrue(vectorised_battles.winners[0] in [1, 2])
+        self.assertEqual(vectorised_battles.winners[1], 1)
+        self.assertEqual(vectorised_battles.numbers_of_turns[1], 1)
+
+    ################################################################################################################
+    # Checking whether random number generators passed to the game give reproducible results without using the global
+    # random number generator
+    def test_injected_random_number_generators(self):
+        random.seed(7)
+        global_random_state: tuple = random.getstate()
+        legendary_creature1: LegendaryCreature = generate_random_legendary_creature("FLAME", random.Random(5))
+        legendary_creature2: LegendaryCreature = generate_random_legendary_creature("FLAME", random.Random(5))
+        self.assertEqual(legendary_creature1.name, legendary_creature2.name)
+        self.assertEqual(legendary_creature1.max_hp, legendary_creature2.max_hp)
+        self.assertEqual(legendary_creature1.attack_speed, legendary_creature2.attack_speed)
+
+        runes: list = [create_rune_for_sale(1, 1, "ENERGY", "HP%") for i in range(2)]
+        rngs: list = [random.Random(11), random.Random(11)]
+        for i in range(10):
+            self.assertEqual(runes[0].level_up(rngs[0]), runes[1].level_up(rngs[1]))
+
+        self.assertEqual(str(Section(random.Random(3))), str(Section(random.Random(3))))
+        self.assertEqual([str(cpu_player.battle_team.get_legendary_creatures()[0].name) for cpu_player in
+                          generate_potential_cpu_players(2)],
+                         [str(cpu_player.battle_team.get_legendary_creatures()[0].name) for cpu_player in
+                          generate_potential_cpu_players(2)])
+        self.assertEqual(random.getstate(), global_random_state)
+
+    def test_seeded_battles_ignore_global_random_number_generator(self):
+        def run_seeded_battle(global_seed):
+            # type: (int) -> str
+            rng: random.Random = random.Random(8)
+            team1: Team = Team([generate_random_legendary_creature(element, rng) for element in ["FLAME", "SEA"]])
+            team2: Team = Team([generate_random_legendary_creature(element, rng) for element in ["TERRA", "ICE"]])
+            random.seed(global_seed)
+            return str(BattleEngine().run(team1, team2, RandomBattlePolicy(), RandomBattlePolicy(), 8))
+
+        self.assertEqual(run_seeded_battle(1), run_seeded_battle(2))
+
+    def test_players_draw_from_their_own_random_number_generators(self):
+        def hatch_eggs(master_seed):
+            # type: (int) -> list
+            player: Player = Player("SEEDED", derive_random_number_generator(random.Random(master_seed)))
+            hatchery: Hatchery = Hatchery(mpf("0"), mpf("0"))
+            player.build_at_section_tile(0, 0, 0, hatchery)
+            for i in range(3):
+                egg: Egg = Egg(mpf("8e5"), mpf("8"), "FLAME")
+                player.add_item_to_inventory(egg)
+                player.place_egg_in_hatchery(egg, hatchery)
+
+            player.catch_up(player.last_seen + timedelta(hours=1))
+            return [legendary_creature.name for legendary_creature in
+                    player.legendary_creature_inventory.get_legendary_creatures()]
+
+        random.seed(7)
+        global_random_state: tuple = random.getstate()
+        self.assertEqual(hatch_eggs(3), hatch_eggs(3))
+        self.assertEqual(len(hatch_eggs(3)), 3)
+        self.assertEqual(random.getstate(), global_random_state)
+        master_rng: random.Random = random.Random(3)
+        self.assertNotEqual(derive_random_number_generator(master_rng).random(),
+                            derive_random_number_generator(master_rng).random())
+
+    ################################################################################################################
+    # Checking whether saved game data refers to the catalogues of the game and whether older saved game data can
+    # still be loaded
+    def test_save_and_load_game_data(self):
+        player_data: Player = Player("SAVE FORMAT")
+        player_data.add_legendary_creature(generate_random_legendary_creature("FLAME"))
+        cpu: CPU = CPU("CPU #1")
+        game_data: Game = Game(player_data, item_shop, building_shop, Arena([cpu]), minigames)
+        with tempfile.TemporaryDirectory() as save_directory:
+            file_name: str = os.path.join(save_directory, "GAME DATA")
+            save_game_data(game_data, file_name)
+            with open(file_name, "rb") as save_file:
+                data: bytes = save_file.read()
+
+            self.assertTrue(data.startswith(SAVE_FILE_MAGIC))
+            self.assertTrue(len(data) * 10 < len(pickle.dumps(game_data)))
+            loaded_game_data: Game = load_game_data(file_name)
+
+        self.assertTrue(loaded_game_data.item_shop is item_shop)
+        self.assertTrue(loaded_game_data.building_shop is building_shop)
+        self.assertTrue(loaded_game_data.get_minigames() is minigames)
+        self.assertEqual(loaded_game_data.player_data.gold, player_data.gold)
+        self.assertEqual(loaded_game_data.player_data.legendary_creature_inventory.get_legendary_creatures()[0].name,
+                         player_data.legendary_creature_inventory.get_legendary_creatures()[0].name)
+        self.assertEqual(len(loaded_game_data.player_data.get_unlocked_levels()), 1)
+        loaded_cpu: CPU = loaded_game_data.battle_arena.get_potential_opponents()[0]
+        self.assertEqual(loaded_cpu.name, "CPU #1")
+        self.assertEqual(loaded_cpu.get_unlocked_levels(), [])
+
+        # Older saved game data is a pickle of the whole game
+        old_game_data: Game = deserialise_game_data(pickle.dumps(game_data))
+        self.assertTrue(old_game_data.item_shop is item_shop)
+        self.assertEqual(old_game_data.player_data.name, "SAVE FORMAT")
+        with self.assertRaises(ValueError):
+            deserialise_game_data(SAVE_FILE_MAGIC + (SAVE_FILE_VERSION + 1).to_bytes(2, "big") + data[6:])
+
+    def test_game_journal(self):
+        player_data: Player = Player("JOURNAL")
+        legendary_creature: LegendaryCreature = generate_random_legendary_creature("FLAME")
+        player_data.add_legendary_creature(legendary_creature)
+        game_data: Game = Game(player_data, item_shop, building_shop, Arena([]), minigames)
+        with tempfile.TemporaryDirectory() as save_directory:
+            file_name: str = os.path.join(save_directory, "GAME DATA")
+            journal: GameJournal = GameJournal(file_name)
+            journal.compact(game_data)
+            rune: Rune = item_shop.get_items_sold()[0]
+            self.assertTrue(journal.purchase_item(game_data, rune))
+            self.assertTrue(journal.place_rune_on_legendary_creature(game_data, legendary_creature, rune))
+            self.assertTrue(journal.claim_reward(game_data, Reward(player_reward_gold=mpf("1e6"))))
+            section: Section = player_data.player_city.get_sections()[0]
+            tile_x, tile_y = [(x, y) for y in range(section.SECTION_HEIGHT) for x in range(section.SECTION_WIDTH)
+                              if section.get_tile_at(x, y).building is None][0]
+            self.assertTrue(journal.build_at_section_tile(game_data, 0, tile_x, tile_y,
+                                                          building_shop.get_buildings_sold()[0]))
+            self.assertFalse(journal.remove_rune_from_legendary_creature(game_data, legendary_creature, 0))
+            self.assertEqual(journal.number_of_changes, 4)
+            self.assertTrue(os.path.getsize(journal.journal_file_name) < os.path.getsize(file_name))
+
+            # Loading replays the journal on top of the saved game data and compacts it
+            loaded_game_data: Game = GameJournal(file_name).load()
+            self.assertFalse(os.path.exists(journal.journal_file_name))
+            self.assertEqual(sorted(os.listdir(save_directory)), ["GAME DATA"])
+
+        loaded_player_data: Player = loaded_game_data.player_data
+        self.assertEqual(loaded_player_data.gold, player_data.gold)
+        self.assertEqual(loaded_player_data.gems, player_data.gems)
+        self.assertEqual(len(loaded_player_data.item_inventory.get_items()), 1)
+        loaded_legendary_creature: LegendaryCreature = \
+            loaded_player_data.legendary_creature_inventory.get_legendary_creatures()[0]
+        self.assertTrue(loaded_legendary_creature.get_runes()[rune.slot_number] is
+                        loaded_player_data.item_inventory.get_items()[0])
+        self.assertEqual(loaded_player_data.player_city.get_sections()[0].get_tile_at(tile_x, tile_y).building.name,
+                         building_shop.get_buildings_sold()[0].name)
+
+    def test_game_journal_ignores_incomplete_changes(self):
+        game_data: Game = Game(Player("JOURNAL"), item_shop, building_shop, Arena([]), minigames)
+        with tempfile.TemporaryDirectory() as save_directory:
+            file_name: str = os.path.join(save_directory, "GAME DATA")
+            journal: GameJournal = GameJournal(file_name)
+            journal.compact(game_data)
+            gold: BigValue = game_data.player_data.gold
+            journal.claim_reward(game_data, Reward(player_reward_gold=mpf("1e6")))
+            journal.claim_reward(game_data, Reward(player_reward_gold=mpf("1e6")))
+
+            # A crash while the second change is written leaves it incomplete
+            with open(journal.journal_file_name, "rb+") as journal_file:
+                journal_file.truncate(os.path.getsize(journal.journal_file_name) - 1)
+
+            self.assertEqual(GameJournal(file_name).load().player_data.gold, gold + BigValue(1e6))
+
+            # A journal written before the saved game data was compacted is not replayed again
+            journal.claim_reward(game_data, Reward(player_reward_gold=mpf("1e6")))
+            with open(journal.journal_file_name, "rb") as journal_file:
+                data: bytes = journal_file.read()
+
+            journal.compact(game_data)
+            with open(journal.journal_file_name, "wb") as journal_file:
+                journal_file.write(data)
+
+            self.assertEqual(GameJournal(file_name).load().player_data.gold, game_data.player_data.gold)
+
+    def test_game_journal_finds_runes_changed_outside_journal(self):
+        player_data: Player = Player("JOURNAL")
+        legendary_creature: LegendaryCreature = generate_random_legendary_creature("FLAME")
+        player_data.add_legendary_creature(legendary_creature)
+        rune1: Rune = create_rune_for_sale(1, 1, "ENERGY", "HP%")
+        rune2: Rune = create_rune_for_sale(1, 2, "FATAL", "ATK%")
+        rune3: Rune = create_rune_for_sale(1, 3, "SWIFT", "SPD")
+        for rune in [rune1, rune2, rune3]:
+            player_data.add_item_to_inventory(rune)
+        game_data: Game = Game(player_data, item_shop, building_shop, Arena([]), minigames)
+        with tempfile.TemporaryDirectory() as save_directory:
+            file_name: str = os.path.join(save_directory, "GAME DATA")
+            journal: GameJournal = GameJournal(file_name)
+            journal.compact(game_data)
+
+            # The item inventory changes without the change being written to the journal
+            self.assertTrue(player_data.sell_item(rune1))
+            self.assertTrue(journal.place_rune_on_legendary_creature(game_data, legendary_creature, rune2))
+            self.assertFalse(journal.sell_item(game_data, rune2))
+            self.assertTrue(journal.sell_item(game_data, rune3))
+            loaded_player_data: Player = GameJournal(file_name).load().player_data
+
+        loaded_legendary_creature: LegendaryCreature = \
+            loaded_player_data.legendary_creature_inventory.get_legendary_creatures()[0]
+        self.assertEqual(loaded_legendary_creature.get_runes()[2].name, rune2.name)
+        self.assertTrue(loaded_legendary_creature.get_runes()[2] in loaded_player_data.item_inventory.get_items())
+        self.assertFalse(1 in loaded_legendary_creature.get_runes().keys())
+        self.assertFalse(rune3.name in [item.name for item in loaded_player_data.item_inventory.get_items()])
+
+    def test_profile_store(self):
+        with tempfile.TemporaryDirectory() as save_directory:
+            file_name: str = os.path.join(save_directory, "PROFILES")
+            profile_store: ProfileStore = ProfileStore(file_name)
+            for i in range(3):
+                player_data: Player = Player("PLAYER #" + str(i + 1))
+                player_data.level = i + 1
+                player_data.gold = BigValue(10.0) ** (100 * (3 - i))
+                profile_store.save_game_data("PLAYER #" + str(i + 1), Game(player_data, item_shop, building_shop,
+                                                                           Arena([]), minigames))
+
+            # Another process reads the profile store while it is open
+            other_profile_store: ProfileStore = ProfileStore(file_name)
+            self.assertEqual(other_profile_store.get_profile_names(), ["PLAYER #1", "PLAYER #2", "PLAYER #3"])
+            self.assertEqual([player_summary.name for player_summary in other_profile_store.get_player_summaries()],
+                             ["PLAYER #3", "PLAYER #2", "PLAYER #1"])
+            player_summaries: list = other_profile_store.get_player_summaries("GOLD", 2)
+            self.assertEqual([player_summary.name for player_summary in player_summaries], ["PLAYER #1", "PLAYER #2"])
+            self.assertEqual(player_summaries[0].gold, BigValue(10.0) ** 300)
+            loaded_game_data: Game = other_profile_store.load_game_data_by_player_id(player_summaries[1].player_id)
+            self.assertEqual(loaded_game_data.player_data.name, "PLAYER #2")
+            self.assertTrue(loaded_game_data.item_shop is item_shop)
+            self.assertIsNone(other_profile_store.load_game_data("PLAYER #4"))
+            with self.assertRaises(ValueError):
+                other_profile_store.get_player_summaries("NAME")
+
+            # The autosave journal can keep the saved game data in the profile store
+            journal: GameJournal = GameJournal(os.path.join(save_directory, "PLAYER #1"), profile_store=profile_store,
+                                               profile_name="PLAYER #1")
+            game_data: Game = journal.load()
+            journal.claim_reward(game_data, Reward(player_reward_gold=mpf("1e6")))
+            journal.compact(game_data)
+            self.assertEqual(other_profile_store.load_game_data("PLAYER #1").player_data.gold,
+                             game_data.player_data.gold)
+            self.assertTrue(profile_store.remove_profile("PLAYER #1"))
+            self.assertEqual(other_profile_store.get_profile_names(), ["PLAYER #2", "PLAYER #3"])
+            profile_store.close()
+            other_profile_store.close()
+
+    @patch("legendary_creature_city_builder.input")
+    def test_profile_store_from_environment(self, mocked_input):
+        with tempfile.TemporaryDirectory() as save_directory:
+            file_name: str = os.path.join(save_directory, "PROFILES")
+            mocked_input.side_effect = ["profile player", "profile player", "N"]
+            with patch.dict(os.environ, {PROFILE_STORE_FILE_NAME_VARIABLE: file_name}):
+                self.assertEqual(main(), 0)
+
+            profile_store: ProfileStore = ProfileStore(file_name)
+            self.assertEqual([player_summary.name for player_summary in profile_store.get_player_summaries()],
+                             ["profile player"])
+            profile_store.close()
+            self.assertFalse(os.path.exists("SAVED LEGENDARY CREATURE CITY BUILDER GAME DATA - PROFILE PLAYER"))
+
     ################################################################################################################
     # Checking whether the number of saved data files is correct or not
     def test_number_of_files(self):
@@ -21,6 +21,9 @@ setup(
     long_description_content_type="text/markdown",
     include_package_data=True,
     install_requires=[],
+    extras_require={
+        "numpy": ["numpy"]
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.7"
@@ -28,6 +31,8 @@ setup(
     entry_points={
         "console_scripts": [
             "LEGENDARY_CREATURE_CITY_BUILDER=LEGENDARY_CREATURE_CITY_BUILDER.legendary_creature_city_builder:main",
+            "LEGENDARY_CREATURE_CITY_BUILDER_SIMULATE_BATTLES=LEGENDARY_CREATURE_CITY_BUILDER."
+            "legendary_creature_city_builder:simulate_battles_main",
         ]
     }
 )
\ No newline at end of file